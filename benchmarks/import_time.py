@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Report time spent importing modules on access to symbols exposed in thoth.common.
+
+Each symbol is accessed in a fresh interpreter run with ``-X importtime``, modules imported
+on the access are reported with their cumulative import time:
+
+    PYTHONPATH=. python3 benchmarks/import_time.py [--repeat 5] [--top 5] [SYMBOL ...]
+"""
+
+import argparse
+import subprocess
+import sys
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+def _measure(statement: str) -> List[Tuple[int, int, str]]:
+    """Run the given statement with -X importtime, return level, cumulative time [us] and name of modules imported."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+
+    # Lines are in form of "import time: <self [us]> | <cumulative [us]> | <imported package>", nested imports are
+    # indented by two spaces and reported before the module importing them.
+    result = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        result.append((level, int(cumulative), name.strip()))
+
+    return result
+
+
+def _access(symbol: str) -> Tuple[int, List[Tuple[int, str]]]:
+    """Measure access to the given symbol, return total time [us] and modules imported on access."""
+    imported = _measure(f"import thoth.common; thoth.common.{symbol}")
+
+    # Modules imported before thoth.common finished importing are not attributed to the symbol.
+    names = [name for _, _, name in imported]
+    start = names.index("thoth.common") + 1 if "thoth.common" in names else 0
+
+    top_level = [
+        (cumulative, name)
+        for level, cumulative, name in imported[start:]
+        if level == 0
+    ]
+    return sum(cumulative for cumulative, _ in top_level), top_level
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Report import time of symbols exposed in thoth.common."""
+    import thoth.common
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "symbols",
+        nargs="*",
+        metavar="SYMBOL",
+        help="symbols to measure, all symbols in thoth.common.__all__ if not given",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of measurements per symbol, the fastest one is reported",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="number of the slowest modules imported reported per symbol",
+    )
+    arguments = parser.parse_args(argv)
+
+    for symbol in arguments.symbols or thoth.common.__all__:
+        total, modules = min(
+            (_access(symbol) for _ in range(arguments.repeat)), key=lambda m: m[0]
+        )
+        print(f"{symbol:<32}{total / 1000:>10.1f} ms")
+        for cumulative, name in sorted(modules, reverse=True)[: arguments.top]:
+            print(f"    {name:<40}{cumulative / 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Compare time spent creating Workflows from dicts against deserialization done by the Argo ApiClient.
+
+Workflows are loaded from the given files (the adviser Workflow used in tests by default), templates of each
+Workflow are multiplied to simulate large Workflows:
+
+    PYTHONPATH=. python3 benchmarks/workflow_deserialization.py [--templates 20] [--repeat 5] [FILE ...]
+"""
+
+import argparse
+import copy
+import json
+import timeit
+
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import yaml
+
+from argo.workflows import client
+from argo.workflows import models
+
+_DEFAULT_WORKFLOW_FILE = Path(__file__).resolve().parent.parent / "tests" / "data" / "workflows" / "adviser.yaml"
+
+
+def _deserialize_api_client(api_client: client.ApiClient, obj: Dict[str, Any]) -> models.V1alpha1Workflow:
+    """Deserialize a Workflow using ApiClient, going through JSON as responses from master do."""
+    response = type("Response", (), {"data": json.dumps(obj)})
+    return api_client.deserialize(response, models.V1alpha1Workflow)
+
+
+def _enlarge(obj: Dict[str, Any], templates: int) -> Dict[str, Any]:
+    """Multiply templates of the given Workflow, names of templates are kept unique."""
+    obj = copy.deepcopy(obj)
+    obj["spec"]["templates"] = [
+        {**template, "name": f"{template['name']}-{idx}"}
+        for idx in range(templates)
+        for template in obj["spec"]["templates"]
+    ]
+    return obj
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Report time spent creating Workflows from dicts and by ApiClient."""
+    from thoth.common import Workflow
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        type=Path,
+        help=f"Workflow specs in YAML or JSON, {_DEFAULT_WORKFLOW_FILE.name} from test data if not given",
+    )
+    parser.add_argument(
+        "--templates",
+        type=int,
+        default=20,
+        help="number of times templates of each Workflow are multiplied, 1 keeps Workflows as they are",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of measurements per Workflow, the fastest one is reported",
+    )
+    arguments = parser.parse_args(argv)
+
+    api_client = client.ApiClient()
+    for path in arguments.files or [_DEFAULT_WORKFLOW_FILE]:
+        obj = _enlarge(yaml.safe_load(path.read_text()), arguments.templates)
+
+        api_client_time = min(
+            timeit.repeat(lambda: _deserialize_api_client(api_client, obj), number=1, repeat=arguments.repeat)
+        )
+        # Workflow.from_dict modifies the dict passed, copies are made upfront to not be measured.
+        copies = [copy.deepcopy(obj) for _ in range(arguments.repeat)]
+        from_dict_time = min(timeit.repeat(lambda: Workflow.from_dict(copies.pop()), number=1, repeat=arguments.repeat))
+
+        print(f"{path.name} ({len(obj['spec']['templates'])} templates)")
+        print(f"    {'ApiClient':<24}{api_client_time * 1000:>10.1f} ms")
+        print(f"    {'Workflow.from_dict':<24}{from_dict_time * 1000:>10.1f} ms")
+        print(f"    {'speedup':<24}{api_client_time / from_dict_time:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -97,6 +97,7 @@ setup(
     zip_safe=False,
     cmdclass={"test": Test},
     install_requires=_get_install_requires(),
+    extras_require={"async": ["aiohttp"], "numpy": ["numpy"]},
     command_options={
         "build_sphinx": {
             "version": ("setup.py", VERSION),
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test admission control of Workflows submitted."""
+
+import threading
+import time
+
+from typing import List
+
+import pytest
+from flexmock import flexmock
+
+from thoth.common import WorkflowManager
+from thoth.common.admission import AdmissionController
+from thoth.common.exceptions import ConfigurationError
+from thoth.common.exceptions import WorkflowLimitExceeded
+
+from .base_test import CommonTestCase
+
+
+class TestAdmissionController(CommonTestCase):
+    """Test admission of Workflows respecting limit of active Workflows."""
+
+    def test_reject(self) -> None:
+        """Test Workflows are admitted until the limit is reached, accounting Workflows admitted locally."""
+        counted: List[str] = []
+        controller = AdmissionController(
+            lambda namespace: counted.append(namespace) or 1,  # type: ignore
+            policy="reject",
+            refresh_interval=60,
+        )
+
+        controller.admit("thoth", 3)
+        controller.admit("thoth", 3)
+        with pytest.raises(WorkflowLimitExceeded):
+            controller.admit("thoth", 3)
+
+        controller.admit("thoth-middletier", 3)
+        assert counted == ["thoth", "thoth-middletier"]
+        assert controller.active("thoth") == 3
+        assert controller.rejected == 1
+
+    def test_block_timeout(self) -> None:
+        """Test a blocked Workflow is admitted once active Workflows finish, or rejected after timeout."""
+        active = [2]
+        controller = AdmissionController(
+            lambda namespace: active[0], policy="block", refresh_interval=0.01
+        )
+
+        with pytest.raises(WorkflowLimitExceeded):
+            controller.admit("thoth", 2, timeout=0.05)
+
+        timer = threading.Timer(0.05, lambda: active.__setitem__(0, 0))
+        timer.start()
+        start = time.monotonic()
+        controller.admit("thoth", 2, timeout=5)
+        timer.join()
+        assert time.monotonic() - start >= 0.05
+
+    def test_queue_order(self) -> None:
+        """Test queued Workflows are admitted in the order they arrived."""
+        freed = [0]
+
+        def count_active(namespace: str) -> int:
+            # Each slot freed is observed by exactly one counting.
+            if freed[0]:
+                freed[0] -= 1
+                return 0
+            return 1
+
+        controller = AdmissionController(
+            count_active, policy="queue", refresh_interval=0.01
+        )
+        admitted: List[int] = []
+
+        def admit(idx: int) -> None:
+            controller.admit("thoth", 1, timeout=5)
+            admitted.append(idx)
+
+        threads = [threading.Thread(target=admit, args=(idx,)) for idx in range(3)]
+        for idx, thread in enumerate(threads):
+            thread.start()
+            while len(controller._queues.get("thoth", ())) <= idx:
+                time.sleep(0.001)
+
+        for idx in range(3):
+            freed[0] += 1
+            while len(admitted) <= idx:
+                time.sleep(0.001)
+
+        for thread in threads:
+            thread.join(5)
+
+        assert admitted == [0, 1, 2]
+
+    def test_count_without_lock(self) -> None:
+        """Test active Workflows are counted on master without blocking admission to other namespaces."""
+        counting = threading.Event()
+        proceed = threading.Event()
+
+        def count_active(namespace: str) -> int:
+            if namespace == "thoth":
+                counting.set()
+                assert proceed.wait(5)
+            return 0
+
+        controller = AdmissionController(count_active, refresh_interval=60)
+        thread = threading.Thread(target=controller.admit, args=("thoth", 1))
+        thread.start()
+        assert counting.wait(5)
+
+        controller.admit("thoth-middletier", 1)
+        proceed.set()
+        thread.join(5)
+        assert controller.active("thoth") == 1
+        assert controller.active("thoth-middletier") == 1
+
+    def test_admitted_release(self) -> None:
+        """Test a Workflow admitted is released if its submission fails."""
+        controller = AdmissionController(
+            lambda namespace: 0, policy="reject", refresh_interval=60
+        )
+
+        with pytest.raises(ValueError):
+            with controller.admitted("thoth", 1):
+                raise ValueError
+
+        assert controller.active("thoth") == 0
+        with controller.admitted("thoth", 1):
+            pass
+
+        assert controller.active("thoth") == 1
+        with pytest.raises(WorkflowLimitExceeded):
+            with controller.admitted("thoth", 1):
+                pass
+
+        with controller.admitted("thoth", None):
+            pass
+
+        controller.release("thoth")
+        assert controller.active("thoth") == 0
+
+    def test_unknown_policy(self) -> None:
+        """Test an unknown policy is reported."""
+        with pytest.raises(ConfigurationError):
+            AdmissionController(lambda namespace: 0, policy="drop")
+
+    def test_get_active_workflows(self) -> None:
+        """Test pending and running Workflows are counted from Table rows, with a fallback to full objects."""
+        manager = WorkflowManager.__new__(WorkflowManager)
+        manager.openshift = flexmock()
+        manager.openshift.should_receive("get_workflow_informer").and_return(None)
+        manager.openshift.should_receive("iter_table").and_return(
+            iter([{"Status": "Running"}, {"Status": None}, {"Status": "Succeeded"}])
+        ).and_return(None)
+        manager.openshift.should_receive("iter_workflows").with_args(
+            namespace="thoth"
+        ).and_return(
+            iter(
+                [{"status": {"phase": "Failed"}}, {"status": {"phase": "Pending"}}, {}]
+            )
+        )
+
+        assert manager.get_active_workflows("thoth") == 2
+        assert manager.get_active_workflows("thoth") == 2
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test asynchronous interaction with OpenShift master."""
+
+import asyncio
+import sys
+
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import TypeVar
+
+import pytest
+
+from thoth.common.exceptions import NotFoundException
+from thoth.common.openshift import OpenShift
+
+from .base_test import CommonTestCase
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+
+from thoth.common.async_openshift import AsyncOpenShift  # noqa: E402
+
+_T = TypeVar("_T")
+
+_RUNNING_STATE = {"running": {"startedAt": "2020-10-01T10:00:00Z"}}
+
+
+def _pod(name: str) -> Dict[str, Any]:
+    return {
+        "metadata": {"name": name},
+        "status": {"containerStatuses": [{"state": _RUNNING_STATE}]},
+    }
+
+
+class TestAsyncOpenShift(CommonTestCase):
+    """Test asynchronous OpenShift client against a fake master."""
+
+    _NAMESPACE = "thoth-middletier"
+
+    @staticmethod
+    def _openshift(url: str) -> OpenShift:
+        """Create OpenShift instance with configuration pointing to the fake master, without contacting it."""
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.openshift_api_url = url
+        openshift.kubernetes_verify_tls = False
+        openshift.http_keep_alive = True
+        openshift.http_retries = 0
+        openshift.middletier_namespace = TestAsyncOpenShift._NAMESPACE
+        openshift.infra_namespace = TestAsyncOpenShift._NAMESPACE
+        openshift._token = "token"
+        return openshift
+
+    def _run(self, test: Callable[[AsyncOpenShift], Awaitable[_T]]) -> _T:
+        """Run the given test coroutine with a client talking to a fake master."""
+        namespace = self._NAMESPACE
+
+        async def handle(request: Any) -> Any:
+            assert request.headers["Authorization"] == "Bearer token"
+            path = request.path
+            if path == f"/api/v1/namespaces/{namespace}/pods/pod-1":
+                return web.json_response(_pod("pod-1"))
+            if path == f"/api/v1/namespaces/{namespace}/pods/pod-1/log":
+                return web.Response(text="log line\n")
+            if path == f"/api/v1/namespaces/{namespace}/pods":
+                assert request.query["labelSelector"] == "job-name=job-1"
+                return web.json_response({"items": [_pod("pod-1"), _pod("pod-2")]})
+            if path == f"/apis/batch/v1/namespaces/{namespace}/jobs/job-1":
+                return web.json_response(
+                    {
+                        "spec": {"completions": 2},
+                        "status": {"startTime": "2020-10-01T10:00:00Z", "active": 2},
+                    }
+                )
+            if (
+                path
+                == f"/apis/argoproj.io/v1alpha1/namespaces/{namespace}/workflows/wf-1"
+            ):
+                return web.json_response(
+                    {
+                        "status": {
+                            "phase": "Running",
+                            "startedAt": "2020-10-01T10:00:00Z",
+                        }
+                    }
+                )
+            return web.json_response({"message": "not found"}, status=404)
+
+        async def main() -> _T:
+            app = web.Application()
+            app.router.add_route("GET", "/{tail:.*}", handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]  # type: ignore
+            try:
+                async with AsyncOpenShift(
+                    self._openshift(f"http://127.0.0.1:{port}"), max_concurrency=2
+                ) as client:
+                    return await test(client)
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(main())
+
+    def test_get_pod_status_report(self) -> None:
+        """Test obtaining pod status report."""
+
+        async def test(client: AsyncOpenShift) -> None:
+            report = await client.get_pod_status_report("pod-1", self._NAMESPACE)
+            assert report["state"] == "running"
+            assert report["started_at"] == "2020-10-01T10:00:00Z"
+
+            with pytest.raises(NotFoundException):
+                await client.get_pod_status("pod-2", self._NAMESPACE)
+
+        self._run(test)
+
+    def test_get_pod_log(self) -> None:
+        """Test obtaining pod logs, the default namespace is used."""
+
+        async def test(client: AsyncOpenShift) -> None:
+            assert await client.get_pod_log("pod-1") == "log line\n"
+
+        self._run(test)
+
+    def test_get_job_status_report(self) -> None:
+        """Test obtaining job status report including status of pods."""
+
+        async def test(client: AsyncOpenShift) -> None:
+            report = await client.get_job_status_report("job-1", self._NAMESPACE)
+            assert report["started_at"] == "2020-10-01T10:00:00Z"
+            assert report["completions"] == 2
+            assert [pod["state"] for pod in report["pods"]] == ["running", "running"]
+
+        self._run(test)
+
+    def test_concurrent_workflow_status_reports(self) -> None:
+        """Test concurrent status polls share the client."""
+
+        async def test(client: AsyncOpenShift) -> None:
+            reports = await asyncio.gather(
+                *(
+                    client.get_workflow_status_report("wf-1", namespace=self._NAMESPACE)
+                    for _ in range(10)
+                )
+            )
+            assert all(report["state"] == "running" for report in reports)
+
+            with pytest.raises(NotFoundException):
+                await client.get_workflow_status_report("wf-2")
+
+        self._run(test)
+
+    def test_missing_aiohttp(self, monkeypatch: Any) -> None:
+        """Test the extra providing aiohttp is named if aiohttp is not installed."""
+        monkeypatch.setitem(sys.modules, "aiohttp", None)
+
+        with pytest.raises(ImportError, match=r"thoth-common\[async\]"):
+            AsyncOpenShift(self._openshift("https://master"))
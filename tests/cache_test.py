@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test caches for objects obtained from master."""
+
+import gzip
+import json
+import os
+
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import pytest
+
+from thoth.common.cache import LogCache
+from thoth.common.cache import ResourceCache
+from thoth.common.cache import WorkflowCache
+from thoth.common.cache import WorkflowNodeIndex
+
+from .base_test import CommonTestCase
+
+
+class TestResourceCache(CommonTestCase):
+    """Test resource cache with TTL and resourceVersion based revalidation."""
+
+    _KEY = ("Template", "thoth-infra", "template=solver")
+
+    @staticmethod
+    def _template(resource_version: str) -> Dict[str, Any]:
+        return {
+            "metadata": {"name": "solver", "resourceVersion": resource_version},
+            "parameters": [],
+        }
+
+    def test_hit_returns_copy(self) -> None:
+        """Test cached objects are handed out as deep copies."""
+        cache = ResourceCache(ttl=3600)
+        fetched: List[int] = []
+
+        def fetch() -> Dict[str, Any]:
+            fetched.append(1)
+            return self._template("1")
+
+        first = cache.get(self._KEY, fetch=fetch, revalidate=lambda: [])
+        first["parameters"].append({"name": "FOO"})
+        second = cache.get(self._KEY, fetch=fetch, revalidate=lambda: [])
+
+        assert len(fetched) == 1
+        assert second == self._template("1")
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_revalidate(self) -> None:
+        """Test expired objects are revalidated based on resource version."""
+        cache = ResourceCache(ttl=0)
+        resource_version = "1"
+        versions: List[Tuple[str, str]] = [("solver", "1")]
+
+        def fetch() -> Dict[str, Any]:
+            return self._template(resource_version)
+
+        cache.get(self._KEY, fetch=fetch, revalidate=lambda: versions)
+        assert cache.get(self._KEY, fetch=fetch, revalidate=lambda: versions) == fetch()
+        assert cache.revalidations == 1
+        assert cache.misses == 1
+
+        resource_version = "2"
+        versions = [("solver", "2")]
+        assert cache.get(self._KEY, fetch=fetch, revalidate=lambda: versions) == fetch()
+        assert cache.misses == 2
+
+    def test_invalidate(self) -> None:
+        """Test explicit invalidation of cached objects."""
+        cache = ResourceCache(ttl=3600)
+        cache.get(self._KEY, fetch=lambda: self._template("1"), revalidate=lambda: [])
+        cache.get(
+            ("CronJob", "thoth-frontend", "component=graph-refresh"),
+            fetch=lambda: self._template("1"),
+            revalidate=lambda: [],
+        )
+
+        assert cache.invalidate(kind="CronJob") == 1
+        assert len(cache) == 1
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+
+class TestLogCache(CommonTestCase):
+    """Test on-disk cache of logs."""
+
+    @staticmethod
+    def _key(name: str) -> Tuple[str, str, str, str]:
+        return ("pod", "thoth-middletier", name, "main")
+
+    def test_get_put(self, tmp_path: Path) -> None:
+        """Test logs are stored compressed and hits and misses are counted."""
+        cache = LogCache(str(tmp_path), max_size=1024 * 1024)
+        log = "Resolving tensorflow==2.3.0 ✓\n" * 1000
+
+        assert cache.get(self._key("pod-1")) is None
+        cache.put(self._key("pod-1"), log)
+        assert cache.get(self._key("pod-1")) == log
+        assert cache.get(self._key("pod-2")) is None
+
+        (stored,) = tmp_path.iterdir()
+        assert gzip.decompress(stored.read_bytes()).decode() == log
+        assert cache.size == stored.stat().st_size < len(log)
+        assert cache.metrics() == {
+            "hits": 1,
+            "misses": 2,
+            "evictions": 0,
+            "entries": 1,
+            "size": cache.size,
+        }
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test least recently used logs are evicted once the size limit is exceeded."""
+        logs = {f"pod-{i}": os.urandom(300).hex() for i in range(3)}
+        sizes = {name: len(gzip.compress(log.encode())) for name, log in logs.items()}
+        cache = LogCache(str(tmp_path), max_size=sizes["pod-0"] + sizes["pod-1"])
+
+        cache.put(self._key("pod-0"), logs["pod-0"])
+        cache.put(self._key("pod-1"), logs["pod-1"])
+        assert cache.get(self._key("pod-0")) == logs["pod-0"]
+        cache.put(self._key("pod-2"), logs["pod-2"])
+
+        assert cache.evictions >= 1
+        assert cache.get(self._key("pod-1")) is None
+        assert cache.get(self._key("pod-2")) == logs["pod-2"]
+        assert len(list(tmp_path.iterdir())) == len(cache)
+
+    def test_shared_directory(self, tmp_path: Path) -> None:
+        """Test the size limit is kept when the directory is shared by multiple caches."""
+        logs = {f"pod-{i}": os.urandom(300).hex() for i in range(3)}
+        sizes = {name: len(gzip.compress(log.encode())) for name, log in logs.items()}
+        max_size = sizes["pod-0"] + sizes["pod-1"]
+        first = LogCache(str(tmp_path), max_size=max_size)
+        second = LogCache(str(tmp_path), max_size=max_size)
+
+        first.put(self._key("pod-0"), logs["pod-0"])
+        second.put(self._key("pod-1"), logs["pod-1"])
+        first.put(self._key("pod-2"), logs["pod-2"])
+
+        assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= max_size
+        assert first.get(self._key("pod-2")) == logs["pod-2"]
+        assert second.get(self._key("pod-2")) == logs["pod-2"]
+
+    def test_restore(self, tmp_path: Path) -> None:
+        """Test logs stored survive restarts, unreadable entries are dropped."""
+        LogCache(str(tmp_path), max_size=1024).put(self._key("pod-1"), "log")
+        LogCache(str(tmp_path), max_size=1024).put(self._key("pod-2"), "log")
+
+        cache = LogCache(str(tmp_path), max_size=1024)
+        assert len(cache) == 2
+        assert cache.get(self._key("pod-1")) == "log"
+
+        for path in tmp_path.iterdir():
+            path.write_bytes(b"not compressed")
+        assert cache.get(self._key("pod-2")) is None
+        assert len(cache) == 1
+
+
+class TestWorkflowCache(CommonTestCase):
+    """Test in-memory cache of Workflows which finished."""
+
+    @staticmethod
+    def _workflow(name: str, uid: str, phase: str) -> Dict[str, Any]:
+        return {
+            "metadata": {"name": name, "uid": uid},
+            "status": {"phase": phase, "nodes": {}},
+        }
+
+    def test_finished_only(self) -> None:
+        """Test only Workflows which finished are cached, copies are handed out."""
+        cache = WorkflowCache(max_size=1024 * 1024)
+        cache.put("raw", "thoth", self._workflow("wf-1", "uid-1", "Running"))
+        assert cache.get("raw", "thoth", "wf-1") is None
+
+        cache.put("raw", "thoth", self._workflow("wf-1", "uid-1", "Succeeded"))
+        cached = cache.get("raw", "thoth", "wf-1")
+        assert cached == self._workflow("wf-1", "uid-1", "Succeeded")
+        cached["status"]["nodes"]["wf-1"] = {}  # type: ignore
+        assert cache.get("raw", "thoth", "wf-1") == self._workflow(
+            "wf-1", "uid-1", "Succeeded"
+        )
+        assert cache.get("model", "thoth", "wf-1") is None
+        assert cache.metrics()["hits"] == 2
+        assert cache.metrics()["misses"] == 2
+
+    def test_invalidate(self) -> None:
+        """Test Workflows re-created with a new uid or deleted are dropped in all representations."""
+        cache = WorkflowCache(max_size=1024 * 1024)
+        for representation in ("raw", "model"):
+            cache.put(
+                representation, "thoth", self._workflow("wf-1", "uid-1", "Failed")
+            )
+        cache.put("raw", "thoth", self._workflow("wf-2", "uid-2", "Error"))
+
+        cache.observe("thoth", self._workflow("wf-1", "uid-1", "Failed"))
+        assert len(cache) == 3
+
+        cache.observe("thoth", self._workflow("wf-1", "uid-3", "Running"))
+        assert cache.get("raw", "thoth", "wf-1") is None
+        assert cache.get("model", "thoth", "wf-1") is None
+
+        assert cache.invalidate("thoth", "wf-2") == 1
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_memory_budget(self) -> None:
+        """Test least recently used Workflows are evicted once the memory budget is exceeded."""
+        size = len(json.dumps(self._workflow("wf-0", "uid-0", "Succeeded")))
+        cache = WorkflowCache(max_size=2 * size)
+        for idx in range(3):
+            if idx == 2:
+                assert cache.get("raw", "thoth", "wf-0") is not None
+            cache.put(
+                "raw", "thoth", self._workflow(f"wf-{idx}", f"uid-{idx}", "Succeeded")
+            )
+
+        assert cache.evictions == 1
+        assert cache.get("raw", "thoth", "wf-1") is None
+        assert cache.get("raw", "thoth", "wf-0") is not None
+
+
+class TestWorkflowNodeIndex(CommonTestCase):
+    """Test index of Workflow nodes."""
+
+    def test_find(self) -> None:
+        """Test nodes are found by their attributes, in the order stated in the Workflow."""
+        index = WorkflowNodeIndex(
+            {
+                "metadata": {"uid": "uid-1", "resourceVersion": "42"},
+                "status": {
+                    "nodes": {
+                        "wf-1-1": {
+                            "displayName": "solve",
+                            "templateName": "solver",
+                            "boundaryID": "wf-1",
+                            "phase": "Succeeded",
+                        },
+                        "wf-1-2": {
+                            "displayName": "solve",
+                            "templateName": "solver",
+                            "boundaryID": "wf-1",
+                            "phase": "Failed",
+                        },
+                        "wf-1-3": {"displayName": "sync", "phase": "Failed"},
+                    }
+                },
+            }
+        )
+
+        assert index.uid == "uid-1"
+        assert index.resource_version == "42"
+        assert index.by_display_name["solve"] == ["wf-1-1", "wf-1-2"]
+        assert index.find(template_name="solver", phase="Failed") == ["wf-1-2"]
+        assert index.find(phase="Failed") == ["wf-1-2", "wf-1-3"]
+        assert index.find(display_name="report") == []
+
+        with pytest.raises(ValueError):
+            index.find()
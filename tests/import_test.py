@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test importing thoth-common does not import heavy dependencies unless needed."""
+
+import subprocess
+import sys
+
+import pytest
+
+from .base_test import CommonTestCase
+
+
+class TestImport(CommonTestCase):
+    """Test lazy imports of symbols exposed in thoth.common."""
+
+    _HEAVY_MODULES = (
+        "argo",
+        "attrdict",
+        "daiquiri",
+        "kubernetes",
+        "openshift",
+        "requests",
+        "sentry_sdk",
+        "urllib3",
+        "yaml",
+    )
+
+    @staticmethod
+    def _imported_modules(statement: str) -> str:
+        """Run the given import statement in a fresh interpreter and report top-level modules imported."""
+        return subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                f"{statement}; import sys; print(' '.join(sys.modules))",
+            ],
+            universal_newlines=True,
+        )
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import thoth.common",
+            "from thoth.common import parse_datetime, RuntimeEnvironment, init_logging",
+        ],
+    )
+    def test_no_heavy_imports(self, statement: str) -> None:
+        """Test heavy dependencies are not imported on light-weight imports."""
+        modules = set(self._imported_modules(statement).split())
+        assert not modules.intersection(self._HEAVY_MODULES)
+
+    def test_import_time(self) -> None:
+        """Test heavy dependencies do not show up in import time measurement of thoth.common."""
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import thoth.common"],
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stderr
+
+        # Lines are in form of "import time: <self [us]> | <cumulative [us]> | <imported package>".
+        cumulative = {}
+        for line in output.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+
+            _, time_cumulative, name = line.split("|")
+            cumulative[name.strip()] = int(time_cumulative)
+
+        assert "thoth.common" in cumulative
+        assert not {name.split(".")[0] for name in cumulative}.intersection(
+            ("kubernetes", "openshift", "sentry_sdk")
+        )
+
+    def test_lazy_attribute(self) -> None:
+        """Test symbols are still accessible and listed in the module."""
+        import thoth.common
+
+        assert thoth.common.OpenShift.__module__ == "thoth.common.openshift"
+        assert "WorkflowManager" in dir(thoth.common)
+        assert set(thoth.common.__all__) <= set(dir(thoth.common))
+
+        with pytest.raises(AttributeError):
+            thoth.common.NonExistingSymbol  # noqa: B018
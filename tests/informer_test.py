@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test informers keeping objects in memory using list and watch."""
+
+import io
+import json
+import threading
+import time
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+import requests
+from flexmock import flexmock
+
+from thoth.common.informer import Informer
+from thoth.common.informer import match_label_selector
+from thoth.common.openshift import OpenShift
+
+from .base_test import CommonTestCase
+
+
+def _workflow(
+    name: str, resource_version: str, phase: Optional[str] = None
+) -> Dict[str, Any]:
+    """Construct a Workflow as sent by master."""
+    workflow: Dict[str, Any] = {
+        "metadata": {
+            "name": name,
+            "resourceVersion": resource_version,
+            "labels": {"component": "adviser", "workflow": name},
+        }
+    }
+    if phase:
+        workflow["status"] = {"phase": phase, "startedAt": "2020-10-01T10:00:00Z"}
+    return workflow
+
+
+def _response(status_code: int, content: bytes) -> requests.Response:
+    """Construct a response as returned by master."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def _watch_response(*events: Dict[str, Any]) -> requests.Response:
+    """Construct a watch response carrying the given events."""
+    return _response(200, b"".join(json.dumps(e).encode() + b"\n" for e in events))
+
+
+class _FakeMaster:
+    """Serve prepared responses in order, block once all of them were served."""
+
+    openshift_api_url = "https://master"
+
+    def __init__(self, *responses: requests.Response) -> None:
+        self.responses = list(responses)
+        self.requests: List[Dict[str, Any]] = []
+
+    def _http_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        self.requests.append({"url": url, **kwargs})
+        if self.responses:
+            return self.responses.pop(0)
+
+        time.sleep(0.05)
+        raise requests.exceptions.ConnectionError("No more responses")
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    """Wait for the given condition to become true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not met in time"
+        time.sleep(0.01)
+
+
+class TestInformer(CommonTestCase):
+    """Test informers."""
+
+    _PATH = "/apis/argoproj.io/v1alpha1/namespaces/thoth/workflows"
+
+    def test_list_watch_relist(self) -> None:
+        """Test objects are listed, watched from resource version listed and listed again on 410 Gone."""
+        master = _FakeMaster(
+            _response(
+                200,
+                json.dumps(
+                    {
+                        "metadata": {"resourceVersion": "10"},
+                        "items": [_workflow("wf-1", "9")],
+                    }
+                ).encode(),
+            ),
+            _watch_response(
+                {"type": "ADDED", "object": _workflow("wf-2", "11")},
+                {"type": "MODIFIED", "object": _workflow("wf-1", "12", "Running")},
+                {"type": "DELETED", "object": _workflow("wf-2", "13")},
+                {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "14"}}},
+                {"type": "ERROR", "object": {"code": 410, "message": "too old"}},
+            ),
+            _response(
+                200,
+                json.dumps(
+                    {
+                        "metadata": {"resourceVersion": "20"},
+                        "items": [
+                            _workflow("wf-1", "12", "Running"),
+                            _workflow("wf-3", "19"),
+                        ],
+                    }
+                ).encode(),
+            ),
+        )
+
+        informer = Informer(master, self._PATH, retry_backoff=0.01)  # type: ignore
+        informer.start()
+        try:
+            assert informer.wait_for_sync(timeout=5)
+            _wait_for(
+                lambda: informer.watch_errors > 0 and informer.resource_version == "20"
+            )
+
+            assert master.requests[1]["params"]["resourceVersion"] == "10"
+            assert master.requests[1]["stream"] is True
+            assert master.requests[3]["params"]["resourceVersion"] == "20"
+
+            assert informer.relists == 1
+            assert informer.events_processed == 3
+            assert informer.resource_version == "20"
+            assert sorted(wf["metadata"]["name"] for wf in informer.list()) == [
+                "wf-1",
+                "wf-3",
+            ]
+            assert informer.get("wf-2") is None
+            assert informer.get("wf-1")["status"]["phase"] == "Running"  # type: ignore
+
+            metrics = informer.metrics()
+            assert metrics["synced"] is True
+            assert metrics["objects"] == 2
+            assert metrics["staleness"] is not None
+        finally:
+            informer.stop(timeout=5)
+
+        assert not informer.synced
+
+    def test_workflow_status_report(self) -> None:
+        """Test workflow status reports are served from the informer once enabled."""
+        master = _FakeMaster(
+            _response(
+                200,
+                json.dumps(
+                    {
+                        "metadata": {"resourceVersion": "10"},
+                        "items": [_workflow("wf-1", "9", "Succeeded")],
+                    }
+                ).encode(),
+            )
+        )
+
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.openshift_api_url = master.openshift_api_url
+        openshift.infra_namespace = "thoth"
+        openshift.workflow_informer = True
+        openshift.informer_sync_timeout = 5
+        openshift._informers = {}
+        openshift._informers_lock = threading.Lock()
+        openshift.workflow_cache = None
+        openshift._http_request = master._http_request  # type: ignore
+        openshift._http_session = None
+        openshift._http_session_lock = threading.Lock()
+
+        try:
+            report = openshift.get_workflow_status_report("wf-1")
+            assert report["state"] == "succeeded"
+            assert report["started_at"] == "2020-10-01T10:00:00Z"
+            assert (
+                openshift.get_workflow(label_selector="workflow=wf-1")["metadata"][
+                    "name"
+                ]
+                == "wf-1"
+            )
+            assert list(openshift.informer_metrics()) == ["Workflow/thoth"]
+        finally:
+            openshift.close()
+
+        assert master.requests[0]["url"] == f"https://master{self._PATH}"
+
+    def test_index_and_counter(self) -> None:
+        """Test indexes and counters are maintained on each event."""
+        informer = Informer(_FakeMaster(), "/api/v1/namespaces/thoth/pods")  # type: ignore
+
+        def pod(name: str, job_name: str, phase: str) -> Dict[str, Any]:
+            return {
+                "metadata": {"name": name, "labels": {"job-name": job_name}},
+                "status": {"phase": phase},
+            }
+
+        informer._on_replace(
+            {
+                "job-1-a": pod("job-1-a", "job-1", "Running"),
+                "job-2-a": pod("job-2-a", "job-2", "Running"),
+            }
+        )
+        informer.add_index(
+            "job-name", lambda obj: [obj["metadata"]["labels"]["job-name"]]
+        )
+        informer.add_counter(
+            "job-1", lambda obj: [obj["status"]["phase"]], "job-name=job-1"
+        )
+        assert informer.get_counter("job-1") == {"Running": 1}
+
+        informer._on_event("ADDED", pod("job-1-b", "job-1", "Pending"))
+        informer._on_event("MODIFIED", pod("job-1-a", "job-1", "Succeeded"))
+        informer._on_event("DELETED", pod("job-2-a", "job-2", "Running"))
+
+        assert sorted(
+            p["metadata"]["name"] for p in informer.by_index("job-name", "job-1")
+        ) == ["job-1-a", "job-1-b"]
+        assert informer.by_index("job-name", "job-2") == []
+        assert informer.get_counter("job-1") == {
+            "Running": 0,
+            "Pending": 1,
+            "Succeeded": 1,
+        }
+
+    def test_listener(self) -> None:
+        """Test listeners are notified about changes, including objects gone when listed again."""
+        informer = Informer(_FakeMaster(), self._PATH)  # type: ignore
+        informer._on_replace({"wf-1": _workflow("wf-1", "1")})
+        events: List[Any] = []
+        informer.add_listener(
+            lambda event_type, obj: events.append((event_type, obj["metadata"]["name"]))
+        )
+
+        informer._on_event("ADDED", _workflow("wf-2", "2"))
+        informer._on_event("DELETED", _workflow("wf-1", "3"))
+        informer._on_replace({"wf-3": _workflow("wf-3", "4")})
+
+        assert events == [
+            ("ADDED", "wf-2"),
+            ("DELETED", "wf-1"),
+            ("DELETED", "wf-2"),
+            ("MODIFIED", "wf-3"),
+        ]
+
+    def test_job_status_count(self) -> None:
+        """Test counting Jobs is served from the Job informer once enabled."""
+        informer = Informer(_FakeMaster(), "/apis/batch/v1/namespaces/thoth/jobs")  # type: ignore
+        informer._on_replace(
+            {
+                f"job-{i}": {
+                    "metadata": {"name": f"job-{i}", "labels": {"component": "solver"}},
+                    "status": status,
+                }
+                for i, status in enumerate(
+                    [{"succeeded": 1}, {"active": 1}, {"active": 1}, {}]
+                )
+            }
+        )
+
+        openshift = OpenShift.__new__(OpenShift)
+        flexmock(openshift).should_receive("_get_job_informer").with_args(
+            "thoth"
+        ).and_return(informer)
+        flexmock(openshift).should_receive("get_jobs").never()
+
+        count = openshift.get_job_status_count("component=solver", "thoth")
+        assert count["created"] == 4
+        assert count["active"] == 2
+        assert count["succeeded"] == 1
+        assert count["waiting"] == 1
+        assert count["failed"] == 0
+
+        informer._on_event(
+            "MODIFIED",
+            {
+                "metadata": {"name": "job-1", "labels": {"component": "solver"}},
+                "status": {"failed": 1},
+            },
+        )
+        count = openshift.get_job_status_count("component=solver", "thoth")
+        assert count["active"] == 1
+        assert count["failed"] == 1
+
+    def test_job_status_count_set_based(self) -> None:
+        """Test Jobs are counted in a paged listing if the label selector cannot be matched by the informer."""
+        informer = Informer(_FakeMaster(), "/apis/batch/v1/namespaces/thoth/jobs")  # type: ignore
+        label_selector = "component in (solver,adviser)"
+
+        openshift = OpenShift.__new__(OpenShift)
+        flexmock(openshift).should_receive("_get_job_informer").with_args(
+            "thoth"
+        ).and_return(informer)
+        flexmock(openshift).should_receive("iter_jobs").with_args(
+            label_selector=label_selector, namespace="thoth"
+        ).and_return(iter([{"status": {"succeeded": 1}}, {"status": {}}])).once()
+
+        count = openshift.get_job_status_count(label_selector, "thoth")
+        assert count["created"] == 2
+        assert count["succeeded"] == 1
+        assert count["waiting"] == 1
+        with pytest.raises(KeyError):
+            informer.get_counter(label_selector)
+
+    def test_requested_resources_set_based(self) -> None:
+        """Test pods are listed from master if the label selector cannot be matched by the informer."""
+        informer = Informer(_FakeMaster(), "/api/v1/namespaces/thoth/pods")  # type: ignore
+        label_selector = "component in (solver,adviser)"
+        pod = {
+            "metadata": {"name": "pod-1", "labels": {"component": "solver"}},
+            "spec": {"containers": [{"resources": {"requests": {"cpu": "500m"}}}]},
+            "status": {"phase": "Running"},
+        }
+
+        openshift = OpenShift.__new__(OpenShift)
+        flexmock(openshift).should_receive("_get_pod_informer").with_args(
+            "thoth"
+        ).and_return(informer)
+        flexmock(openshift).should_receive("iter_pods").with_args(
+            "thoth",
+            label_selector=label_selector,
+            field_selector="status.phase!=Succeeded,status.phase!=Failed",
+        ).and_return(iter([pod])).once()
+
+        totals = openshift.get_requested_resources(
+            "thoth", label_selector=label_selector
+        )
+        assert totals["thoth"]["requests"]["cpu"] == 0.5
+        with pytest.raises(ValueError):
+            informer.list(label_selector)
+
+    @pytest.mark.parametrize(
+        "label_selector,expected",
+        [
+            ("component=adviser", True),
+            ("component==adviser,workflow=wf-1", True),
+            ("component!=adviser", False),
+            ("component", True),
+            ("!component", False),
+            ("component=solver", False),
+        ],
+    )
+    def test_match_label_selector(self, label_selector: str, expected: bool) -> None:
+        """Test matching equality-based label selectors."""
+        labels = _workflow("wf-1", "1")["metadata"]["labels"]
+        assert match_label_selector(labels, label_selector) is expected
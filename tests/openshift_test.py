@@ -0,0 +1,1099 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test interaction with OpenShift master."""
+
+import datetime
+import io
+import json
+import os
+import stat
+import threading
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import pytest
+import requests
+from flexmock import flexmock
+
+from thoth.common.cache import LogCache
+from thoth.common.cache import WorkflowCache
+from thoth.common.exceptions import NotFoundException
+from thoth.common.exceptions import ThothCommonException
+from thoth.common.openshift import OpenShift
+from thoth.common.openshift import WorkflowLogLine
+
+from .base_test import CommonTestCase
+
+
+def _response(status_code: int, content: bytes) -> requests.Response:
+    """Construct a response as returned by master."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def _pod(name: str) -> Dict[str, Any]:
+    """Construct a pod object as returned by master."""
+    return {
+        "metadata": {"name": name},
+        "status": {
+            "containerStatuses": [
+                {"state": {"terminated": {"exitCode": 0, "reason": "Completed"}}}
+            ]
+        },
+    }
+
+
+class TestOpenShift(CommonTestCase):
+    """Test interaction with OpenShift master without contacting it."""
+
+    _NAMESPACE = "thoth-middletier"
+
+    @staticmethod
+    def _openshift() -> OpenShift:
+        """Create OpenShift instance with configuration set, without contacting master."""
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.openshift_api_url = "https://master"
+        openshift.middletier_namespace = TestOpenShift._NAMESPACE
+        openshift.infra_namespace = TestOpenShift._NAMESPACE
+        openshift.http_pool_maxsize = 4
+        openshift.pod_informer = False
+        openshift.job_informer = False
+        openshift.list_page_size = 500
+        openshift.dedup_window = 600
+        openshift._dedup_submitted = {}
+        openshift._dedup_lock = threading.Lock()
+        openshift._dedup_pending = set()
+        openshift._dedup_condition = threading.Condition(openshift._dedup_lock)
+        openshift.log_cache = None
+        openshift._workflow_node_indexes = OrderedDict()
+        openshift._workflow_node_indexes_lock = threading.Lock()
+        return openshift
+
+    def _mock_job(self, openshift: OpenShift, pods: int) -> None:
+        """Mock a job with the given number of pods, only one pod listing is expected."""
+        job = {
+            "spec": {"completions": pods},
+            "status": {"succeeded": pods, "startTime": "2020-10-01T10:00:00Z"},
+        }
+        pod_list = {"items": [_pod(f"job-1-{i}") for i in range(pods)]}
+        flexmock(openshift).should_receive("_get_resource").with_args(
+            "batch/v1", "Job"
+        ).and_return(flexmock(get=lambda name, namespace: job))
+        flexmock(openshift).should_receive("_http_request").with_args(
+            "GET",
+            f"https://master/api/v1/namespaces/{self._NAMESPACE}/pods",
+            params={"limit": "500", "labelSelector": "job-name=job-1"},
+        ).and_return(_response(200, json.dumps(pod_list).encode())).once()
+
+    @staticmethod
+    def _openshift_http(keep_alive: bool = True) -> OpenShift:
+        """Create OpenShift instance with configuration of the HTTP session set."""
+        openshift = TestOpenShift._openshift()
+        openshift.kubernetes_verify_tls = False
+        openshift.http_keep_alive = keep_alive
+        openshift.http_retries = 2
+        openshift._token = "token"
+        openshift._http_session = None
+        openshift._http_session_lock = threading.Lock()
+        openshift._informers = {}
+        openshift._informers_lock = threading.Lock()
+        return openshift
+
+    def test_http_session(self) -> None:
+        """Test the HTTP session is configured with a connection pool and retries."""
+        openshift = self._openshift_http()
+        session = openshift.http_session
+
+        assert session.verify is False
+        assert session.headers["Authorization"] == "Bearer token"
+        assert session.headers["Connection"] == "keep-alive"
+
+        adapter = session.get_adapter("https://master/api/v1/pods")
+        assert adapter is session.get_adapter("http://master/api/v1/pods")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 4
+
+        retry = adapter.max_retries
+        assert retry.total == 2
+        assert retry.connect == 2
+        assert retry.read == 2
+        assert retry.status == 0
+        # Requests creating objects are not resent on read errors, they could be created twice.
+        assert retry._is_method_retryable("GET")
+        assert not retry._is_method_retryable("POST")
+
+    def test_http_session_no_keep_alive(self) -> None:
+        """Test connections are not kept alive if turned off."""
+        openshift = self._openshift_http(keep_alive=False)
+        assert openshift.http_session.headers["Connection"] == "close"
+
+    def test_http_session_reuse(self) -> None:
+        """Test the HTTP session is shared across calls and closed on close."""
+        openshift = self._openshift_http()
+        session = openshift.http_session
+        assert openshift.http_session is session
+
+        flexmock(session).should_receive("request").with_args(
+            "GET", "https://master/version"
+        ).and_return(_response(200, b"{}")).twice()
+        openshift._http_request("GET", "https://master/version")
+        openshift._http_request("GET", "https://master/version")
+
+        flexmock(session).should_receive("close").once()
+        openshift.close()
+        assert openshift._http_session is None
+        assert openshift.http_session is not session
+
+    @staticmethod
+    def _openshift_discovery(git_version: Optional[str] = None) -> OpenShift:
+        """Create OpenShift instance with master reporting the given version, the version is checked only if given."""
+        from kubernetes import client
+
+        openshift = TestOpenShift._openshift()
+        openshift.discovery_cache_ttl = 3600
+        get_code = flexmock(client.VersionApi).should_receive("get_code")
+        if git_version is None:
+            get_code.never()
+        else:
+            get_code.and_return(flexmock(git_version=git_version)).once()
+        return openshift
+
+    @staticmethod
+    def _write_discovery_cache(path: Path, git_version: str, age: float) -> None:
+        """Write API discovery cache with the given master version, the cache is created the given seconds ago."""
+        path.write_text(
+            json.dumps({"version": {"kubernetes": {"gitVersion": git_version}}})
+        )
+        mtime = path.stat().st_mtime - age
+        os.utime(path, (mtime, mtime))
+
+    def test_discovery_cache_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test API discovery cache is kept in a directory private to the user by default."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        openshift = self._openshift_discovery()
+        api_client = flexmock(configuration=flexmock(host="https://master"))
+
+        cache_file = Path(openshift._prepare_discovery_cache(None, api_client))
+
+        assert cache_file.parent == tmp_path / "thoth"
+        assert stat.S_IMODE(cache_file.parent.stat().st_mode) == 0o700
+        assert not cache_file.exists()
+
+    def test_discovery_cache_fresh(self, tmp_path: Path) -> None:
+        """Test API discovery cache is used without checking master version until it expires."""
+        cache_file = tmp_path / "discovery.json"
+        self._write_discovery_cache(cache_file, "v1.18.3", age=60)
+        openshift = self._openshift_discovery()
+
+        assert openshift._prepare_discovery_cache(str(cache_file), None) == str(
+            cache_file
+        )
+        assert cache_file.exists()
+
+    def test_discovery_cache_expired(self, tmp_path: Path) -> None:
+        """Test expired API discovery cache is kept for another TTL if master was not upgraded."""
+        cache_file = tmp_path / "discovery.json"
+        self._write_discovery_cache(cache_file, "v1.18.3", age=7200)
+        openshift = self._openshift_discovery("v1.18.3")
+
+        openshift._prepare_discovery_cache(str(cache_file), None)
+
+        assert cache_file.exists()
+        assert time.time() - cache_file.stat().st_mtime < 60
+
+    def test_discovery_cache_upgraded(self, tmp_path: Path) -> None:
+        """Test expired API discovery cache is dropped if master was upgraded."""
+        cache_file = tmp_path / "discovery.json"
+        self._write_discovery_cache(cache_file, "v1.18.3", age=7200)
+        openshift = self._openshift_discovery("v1.19.0")
+
+        openshift._prepare_discovery_cache(str(cache_file), None)
+
+        assert not cache_file.exists()
+
+    def test_discovery_cache_not_owned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test API discovery cache is not used if it is not owned by the current user."""
+        cache_file = tmp_path / "discovery.json"
+        self._write_discovery_cache(cache_file, "v1.18.3", age=60)
+        monkeypatch.setattr(os, "getuid", lambda: cache_file.stat().st_uid + 1)
+        openshift = self._openshift_discovery()
+
+        assert openshift._prepare_discovery_cache(str(cache_file), None) == str(
+            cache_file
+        )
+        assert not cache_file.exists()
+
+    def test_iter_pod_log(self) -> None:
+        """Test streaming pod logs with options passed to master."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("_http_request").with_args(
+            "GET",
+            f"https://master/api/v1/namespaces/{self._NAMESPACE}/pods/pod-1/log",
+            params={
+                "container": "main",
+                "follow": "true",
+                "tailLines": "10",
+                "limitBytes": "1024",
+            },
+            stream=True,
+        ).and_return(_response(200, b"line 1\nline 2\n")).once()
+
+        chunks = openshift.iter_pod_log(
+            "pod-1",
+            container="main",
+            follow=True,
+            tail_lines=10,
+            limit_bytes=1024,
+            chunk_size=4,
+        )
+        assert b"".join(chunks) == b"line 1\nline 2\n"
+
+    def test_iter_pod_log_not_initialized(self) -> None:
+        """Test nothing is streamed if the pod was not initialized yet."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("_http_request").and_return(
+            _response(400, json.dumps({"message": "pod is initializing"}).encode())
+        )
+
+        assert list(openshift.iter_pod_log("pod-1")) == []
+
+    @pytest.mark.parametrize(
+        "status_code,message",
+        [
+            (400, "a container name must be specified for pod pod-1"),
+            (500, "internal error"),
+        ],
+    )
+    def test_iter_pod_log_error(self, status_code: int, message: str) -> None:
+        """Test the response streamed is closed if master reports an error."""
+        openshift = self._openshift()
+        response = _response(status_code, json.dumps({"message": message}).encode())
+        flexmock(response).should_call("close").once()
+        flexmock(openshift).should_receive("_http_request").and_return(response)
+
+        with pytest.raises(ThothCommonException):
+            list(openshift.iter_pod_log("pod-1"))
+
+    def test_iter_build_log_error(self) -> None:
+        """Test the response streamed is closed if master reports an error."""
+        openshift = self._openshift()
+        response = _response(500, b"")
+        flexmock(response).should_call("close").once()
+        flexmock(openshift).should_receive("_http_request").and_return(response)
+
+        with pytest.raises(requests.HTTPError):
+            list(openshift.iter_build_log("build-1", self._NAMESPACE))
+
+    def test_download_pod_log(self, tmp_path: Path) -> None:
+        """Test downloading pod logs to a file, bytes are stored as sent by master."""
+        content = "tensorflow==2.3.0 ✓\n".encode() * 1000
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("_http_request").and_return(
+            _response(200, content)
+        )
+
+        path = tmp_path / "pod.log"
+        assert openshift.download_pod_log("pod-1", str(path), timestamps=True) == len(
+            content
+        )
+        assert path.read_bytes() == content
+
+    def test_iter_build_log_not_found(self) -> None:
+        """Test streaming logs of a build which does not exist."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("_http_request").and_return(
+            _response(404, b"")
+        )
+
+        with pytest.raises(NotFoundException):
+            list(openshift.iter_build_log("build-1", self._NAMESPACE))
+
+    def test_get_job_status_report(self) -> None:
+        """Test job status report is built out of a single pod listing."""
+        openshift = self._openshift()
+        self._mock_job(openshift, pods=3)
+        flexmock(openshift).should_receive("get_pod_status").never()
+
+        report = openshift.get_job_status_report("job-1", self._NAMESPACE)
+
+        assert report["started_at"] == "2020-10-01T10:00:00Z"
+        assert report["completions"] == 3
+        assert len(report["pods"]) == 3
+        assert all(pod["state"] == "terminated" for pod in report["pods"])
+        assert all(pod["exit_code"] == 0 for pod in report["pods"])
+
+    def test_get_job_logs_all(self) -> None:
+        """Test obtaining logs of all pods of a job."""
+        openshift = self._openshift()
+        self._mock_job(openshift, pods=8)
+        flexmock(openshift).should_receive("get_pod_log").replace_with(
+            lambda pod_id, namespace, container: f"log of {pod_id} in {container}"
+        )
+
+        logs = openshift.get_job_logs_all("job-1", self._NAMESPACE, container="main")
+
+        assert logs == {f"job-1-{i}": f"log of job-1-{i} in main" for i in range(8)}
+
+    def test_iter_jobs(self) -> None:
+        """Test listing Jobs in pages, resource version is sent only with the first page."""
+        openshift = self._openshift()
+        endpoint = f"https://master/apis/batch/v1/namespaces/{self._NAMESPACE}/jobs"
+        pages = [
+            {"metadata": {"continue": "token-1"}, "items": [{"name": "job-1"}]},
+            {"metadata": {"continue": "token-2"}, "items": [{"name": "job-2"}]},
+            {"metadata": {}, "items": [{"name": "job-3"}]},
+        ]
+        flexmock(openshift).should_receive("_http_request").with_args(
+            "GET",
+            endpoint,
+            params={
+                "limit": "1",
+                "labelSelector": "component=solver",
+                "resourceVersion": "0",
+                "resourceVersionMatch": "NotOlderThan",
+            },
+        ).and_return(_response(200, json.dumps(pages[0]).encode())).once()
+        for idx in (1, 2):
+            flexmock(openshift).should_receive("_http_request").with_args(
+                "GET",
+                endpoint,
+                params={
+                    "limit": "1",
+                    "labelSelector": "component=solver",
+                    "continue": f"token-{idx}",
+                },
+            ).and_return(_response(200, json.dumps(pages[idx]).encode())).once()
+
+        jobs = openshift.iter_jobs(
+            "component=solver",
+            self._NAMESPACE,
+            limit=1,
+            resource_version="0",
+            resource_version_match="NotOlderThan",
+        )
+        assert next(jobs) == {"name": "job-1"}
+        assert list(jobs) == [{"name": "job-2"}, {"name": "job-3"}]
+
+    def test_get_jobs(self) -> None:
+        """Test Jobs are obtained as returned by the dynamic client, list metadata are kept."""
+        openshift = self._openshift()
+        jobs = flexmock(metadata=flexmock(resourceVersion="42"), items=[])
+        resource = flexmock()
+        resource.should_receive("get").with_args(
+            namespace=self._NAMESPACE, label_selector="component=solver"
+        ).and_return(jobs).once()
+        flexmock(openshift).should_receive("_get_resource").with_args(
+            "batch/v1", "Job"
+        ).and_return(resource)
+
+        assert openshift.get_jobs("component=solver", self._NAMESPACE) is jobs
+
+    def test_get_jobs_not_found(self) -> None:
+        """Test listing Jobs when master does not serve them."""
+        from openshift.dynamic.exceptions import NotFoundError
+
+        openshift = self._openshift()
+        error = NotFoundError(
+            flexmock(status=404, reason="Not Found", body=b"", headers={})
+        )
+        resource = flexmock()
+        resource.should_receive("get").and_raise(error)
+        flexmock(openshift).should_receive("_get_resource").and_return(resource)
+
+        with pytest.raises(NotFoundException, match="component=solver"):
+            openshift.get_jobs("component=solver", self._NAMESPACE)
+
+    def test_iter_table(self) -> None:
+        """Test listing objects in Table format, only cells of columns are transferred."""
+        openshift = self._openshift()
+        table = {
+            "kind": "Table",
+            "metadata": {},
+            "columnDefinitions": [
+                {"name": "Name"},
+                {"name": "Status"},
+                {"name": "Age"},
+            ],
+            "rows": [
+                {
+                    "cells": ["wf-1", "Running", "5m"],
+                    "object": {"metadata": {"name": "wf-1"}},
+                },
+                {
+                    "cells": ["wf-2", None, None],
+                    "object": {"metadata": {"name": "wf-2"}},
+                },
+            ],
+        }
+        flexmock(openshift).should_receive("_http_request").with_args(
+            "GET",
+            "https://master/apis/argoproj.io/v1alpha1/namespaces/thoth/workflows",
+            params={"limit": "500"},
+            headers={"Accept": OpenShift._TABLE},
+        ).and_return(_response(200, json.dumps(table).encode()))
+
+        rows = openshift.iter_table(
+            "/apis/argoproj.io/v1alpha1/namespaces/thoth/workflows",
+            columns=("Status", "Age"),
+        )
+
+        assert rows is not None
+        assert [(row["metadata"]["name"], row["Age"]) for row in rows] == [
+            ("wf-1", "5m"),
+            ("wf-2", None),
+        ]
+
+    def test_iter_table_not_supported(self) -> None:
+        """Test no rows are provided if master does not provide requested columns."""
+        openshift = self._openshift()
+        table = {
+            "kind": "Table",
+            "metadata": {},
+            "columnDefinitions": [{"name": "Name"}, {"name": "Age"}],
+            "rows": [],
+        }
+        flexmock(openshift).should_receive("_http_request").and_return(
+            _response(200, json.dumps(table).encode())
+        ).and_return(_response(200, json.dumps({"kind": "WorkflowList"}).encode()))
+
+        path = "/apis/argoproj.io/v1alpha1/namespaces/thoth/workflows"
+        assert openshift.iter_table(path, columns=("Status", "Age")) is None
+        assert openshift.iter_table(path, columns=("Age",)) is None
+
+    def test_iter_table_column_description(self) -> None:
+        """Test no rows are provided if a column does not show the expected field, e.g. creation time as Age."""
+        openshift = self._openshift()
+        table = {
+            "kind": "Table",
+            "metadata": {},
+            "columnDefinitions": [
+                {"name": "Name", "description": "Name of the object."},
+                {"name": "Age", "description": "CreationTimestamp is a timestamp."},
+            ],
+            "rows": [{"cells": ["wf-1", "5m"], "object": {"metadata": {}}}],
+        }
+        flexmock(openshift).should_receive("_http_request").and_return(
+            _response(200, json.dumps(table).encode())
+        )
+
+        path = "/apis/argoproj.io/v1alpha1/namespaces/thoth/workflows"
+        assert (
+            openshift.iter_table(
+                path,
+                columns=("Age",),
+                column_descriptions={"Age": "When the workflow was started"},
+            )
+            is None
+        )
+        rows = openshift.iter_table(
+            path,
+            columns=("Age",),
+            column_descriptions={"Age": "CreationTimestamp is a timestamp."},
+        )
+        assert rows is not None
+        assert [row["Age"] for row in rows] == ["5m"]
+
+    def test_schedule_workflow_dedup(self) -> None:
+        """Test identical Workflows are scheduled once within the dedup window, regardless of the generated id."""
+        openshift = self._openshift()
+        submitted = []
+        template = {"metadata": {"uid": "template-1", "resourceVersion": "1"}}
+
+        def submit_graph_sync(template_parameters, workflow_parameters, workflow_labels):  # type: ignore
+            submitted.append(workflow_labels)
+            return template_parameters["THOTH_SYNC_JOB_ID"]
+
+        def parameters(job_id: str) -> Dict[str, Any]:
+            return {
+                "template_parameters": {
+                    "THOTH_SYNC_JOB_ID": job_id,
+                    "THOTH_SYNC_DOCUMENT_ID": "adviser-1",
+                },
+                "workflow_parameters": {},
+            }
+
+        def schedule(openshift: OpenShift, job_id: str) -> Optional[str]:
+            return openshift._schedule_workflow(
+                submit_graph_sync,
+                parameters(job_id),
+                dedup_id=job_id,
+                dedup_template="template=graph-sync",
+            )
+
+        flexmock(openshift).should_receive("_get_template").with_args(
+            "template=graph-sync"
+        ).replace_with(lambda label_selector: template)
+        flexmock(openshift).should_receive("iter_table").and_return(
+            iter([])
+        ).and_return(iter([]))
+        flexmock(openshift).should_receive("iter_workflows").never()
+
+        assert schedule(openshift, "graph-sync-1") == "graph-sync-1"
+        assert schedule(openshift, "graph-sync-2") == "graph-sync-1"
+        assert len(submitted) == 1
+
+        # Another replica finds the Workflow by its fingerprint label, only metadata and status are listed.
+        fingerprint = submitted[0][OpenShift._FINGERPRINT_LABEL]
+        created = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        replica = self._openshift()
+        flexmock(replica).should_receive("_get_template").and_return(template)
+        flexmock(replica).should_receive("iter_table").with_args(
+            f"/apis/argoproj.io/v1alpha1/namespaces/{self._NAMESPACE}/workflows",
+            columns=("Status",),
+            label_selector=f"{OpenShift._FINGERPRINT_LABEL}={fingerprint}",
+        ).and_return(
+            iter(
+                [
+                    {
+                        "Status": "Running",
+                        "metadata": {
+                            "name": "graph-sync-1",
+                            "creationTimestamp": created,
+                        },
+                    },
+                    {
+                        "Status": None,
+                        "metadata": {
+                            "name": "graph-sync-0",
+                            "creationTimestamp": "2020-10-01T10:00:00Z",
+                        },
+                    },
+                ]
+            )
+        )
+        assert schedule(replica, "graph-sync-3") == "graph-sync-1"
+        assert len(submitted) == 1
+
+        # The template was updated, Workflows created out of the previous revision are not reused.
+        template = {"metadata": {"uid": "template-1", "resourceVersion": "2"}}
+        assert schedule(openshift, "graph-sync-4") == "graph-sync-4"
+        assert len(submitted) == 2
+        assert submitted[1][OpenShift._FINGERPRINT_LABEL] != fingerprint
+
+    def test_schedule_workflow_dedup_concurrent(self) -> None:
+        """Test identical Workflows scheduled concurrently are submitted once."""
+        openshift = self._openshift()
+        submitted = []
+        submitting = threading.Event()
+        release = threading.Event()
+
+        def submit_graph_sync(template_parameters, workflow_parameters, workflow_labels):  # type: ignore
+            submitted.append(template_parameters["THOTH_SYNC_JOB_ID"])
+            submitting.set()
+            release.wait(timeout=5)
+            return template_parameters["THOTH_SYNC_JOB_ID"]
+
+        def schedule(job_id: str) -> None:
+            results[job_id] = openshift._schedule_workflow(
+                submit_graph_sync,
+                {
+                    "template_parameters": {
+                        "THOTH_SYNC_JOB_ID": job_id,
+                        "THOTH_SYNC_DOCUMENT_ID": "adviser-1",
+                    },
+                    "workflow_parameters": {},
+                },
+                dedup_id=job_id,
+            )
+
+        flexmock(openshift).should_receive("iter_table").replace_with(
+            lambda *args, **kwargs: iter([])
+        )
+        results: Dict[str, Optional[str]] = {}
+        first = threading.Thread(target=schedule, args=("graph-sync-1",))
+        first.start()
+        assert submitting.wait(timeout=5)
+
+        # The second Workflow waits for the first one to be submitted, it is not looked up before.
+        second = threading.Thread(target=schedule, args=("graph-sync-2",))
+        second.start()
+        second.join(timeout=0.1)
+        assert second.is_alive()
+
+        release.set()
+        first.join()
+        second.join()
+
+        assert submitted == ["graph-sync-1"]
+        assert results == {"graph-sync-1": "graph-sync-1", "graph-sync-2": "graph-sync-1"}
+        assert not openshift._dedup_pending
+
+    def test_schedule_all_solvers_failure(self) -> None:
+        """Test the first failure is raised once all the solvers were attempted."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("schedule_solvers").with_args(
+            "flask",
+            indexes=None,
+            debug=False,
+            transitive=False,
+            workflow_limit=10,
+            max_workers=2,
+        ).and_return(
+            {"solver-a": "solver-a-1"},
+            {"solver-b": ValueError("solver-b"), "solver-c": KeyError("solver-c")},
+        ).once()
+
+        with pytest.raises(ValueError, match="solver-b"):
+            openshift.schedule_all_solvers("flask", workflow_limit=10, max_workers=2)
+
+    def test_schedule_solvers_dedup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test solvers scheduled in a batch are deduplicated, also against solvers scheduled one by one."""
+        for name, value in (
+            ("THOTH_CEPH_BUCKET_PREFIX", "data"),
+            ("THOTH_CEPH_BUCKET", "thoth"),
+            ("THOTH_S3_ENDPOINT_URL", "https://s3"),
+            ("THOTH_DEPLOYMENT_NAME", "test"),
+        ):
+            monkeypatch.setenv(name, value)
+
+        submitted = []
+
+        def submit_solver(  # type: ignore
+            template_parameters, workflow_parameters, workflow_limit, workflow_labels
+        ):
+            assert workflow_limit == 10
+            submitted.append(template_parameters["THOTH_SOLVER_NAME"])
+            return template_parameters["THOTH_SOLVER_WORKFLOW_ID"]
+
+        openshift = self._openshift()
+        openshift._workflow_manager = flexmock(submit_solver=submit_solver)
+        openshift._workflow_manager.should_receive("submit_solvers").never()
+        flexmock(openshift).should_receive("_get_template").and_return(
+            {"metadata": {"uid": "template-1", "resourceVersion": "1"}}
+        )
+        flexmock(openshift).should_receive("iter_table").replace_with(
+            lambda *args, **kwargs: iter([])
+        )
+
+        scheduled, failed = openshift.schedule_solvers(
+            "flask", ["solver-a", "solver-b"], workflow_limit=10
+        )
+        assert not failed
+        assert sorted(submitted) == ["solver-a", "solver-b"]
+
+        flexmock(openshift).should_receive("iter_table").never()
+        assert openshift.schedule_solvers(
+            "flask", ["solver-a", "solver-b"], workflow_limit=10
+        ) == (scheduled, {})
+        assert openshift.schedule_solver("flask", "solver-a", transitive=False) == (
+            scheduled["solver-a"]
+        )
+        assert len(submitted) == 2
+
+    def test_get_deduplicated_workflow_full_listing(self) -> None:
+        """Test Workflows are looked up in a full listing if master cannot serve them in Table format."""
+        openshift = self._openshift()
+        created = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        flexmock(openshift).should_receive("iter_table").and_return(None)
+        flexmock(openshift).should_receive("iter_workflows").with_args(
+            namespace=self._NAMESPACE,
+            label_selector=f"{OpenShift._FINGERPRINT_LABEL}=abc",
+        ).and_return(
+            iter(
+                [
+                    {
+                        "metadata": {"name": "solver-1", "creationTimestamp": created},
+                        "status": {"phase": "Failed"},
+                    },
+                    {"metadata": {"name": "solver-2", "creationTimestamp": created}},
+                ]
+            )
+        )
+
+        assert openshift._get_deduplicated_workflow("abc") == "solver-2"
+
+    def test_get_workflow_nodes_status(self) -> None:
+        """Test status of all nodes of a workflow is reported based on a single pod listing."""
+        openshift = self._openshift()
+        killed = _pod("wf-1-2")
+        killed["status"]["containerStatuses"][0]["state"] = {
+            "terminated": {"exitCode": 137, "reason": "Error"}
+        }
+        flexmock(openshift).should_receive("get_workflow").with_args(
+            "wf-1", namespace=self._NAMESPACE
+        ).and_return(
+            {
+                "status": {
+                    "nodes": {
+                        "wf-1": {"displayName": "wf-1", "type": "Steps"},
+                        "wf-1-1": {"displayName": "solve", "type": "Pod"},
+                        "wf-1-2": {"displayName": "sync", "type": "Pod"},
+                        "wf-1-3": {"displayName": "report", "type": "Pod"},
+                    }
+                }
+            }
+        )
+        flexmock(openshift).should_receive("_http_request").with_args(
+            "GET",
+            f"https://master/api/v1/namespaces/{self._NAMESPACE}/pods",
+            params={
+                "limit": "500",
+                "labelSelector": "workflows.argoproj.io/workflow=wf-1",
+            },
+        ).and_return(
+            _response(200, json.dumps({"items": [_pod("wf-1-1"), killed]}).encode())
+        ).once()
+        flexmock(openshift).should_receive("get_pod_status").never()
+
+        report = openshift.get_workflow_nodes_status("wf-1", self._NAMESPACE)
+
+        assert list(report) == ["solve", "sync", "report"]
+        assert report["solve"]["state"] == "terminated"
+        assert report["solve"]["exit_code"] == 0
+        assert report["sync"]["reason"] == "TimeoutKilled"
+        assert report["report"]["state"] == "scheduling"
+
+    def test_get_pod_log_cached(self, tmp_path: Path) -> None:
+        """Test logs are cached only if the pod terminated before obtaining them."""
+        openshift = self._openshift()
+        openshift.log_cache = LogCache(str(tmp_path), max_size=1024 * 1024)
+        phases = iter(["Running", "Succeeded"])
+        flexmock(openshift).should_receive("_get_pod_informer").and_return(None)
+        flexmock(openshift).should_receive("_get_resource").with_args(
+            "v1", "Pod"
+        ).and_return(
+            flexmock(
+                get=lambda namespace, name: flexmock(
+                    to_dict=lambda: {"status": {"phase": next(phases)}}
+                )
+            )
+        )
+        flexmock(openshift).should_receive("_http_request").and_return(
+            _response(200, b"partial log\n")
+        ).and_return(_response(200, b"complete log\n")).twice()
+
+        assert openshift.get_pod_log("pod-1", container="main") == "partial log\n"
+        assert openshift.get_pod_log("pod-1", container="main") == "complete log\n"
+        assert openshift.get_pod_log("pod-1", container="main") == "complete log\n"
+        assert openshift.log_cache.hits == 1
+        assert openshift.log_cache.misses == 2
+
+    def test_get_workflow_pod_name_indexed(self) -> None:
+        """Test node index is built once per workflow revision, checked using workflow metadata only."""
+        openshift = self._openshift()
+
+        def workflow(resource_version: str) -> Dict[str, Any]:
+            return {
+                "metadata": {"uid": "uid-1", "resourceVersion": resource_version},
+                "status": {
+                    "nodes": {
+                        "wf-1-1": {"displayName": "solve", "templateName": "solver"},
+                        "wf-1-2": {"displayName": "sync", "templateName": "sync"},
+                    }
+                },
+            }
+
+        flexmock(openshift).should_receive("get_workflow_informer").and_return(None)
+        metadata = (
+            flexmock(openshift)
+            .should_receive("_http_request")
+            .with_args(
+                "GET",
+                f"https://master/apis/argoproj.io/v1alpha1/namespaces/{self._NAMESPACE}/workflows/wf-1",
+                headers={"Accept": OpenShift._PARTIAL_OBJECT_METADATA},
+            )
+        )
+        for resource_version in ("1", "1", "2", "2"):
+            metadata.and_return(
+                _response(
+                    200,
+                    json.dumps(
+                        {"metadata": workflow(resource_version)["metadata"]}
+                    ).encode(),
+                )
+            )
+        metadata.times(4)
+        flexmock(openshift).should_receive("get_workflow").with_args(
+            "wf-1", namespace=self._NAMESPACE
+        ).and_return(workflow("1")).and_return(workflow("2")).twice()
+
+        assert (
+            openshift.get_workflow_pod_name("solve", "wf-1", self._NAMESPACE)
+            == "wf-1-1"
+        )
+        assert (
+            openshift.get_workflow_pod_name("sync", "wf-1", self._NAMESPACE) == "wf-1-2"
+        )
+        index = openshift.get_workflow_node_index("wf-1", self._NAMESPACE)
+        assert index.resource_version == "2"
+        assert index.find(template_name="solver") == ["wf-1-1"]
+
+        with pytest.raises(NotFoundException):
+            openshift.get_workflow_pod_name("report", "wf-1", self._NAMESPACE)
+
+    @staticmethod
+    def _workflow_with_nodes() -> Dict[str, Any]:
+        """Construct a workflow with nodes as returned by master."""
+        return {
+            "status": {
+                "nodes": {
+                    "wf-1": {"displayName": "wf-1", "type": "Steps"},
+                    "wf-1-1": {
+                        "displayName": "solve",
+                        "type": "Pod",
+                        "phase": "Running",
+                    },
+                    "wf-1-2": {
+                        "displayName": "sync",
+                        "type": "Pod",
+                        "phase": "Running",
+                    },
+                    "wf-1-3": {
+                        "displayName": "report",
+                        "type": "Pod",
+                        "phase": "Pending",
+                    },
+                }
+            }
+        }
+
+    def test_get_workflow_logs(self) -> None:
+        """Test logs of all nodes are obtained based on a single workflow fetch."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("get_workflow").with_args(
+            "wf-1", namespace=self._NAMESPACE
+        ).and_return(self._workflow_with_nodes()).once()
+
+        def get_pod_log(pod_id: str, namespace: str, container: str) -> str:
+            assert namespace == self._NAMESPACE
+            assert container == "main"
+            if pod_id == "wf-1-3":
+                raise NotFoundException(pod_id)
+            return f"log of {pod_id}"
+
+        flexmock(openshift).should_receive("get_pod_log").replace_with(get_pod_log)
+
+        assert openshift.get_workflow_logs("wf-1", self._NAMESPACE) == {
+            "solve": "log of wf-1-1",
+            "sync": "log of wf-1-2",
+            "report": None,
+        }
+
+    def test_iter_workflow_logs(self) -> None:
+        """Test log streams of running nodes are merged and ordered by timestamps."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("get_workflow").and_return(
+            self._workflow_with_nodes()
+        )
+        streams = {
+            "wf-1-1": [
+                b"2020-10-01T10:00:00.5Z solving\n2020-10-01T10:00:",
+                b"02Z solved\n",
+            ],
+            "wf-1-2": [b"2020-10-01T10:00:00.25Z syncing\n2020-10-01T10:00:01Z synced"],
+        }
+        responses = []
+
+        def pod_log_response(
+            pod_id: str, namespace: str, stream: bool, **log_options: Any
+        ) -> Any:
+            assert stream is True
+            assert log_options["follow"] is True
+            assert log_options["timestamps"] is True
+            assert pod_id != "wf-1-3", "Only running nodes are followed"
+            response = _response(200, b"")
+            flexmock(response).should_receive("iter_content").and_return(
+                iter(streams[pod_id])
+            )
+            flexmock(response).should_call("close").at_least().once()
+            responses.append(response)
+            return response
+
+        flexmock(openshift).should_receive("_pod_log_response").replace_with(
+            pod_log_response
+        )
+
+        assert list(
+            openshift.iter_workflow_logs(
+                "wf-1", self._NAMESPACE, follow=True, reorder_window=5
+            )
+        ) == [
+            WorkflowLogLine("sync", "2020-10-01T10:00:00.25Z syncing"),
+            WorkflowLogLine("solve", "2020-10-01T10:00:00.5Z solving"),
+            WorkflowLogLine("sync", "2020-10-01T10:00:01Z synced"),
+            WorkflowLogLine("solve", "2020-10-01T10:00:02Z solved"),
+        ]
+        assert len(responses) == 2
+
+    def test_iter_workflow_logs_bounded(self) -> None:
+        """Test logs of nodes finished are streamed by a bounded number of workers."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("get_workflow").and_return(
+            self._workflow_with_nodes()
+        )
+        active = []
+        lock = threading.Lock()
+
+        def iter_content(pod_id: str) -> Any:
+            with lock:
+                active.append(pod_id)
+                assert len(active) == 1, "Logs are streamed one after another"
+            time.sleep(0.01)
+            yield f"2020-10-01T10:00:00Z log of {pod_id}\n".encode()
+            with lock:
+                active.remove(pod_id)
+
+        def pod_log_response(
+            pod_id: str, namespace: str, stream: bool, **log_options: Any
+        ) -> Any:
+            assert log_options["follow"] is False
+            response = _response(200, b"")
+            flexmock(response).should_receive("iter_content").and_return(
+                iter_content(pod_id)
+            )
+            return response
+
+        flexmock(openshift).should_receive("_pod_log_response").replace_with(
+            pod_log_response
+        )
+
+        entries = list(
+            openshift.iter_workflow_logs(
+                "wf-1",
+                self._NAMESPACE,
+                reorder_window=0,
+                max_workers=1,
+                buffer_size=1,
+            )
+        )
+        assert sorted(entries, key=lambda entry: entry.node) == [
+            WorkflowLogLine("report", "2020-10-01T10:00:00Z log of wf-1-3"),
+            WorkflowLogLine("solve", "2020-10-01T10:00:00Z log of wf-1-1"),
+            WorkflowLogLine("sync", "2020-10-01T10:00:00Z log of wf-1-2"),
+        ]
+
+    def test_iter_workflow_logs_error(self) -> None:
+        """Test a failure to obtain log of a node is reported in the merged stream, other logs are streamed."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("get_workflow").and_return(
+            self._workflow_with_nodes()
+        )
+        error = ThothCommonException("Failed to obtain logs for pod")
+
+        def pod_log_response(pod_id: str, *args: Any, **kwargs: Any) -> Any:
+            if pod_id == "wf-1-1":
+                raise error
+
+            response = _response(200, b"")
+            flexmock(response).should_receive("iter_content").and_return(
+                iter([b"2020-10-01T10:00:00Z syncing\n"])
+            )
+            return response
+
+        flexmock(openshift).should_receive("_pod_log_response").replace_with(
+            pod_log_response
+        )
+
+        entries = list(
+            openshift.iter_workflow_logs(
+                "wf-1", self._NAMESPACE, follow=True, reorder_window=0
+            )
+        )
+        assert sorted(entries, key=lambda entry: entry.node) == [
+            WorkflowLogLine("solve", error=error),
+            WorkflowLogLine("sync", "2020-10-01T10:00:00Z syncing"),
+        ]
+
+    def test_iter_workflow_logs_close(self) -> None:
+        """Test log streams are closed once the merged stream is closed, readers blocked are unblocked."""
+        openshift = self._openshift()
+        flexmock(openshift).should_receive("get_workflow").and_return(
+            self._workflow_with_nodes()
+        )
+        closed = threading.Event()
+
+        def iter_content(chunk_size: int) -> Any:
+            yield b"2020-10-01T10:00:00Z solving\n"
+            # Block as a follow request waiting for a chunk does, until the response is closed.
+            assert closed.wait(5)
+            raise requests.ConnectionError("Connection closed")
+
+        def pod_log_response(pod_id: str, *args: Any, **kwargs: Any) -> Any:
+            response = _response(200, b"")
+            flexmock(response).should_receive("iter_content").replace_with(iter_content)
+            flexmock(response).should_receive("close").replace_with(closed.set)
+            return response
+
+        flexmock(openshift).should_receive("_pod_log_response").replace_with(
+            pod_log_response
+        )
+
+        stream = openshift.iter_workflow_logs(
+            "wf-1", self._NAMESPACE, follow=True, reorder_window=0
+        )
+        assert next(stream).line == "2020-10-01T10:00:00Z solving"
+        stream.close()
+        assert closed.is_set()
+
+    def test_get_workflow_cached_recreated(self) -> None:
+        """Test Workflows cached are checked against metadata on master if there is no informer running."""
+        openshift = self._openshift()
+        openshift.workflow_cache = WorkflowCache(1024 * 1024)
+        openshift.workflow_informer = False
+
+        def workflow(uid: str) -> Dict[str, Any]:
+            return {
+                "metadata": {"name": "wf-1", "uid": uid},
+                "status": {"phase": "Succeeded"},
+            }
+
+        uids = iter(["uid-1", "uid-2"])
+
+        def get(namespace: str, name: str) -> Any:
+            response = workflow(next(uids))
+            return flexmock(to_dict=lambda: response)
+
+        flexmock(openshift).should_receive("_get_resource").and_return(
+            flexmock(get=get)
+        )
+        flexmock(openshift).should_receive("_get_workflow_metadata").with_args(
+            "wf-1", self._NAMESPACE
+        ).and_return({"uid": "uid-1"}).and_return({"uid": "uid-2"}).and_raise(
+            NotFoundException("The given Workflow wf-1 could not be found")
+        )
+
+        assert (
+            openshift.get_workflow("wf-1", namespace=self._NAMESPACE)["metadata"]["uid"]
+            == "uid-1"
+        )
+        assert (
+            openshift.get_workflow("wf-1", namespace=self._NAMESPACE)["metadata"]["uid"]
+            == "uid-1"
+        )
+        # Re-created under the same name.
+        assert (
+            openshift.get_workflow("wf-1", namespace=self._NAMESPACE)["metadata"]["uid"]
+            == "uid-2"
+        )
+        assert openshift.workflow_cache.hits == 1
+
+        # Deleted.
+        with pytest.raises(NotFoundException):
+            openshift.get_workflow("wf-1", namespace=self._NAMESPACE)
+        assert len(openshift.workflow_cache) == 0
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test parsing Kubernetes quantities and accounting resources."""
+
+import math
+import sys
+
+from fractions import Fraction
+from typing import Any
+
+import pytest
+
+from thoth.common import OpenShift
+from thoth.common import Quantity
+from thoth.common.quantity import object_resources
+from thoth.common.quantity import parse_quantities
+from thoth.common.quantity import pod_resources
+
+from .base_test import CommonTestCase
+
+
+def _container(cpu: str, memory: str) -> dict:  # type: ignore
+    """Construct a container requesting the given resources."""
+    return {
+        "image": "quay.io/thoth-station/solver",
+        "resources": {
+            "requests": {"cpu": cpu, "memory": memory},
+            "limits": {"cpu": cpu},
+        },
+    }
+
+
+class TestQuantity(CommonTestCase):
+    """Test parsing Kubernetes quantities and accounting resources."""
+
+    @pytest.mark.parametrize(
+        "quantity,expected",
+        [
+            ("500m", Fraction(1, 2)),
+            ("2", 2),
+            ("0.1", Fraction(1, 10)),
+            ("1.5Gi", 3 * 1024 ** 3 // 2),
+            ("128Mi", 128 * 1024 ** 2),
+            ("1k", 1000),
+            ("1K", 1000),
+            ("1E", 1000 ** 6),
+            ("1e3", 1000),
+            ("25u", Fraction(25, 10 ** 6)),
+        ],
+    )
+    def test_parse(self, quantity: str, expected: Fraction) -> None:
+        """Test parsing quantities exactly."""
+        assert Quantity(quantity).value == expected
+
+    @pytest.mark.parametrize("quantity", ["", "1Xi", "Gi", "1.5.3"])
+    def test_parse_invalid(self, quantity: str) -> None:
+        """Test invalid quantities are reported."""
+        with pytest.raises(ValueError):
+            Quantity(quantity)
+
+    def test_arithmetic(self) -> None:
+        """Test quantities are summed exactly."""
+        total = sum(Quantity("100m") for _ in range(10))
+        assert total == Quantity("1")
+        assert str(total) == "1"
+        assert str(Quantity("1500m")) == "1500m"
+        assert Quantity("1Gi") > Quantity("1G")
+        assert max(Quantity("1"), Quantity("1500m")) == Quantity("1.5")
+        assert Quantity("200m") * 3 - Quantity("100m") == Quantity("0.5")
+
+    def test_parse_specs(self) -> None:
+        """Test parsing CPU and memory specifications keeps the original behavior."""
+        assert OpenShift.parse_cpu_spec("250m") == 0.25
+        assert OpenShift.parse_cpu_spec(None) is None
+        assert OpenShift.parse_memory_spec("1Ki") == 1024.0
+        assert OpenShift.parse_memory_spec(1024) == 1024.0  # type: ignore
+        with pytest.raises(ValueError):
+            OpenShift.parse_memory_spec("1Xi")
+
+    def test_parse_quantities(self) -> None:
+        """Test parsing quantities in a batch, missing quantities are NaN."""
+        pytest.importorskip("numpy")
+
+        parsed = parse_quantities(["500m", "1", None, "500m", 2, "1Ki"])
+
+        assert parsed[:2].tolist() == [0.5, 1.0]
+        assert math.isnan(parsed[2])
+        assert parsed[3:].tolist() == [0.5, 2.0, 1024.0]
+        assert parse_quantities([]).shape == (0,)
+
+    def test_parse_quantities_missing(self) -> None:
+        """Test quantities which are all missing are parsed into NaN values."""
+        pytest.importorskip("numpy")
+
+        parsed = parse_quantities([None, None, ""])
+
+        assert parsed.shape == (3,)
+        assert all(math.isnan(value) for value in parsed)
+
+    def test_parse_quantities_no_numpy(self, monkeypatch: Any) -> None:
+        """Test the extra providing NumPy is named if NumPy is not installed."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        with pytest.raises(ImportError, match=r"thoth-common\[numpy\]"):
+            parse_quantities(["1"])
+
+    def test_pod_resources(self) -> None:
+        """Test init containers are accounted only if they request more than containers."""
+        totals = pod_resources(
+            {
+                "initContainers": [_container("2", "64Mi")],
+                "containers": [_container("500m", "1Gi"), _container("1", "1Gi")],
+            }
+        )
+
+        assert totals["requests"] == {"cpu": Quantity("2"), "memory": Quantity("2Gi")}
+        assert totals["limits"] == {"cpu": Quantity("2"), "memory": Quantity(0)}
+
+    def test_object_resources(self) -> None:
+        """Test resources of all containers stated in a Workflow are summed."""
+        workflow = {
+            "kind": "Workflow",
+            "spec": {
+                "templates": [
+                    {"name": "solve", "container": _container("1", "4Gi")},
+                    {"name": "sync", "script": _container("250m", "256Mi")},
+                    {"name": "main", "steps": [[{"name": "solve"}]]},
+                ]
+            },
+        }
+
+        totals = object_resources([workflow])
+
+        assert totals["requests"]["cpu"] == Quantity("1250m")
+        assert totals["requests"]["memory"] == Quantity("4352Mi")
+
+    def test_get_requested_resources(self) -> None:
+        """Test totals of resources are grouped by label value, pods finished are not accounted."""
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.pod_informer = False
+
+        def pod(workflow: str, phase: str) -> dict:  # type: ignore
+            return {
+                "metadata": {"labels": {"workflows.argoproj.io/workflow": workflow}},
+                "spec": {"containers": [_container("500m", "1Gi")]},
+                "status": {"phase": phase},
+            }
+
+        openshift.iter_pods = lambda *args, **kwargs: iter(  # type: ignore
+            [
+                pod("wf-1", "Running"),
+                pod("wf-1", "Pending"),
+                pod("wf-2", "Succeeded"),
+                {"metadata": {}, "spec": {"containers": [_container("1", "1Gi")]}},
+            ]
+        )
+
+        totals = openshift.get_requested_resources(
+            "thoth", group_by_label="workflows.argoproj.io/workflow"
+        )
+        assert list(totals) == ["wf-1"]
+        assert totals["wf-1"]["requests"]["cpu"] == Quantity(1)
+        assert totals["wf-1"]["requests"]["memory"] == Quantity("2Gi")
+
+        totals = openshift.get_requested_resources("thoth")
+        assert totals["thoth"]["limits"]["cpu"] == Quantity(2)
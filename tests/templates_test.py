@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Test client-side processing of OpenShift templates."""
+
+import json
+import re
+import threading
+
+from typing import Any
+from typing import Dict
+
+import pytest
+import requests
+import yaml
+from flexmock import flexmock
+
+from thoth.common.exceptions import TemplateNotCompilable
+from thoth.common.exceptions import TemplateProcessingError
+from thoth.common.openshift import OpenShift
+from thoth.common.templates import CompiledTemplate
+from thoth.common.templates import process_template
+
+from .base_test import CommonTestCase
+
+
+class TestTemplates(CommonTestCase):
+    """Test processing of OpenShift templates."""
+
+    _TEMPLATE_FILE = CommonTestCase.DATA / "templates" / "solver.yaml"
+    # Output of master's processedtemplates endpoint for the template above.
+    _PROCESSED_TEMPLATE_FILE = (
+        CommonTestCase.DATA / "templates" / "solver-processed.json"
+    )
+
+    def _get_template(self, **parameters: Any) -> Dict[str, Any]:
+        template: Dict[str, Any] = yaml.safe_load(self._TEMPLATE_FILE.read_text())
+        OpenShift.set_template_parameters(template, **parameters)
+        return template
+
+    def test_process(self) -> None:
+        """Test substitution of parameters, default values, generated values and labels."""
+        template = self._get_template(
+            THOTH_SOLVER_WORKFLOW_ID="solver-fedora-32-py38-1234",
+            THOTH_SOLVER_NAME="solver-fedora-32-py38",
+            THOTH_SOLVER_PACKAGES="tensorflow\\nflask",
+        )
+        result = process_template(template)
+
+        assert result["kind"] == "Template"
+        assert len(result["objects"]) == 1
+
+        workflow = result["objects"][0]
+        assert workflow["metadata"]["name"] == "solver-fedora-32-py38-1234"
+        # Hardcoded namespaces are stripped.
+        assert "namespace" not in workflow["metadata"]
+        assert workflow["metadata"]["labels"] == {
+            "solver-fedora-32-py38": "1",
+            "mark": "solver-fedora-32-py38-1234-${UNKNOWN_PARAMETER}",
+            "app": "thoth",
+            "component": "solver",
+            "solver-name": "solver-fedora-32-py38",
+        }
+        assert workflow["spec"]["ttlSecondsAfterFinished"] == 3600
+
+        env = {
+            e["name"]: e["value"]
+            for e in workflow["spec"]["templates"][0]["container"]["env"]
+        }
+        assert env == {
+            "THOTH_SOLVER_PACKAGES": "tensorflow\\nflask",
+            "THOTH_SOLVER_NO_TRANSITIVE": 1,
+            "THOTH_SOLVER_INDEXES": "",
+            "THOTH_LOG_SOLVER": "INFO",
+        }
+
+        secret = workflow["spec"]["arguments"]["parameters"][0]["value"]
+        assert re.fullmatch(r"[a-z0-9]{12}", secret)
+        parameters = {p["name"]: p.get("value") for p in result["parameters"]}
+        assert parameters["THOTH_SOLVER_SECRET"] == secret
+
+    def test_process_master_output(self) -> None:
+        """Test the processed template is the same document as processed by master."""
+        template = self._get_template(
+            THOTH_SOLVER_WORKFLOW_ID="solver-fedora-32-py38-1234",
+            THOTH_SOLVER_NAME="solver-fedora-32-py38",
+            THOTH_SOLVER_PACKAGES="flask",
+            THOTH_SOLVER_SECRET="abcdef123456",
+        )
+
+        assert process_template(template) == json.loads(
+            self._PROCESSED_TEMPLATE_FILE.read_text()
+        )
+
+    def test_required(self) -> None:
+        """Test required parameters are checked."""
+        template = self._get_template(THOTH_SOLVER_WORKFLOW_ID="solver-1234")
+
+        with pytest.raises(TemplateProcessingError, match="THOTH_SOLVER_NAME"):
+            process_template(template)
+
+    def test_render_repeatedly(self) -> None:
+        """Test a compiled template can be rendered repeatedly without affecting each other."""
+        compiled = CompiledTemplate(self._get_template())
+
+        results = []
+        for idx in range(2):
+            template = self._get_template(
+                THOTH_SOLVER_WORKFLOW_ID=f"solver-{idx}",
+                THOTH_SOLVER_NAME="solver-fedora-32-py38",
+                THOTH_SOLVER_PACKAGES="flask",
+            )
+            results.append(compiled.render(template["parameters"]))
+
+        assert results[0]["objects"][0]["metadata"]["name"] == "solver-0"
+        assert results[1]["objects"][0]["metadata"]["name"] == "solver-1"
+
+    def test_non_string_invalid_json(self) -> None:
+        """Test non-string substitution requires a valid JSON value."""
+        template = self._get_template(
+            THOTH_SOLVER_WORKFLOW_ID="solver-1234",
+            THOTH_SOLVER_NAME="solver-fedora-32-py38",
+            THOTH_SOLVER_PACKAGES="flask",
+            THOTH_SOLVER_TTL="one hour",
+        )
+
+        with pytest.raises(TemplateProcessingError, match="THOTH_SOLVER_TTL"):
+            process_template(template)
+
+    def test_not_compilable(self) -> None:
+        """Test templates which cannot be compiled are processed by master."""
+        template = self._get_template(
+            THOTH_SOLVER_WORKFLOW_ID="solver-\uffff0\uffff",
+            THOTH_SOLVER_NAME="solver-fedora-32-py38",
+            THOTH_SOLVER_PACKAGES="flask",
+        )
+        template["objects"][0]["metadata"]["annotations"] = {
+            "mark": "\uffff0\uffff"
+        }
+        with pytest.raises(TemplateNotCompilable):
+            CompiledTemplate(template)
+
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.local_template_processing = True
+        openshift._compiled_templates = {}
+        openshift._compiled_templates_lock = threading.Lock()
+        flexmock(openshift).should_receive("oc_process").with_args(
+            "thoth", template
+        ).and_return({"objects": []}).once()
+
+        assert openshift.process_template("thoth", template) == {"objects": []}
+
+    def test_processing_error_reported_by_master(self) -> None:
+        """Test errors in processing on client side are reported by master as if processed in OpenShift."""
+        template = self._get_template(
+            THOTH_SOLVER_WORKFLOW_ID="solver-1234",
+            THOTH_SOLVER_NAME="solver-fedora-32-py38",
+        )
+        with pytest.raises(TemplateProcessingError, match="THOTH_SOLVER_PACKAGES"):
+            process_template(template)
+
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.local_template_processing = True
+        openshift._compiled_templates = {}
+        openshift._compiled_templates_lock = threading.Lock()
+        flexmock(openshift).should_receive("oc_process").with_args(
+            "thoth", template
+        ).and_raise(requests.HTTPError).once()
+
+        with pytest.raises(requests.HTTPError):
+            openshift.process_template("thoth", template)
+
+    def test_not_compilable_other_errors(self) -> None:
+        """Test errors other than a template not compilable are not hidden by processing in master."""
+        openshift = OpenShift.__new__(OpenShift)
+        openshift.local_template_processing = True
+        flexmock(openshift).should_receive("_get_compiled_template").and_raise(
+            NotImplementedError
+        )
+        flexmock(openshift).should_receive("oc_process").never()
+
+        with pytest.raises(NotImplementedError):
+            openshift.process_template("thoth", self._get_template())
@@ -17,12 +17,28 @@
 
 """Workflows test suite."""
 
+import copy
+import json
+
+from typing import Any
+from typing import Dict
+from typing import List
+
 import pytest
+import yaml
 
 import requests
 from flexmock import flexmock
 
+from argo.workflows import client
+from argo.workflows import models
+
+from thoth.common import LazyWorkflow  # type: ignore
 from thoth.common import Workflow  # type: ignore
+from thoth.common.admission import AdmissionController
+from thoth.common.cache import WorkflowCache
+from thoth.common.openshift import OpenShift
+from thoth.common import WorkflowManager  # type: ignore
 
 from .base_test import CommonTestCase
 
@@ -36,6 +52,34 @@ class TestWorkflows(CommonTestCase):
     """Test implementation of workflows."""
 
     _WORKFLOW_FILE = CommonTestCase.DATA / "workflows" / "hello-world.yaml"
+    _ADVISER_WORKFLOW_FILE = CommonTestCase.DATA / "workflows" / "adviser.yaml"
+
+    @staticmethod
+    def _deserialize_api_client(obj: Dict[str, Any]) -> models.V1alpha1Workflow:
+        """Deserialize a Workflow using ApiClient, going through JSON."""
+        response = type("Response", (), {"data": json.dumps(obj)})
+        return client.ApiClient().deserialize(response, models.V1alpha1Workflow)
+
+    @staticmethod
+    def _mock_submit(manager: WorkflowManager) -> List[Dict[str, Any]]:
+        """Mock submitting Workflows, bodies submitted are collected, the connection is released after each."""
+        submitted = []
+
+        def create_namespaced_workflow(
+            namespace: str, body: Dict[str, Any], _preload_content: bool
+        ) -> Any:
+            assert _preload_content is False
+            submitted.append(body)
+            response = flexmock()
+            response.should_receive("drain_conn").once()
+            response.should_receive("release_conn").once()
+            return response
+
+        manager.api = flexmock()
+        manager.api.should_receive("create_namespaced_workflow").replace_with(
+            create_namespaced_workflow
+        )
+        return submitted
 
     def test_from_file(self) -> None:
         """Test `Workflow.from_file` methods."""
@@ -46,6 +90,23 @@ class TestWorkflows(CommonTestCase):
         assert wf.kind == "Workflow"
         assert len(wf.spec.templates) == 1
 
+    def test_from_dict(self) -> None:
+        """Test Workflows created from a dict match Workflows deserialized by ApiClient."""
+        obj = yaml.safe_load(self._ADVISER_WORKFLOW_FILE.read_text())
+
+        wf = Workflow.from_dict(copy.deepcopy(obj))
+
+        assert wf.validated
+        assert wf.to_dict() == self._deserialize_api_client(obj).to_dict()
+        assert (
+            wf.spec.templates[1].container.env[0].name == "THOTH_ADVISER_REQUIREMENTS"
+        )
+        assert wf.status.started_at.year == 2020
+
+        del obj["spec"]["templates"][0]["name"]
+        with pytest.raises(ValueError):
+            Workflow.from_dict(obj)
+
     def test_from_url(self, url: str) -> None:
         """Test `Workflow.from_url` methods."""
         fake_response = type(
@@ -61,3 +122,294 @@ class TestWorkflows(CommonTestCase):
         assert wf.name == "test"
         assert wf.kind == "Workflow"
         assert len(wf.spec.templates) == 1
+
+    def test_iter_workflows(self) -> None:
+        """Test Workflows are listed in pages."""
+        pages = [
+            models.V1alpha1WorkflowList(
+                items=[
+                    models.V1alpha1Workflow(
+                        metadata={"name": f"wf-{idx}"}, spec={"templates": []}
+                    )
+                ],
+                metadata=models.V1ListMeta(_continue=token),
+            )
+            for idx, token in enumerate(("token-1", None))
+        ]
+
+        manager = WorkflowManager.__new__(WorkflowManager)
+        manager.openshift = flexmock(list_page_size=1)
+        manager.api = flexmock(api_client=flexmock())
+        manager.api.api_client.should_receive("call_api").replace_with(
+            lambda *args, **kwargs: pages[
+                1 if ("continue", "token-1") in kwargs["query_params"] else 0
+            ]
+        ).twice()
+
+        workflows = manager.get_workflows("thoth", label_selector="component=adviser")
+
+        assert [wf["metadata"]["name"] for wf in workflows["items"]] == [
+            "wf-0",
+            "wf-1",
+        ]
+        assert workflows["metadata"]["_continue"] is None
+
+    def test_get_pending_workflows(self) -> None:
+        """Test pending Workflows are counted from Table rows, with a fallback to full objects."""
+        manager = WorkflowManager.__new__(WorkflowManager)
+        manager.openshift = flexmock()
+        manager.openshift.should_receive("iter_table").with_args(
+            "/apis/argoproj.io/v1alpha1/namespaces/thoth/workflows",
+            columns=("Status", "Age"),
+            column_descriptions={"Age": "When the workflow was started"},
+        ).and_return(iter([{"Age": "5m"}, {"Age": None}, {"Age": None}])).and_return(
+            None
+        )
+        manager.openshift.should_receive("iter_workflows").with_args(
+            namespace="thoth"
+        ).and_return(
+            iter(
+                [{"status": {"startedAt": "2020-10-01T10:00:00Z"}}, {"status": {}}, {}]
+            )
+        )
+
+        assert manager.get_pending_workflows("thoth") == 2
+        assert manager.get_pending_workflows("thoth") == 2
+
+    def test_submit_workflows_from_template(self) -> None:
+        """Test the template is retrieved once and Workflows are submitted, failures are reported per Workflow."""
+        workflow = Workflow.from_file(self._WORKFLOW_FILE).to_dict()
+        template = {"parameters": [{"name": "NAME"}]}
+
+        def set_template_parameters(template, **parameters):  # type: ignore
+            template["parameters"][0]["value"] = parameters["NAME"]
+
+        def submit_workflow(namespace, wf, parameters, raw):  # type: ignore
+            assert namespace == "thoth-middletier"
+            assert raw is True
+            if wf["metadata"]["name"] == "solver-2":
+                raise RuntimeError("Failed to submit")
+            return wf["metadata"]["name"]
+
+        manager = WorkflowManager.__new__(WorkflowManager)
+        manager.openshift = flexmock(http_pool_maxsize=2)
+        manager.openshift.should_receive("_get_template").with_args(
+            "template=solver", namespace="thoth-infra"
+        ).and_return(template).once()
+        manager.openshift.should_receive("set_template_parameters").replace_with(
+            set_template_parameters
+        )
+        manager.openshift.should_receive("process_template").replace_with(
+            lambda namespace, item: {
+                "objects": [
+                    dict(workflow, metadata={"name": item["parameters"][0]["value"]},)
+                ]
+            }
+        )
+        flexmock(manager).should_receive("submit_workflow").replace_with(
+            submit_workflow
+        )
+        manager.admission = AdmissionController(
+            lambda namespace: 0, policy="reject", refresh_interval=60
+        )
+
+        results = manager.submit_workflows_from_template(
+            "thoth-infra",
+            "template=solver",
+            template_parameters=[{"NAME": f"solver-{i}"} for i in range(4)],
+            workflow_namespace="thoth-middletier",
+            workflow_limit=4,
+        )
+
+        assert results[:2] == ["solver-0", "solver-1"]
+        assert isinstance(results[2], RuntimeError)
+        assert results[3] == "solver-3"
+        assert "value" not in template["parameters"][0]
+        # The Workflow which failed to be submitted does not count towards the limit.
+        assert manager.admission.active("thoth-middletier") == 3
+
+    def test_get_workflow_cached(self) -> None:
+        """Test Workflows which finished are served from cache while master states the same uid."""
+        workflow = Workflow.from_file(self._WORKFLOW_FILE)
+        workflow.metadata.uid = "uid-1"
+        workflow.status = {"phase": "Succeeded"}
+        recreated = Workflow.from_file(self._WORKFLOW_FILE)
+        recreated.metadata.uid = "uid-2"
+        recreated.status = {"phase": "Running"}
+
+        manager = WorkflowManager.__new__(WorkflowManager)
+        manager.openshift = OpenShift.__new__(OpenShift)
+        manager.openshift.workflow_cache = WorkflowCache(1024 * 1024)
+        manager.openshift.workflow_informer = False
+        flexmock(manager.openshift).should_receive("_get_workflow_metadata").with_args(
+            "test", "thoth"
+        ).and_return({"uid": "uid-1"}).and_return({"uid": "uid-2"}).twice()
+        manager.api = flexmock()
+        manager.api.should_receive("get_namespaced_workflow").with_args(
+            namespace="thoth", name="test"
+        ).and_return(workflow).and_return(recreated).twice()
+
+        assert manager.get_workflow("thoth", "test")["metadata"]["uid"] == "uid-1"
+        assert manager.get_workflow("thoth", "test")["status"]["phase"] == "Succeeded"
+        assert manager.get_workflow("thoth", "test")["metadata"]["uid"] == "uid-2"
+        assert len(manager.openshift.workflow_cache) == 0
+
+    def test_get_workflows_info_projected(self) -> None:
+        """Test only fields needed to report Workflow info are deserialized."""
+        workflow = {
+            "apiVersion": "argoproj.io/v1alpha1",
+            "kind": "Workflow",
+            "metadata": {
+                "name": "adviser-1",
+                "labels": {"component": "adviser"},
+                "annotations": {"description": "x" * 1024},
+            },
+            "spec": {
+                "templates": [
+                    {
+                        "name": "main",
+                        "dag": {"tasks": [{"name": "advise", "template": "advise"}]},
+                    },
+                    {
+                        "name": "advise",
+                        "container": {"image": "adviser", "args": ["advise"]},
+                    },
+                ]
+            },
+            "status": {
+                "phase": "Succeeded",
+                "startedAt": "2020-10-01T10:00:00Z",
+                "finishedAt": "2020-10-01T10:01:00Z",
+                "nodes": {
+                    "adviser-1-1": {
+                        "id": "adviser-1-1",
+                        "name": "adviser-1.advise",
+                        "displayName": "advise",
+                        "type": "Pod",
+                        "phase": "Succeeded",
+                        "startedAt": "2020-10-01T10:00:00Z",
+                        "finishedAt": "2020-10-01T10:00:30Z",
+                        "outputs": {"parameters": [{"name": "result", "value": "{}"}]},
+                    }
+                },
+            },
+        }
+
+        response = flexmock(
+            data=json.dumps({"metadata": {}, "items": [workflow]}).encode()
+        )
+        response.should_receive("release_conn").twice()
+
+        manager = WorkflowManager.__new__(WorkflowManager)
+        manager.openshift = flexmock(list_page_size=500, workflow_cache=None)
+        manager.api = flexmock(api_client=flexmock(client.ApiClient()))
+        manager.api.api_client.should_receive("call_api").with_args(
+            "/apis/argoproj.io/v1alpha1/namespaces/{namespace}/workflows",
+            "GET",
+            path_params={"namespace": "thoth"},
+            query_params=[("limit", 500)],
+            header_params={"Accept": "application/json"},
+            response_type="V1alpha1WorkflowList",
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False,
+        ).and_return(response).twice()
+
+        info = manager.get_workflows_info("thoth")["adviser-1"]
+
+        assert info["phase"] == "Succeeded"
+        assert info["duration"] == 60
+        assert info["labels"] == {"component": "adviser"}
+        assert info["nodes"]["adviser-1-1"]["duration"] == 30
+
+        workflows = manager.get_workflows(
+            "thoth", fields=WorkflowManager.WORKFLOW_INFO_FIELDS
+        )
+        item = workflows["items"][0]
+        assert item["metadata"]["annotations"] is None
+        assert item["spec"]["templates"][1]["container"] is None
+        assert item["status"]["nodes"]["adviser-1-1"]["outputs"] is None
+
+    def test_submit_lazy_workflow(self) -> None:
+        """Test only parts of a lazy Workflow accessed are created and serialized again on submit."""
+        obj = yaml.safe_load(self._ADVISER_WORKFLOW_FILE.read_text())
+        templates = obj["spec"]["templates"]
+        wf = LazyWorkflow(obj)
+
+        assert wf.name == "adviser-201016201530-a1b2c3d4e5f6a7b8"
+        assert wf.to_body()["spec"] is obj["spec"]
+        assert wf.to_dict() == self._deserialize_api_client(obj).to_dict()
+
+        manager = WorkflowManager.__new__(WorkflowManager)
+        submitted = self._mock_submit(manager)
+
+        assert (
+            manager.submit_workflow(
+                "thoth",
+                wf,
+                parameters={"THOTH_JOB_ID": "adviser-1"},
+                labels={"mark": "1"},
+            )
+            == wf.name
+        )
+
+        body = submitted[0]
+        assert body["spec"]["templates"] is templates
+        assert body["spec"]["arguments"]["parameters"][0] == {
+            "name": "THOTH_JOB_ID",
+            "value": "adviser-1",
+        }
+        assert len(body["spec"]["arguments"]["parameters"]) == 10
+        assert body["metadata"]["labels"]["mark"] == "1"
+        assert body["metadata"]["labels"]["component"] == "adviser"
+        assert body["status"] is obj["status"]
+
+    def test_lazy_workflow_to_body(self) -> None:
+        """Test the dict wrapped is not shared with the body, values only read are kept as sent."""
+        obj = yaml.safe_load(self._ADVISER_WORKFLOW_FILE.read_text())
+        wf = LazyWorkflow(obj)
+
+        body = wf.to_body()
+        assert body == obj
+        assert body is not obj
+
+        assert wf.status.started_at.year == 2020
+        assert wf.to_body()["status"]["startedAt"] == "2020-10-16T20:15:30Z"
+
+        wf.status.started_at = wf.status.started_at.replace(year=2021)
+        assert wf.to_body()["status"]["startedAt"] == "2021-10-16T20:15:30+00:00"
+        assert obj["status"]["startedAt"] == "2020-10-16T20:15:30Z"
+
+    def test_submit_workflow_raw(self) -> None:
+        """Test a Workflow dict is submitted with parameters merged, without creating models."""
+        obj = yaml.safe_load(self._ADVISER_WORKFLOW_FILE.read_text())
+        manager = WorkflowManager.__new__(WorkflowManager)
+        submitted = self._mock_submit(manager)
+        flexmock(Workflow).should_receive("from_dict").never()
+
+        name = manager.submit_workflow(
+            "thoth",
+            obj,
+            parameters={
+                "THOTH_ADVISER_ORIGIN": "https://github.com/thoth-station/common"
+            },
+            raw=True,
+        )
+
+        assert name == obj["metadata"]["name"]
+        body = submitted[0]
+        assert body["spec"]["templates"] is obj["spec"]["templates"]
+        assert body["spec"]["activeDeadlineSeconds"] == 3600
+        assert [p["name"] for p in body["spec"]["arguments"]["parameters"]] == [
+            "THOTH_ADVISER_ORIGIN"
+        ] + [
+            p["name"]
+            for p in obj["spec"]["arguments"]["parameters"]
+            if p["name"] != "THOTH_ADVISER_ORIGIN"
+        ]
+        assert body["spec"]["arguments"]["parameters"][0]["value"] == (
+            "https://github.com/thoth-station/common"
+        )
+        assert obj["spec"]["arguments"]["parameters"][7]["value"] == (
+            "https://github.com/thoth-station/adviser"
+        )
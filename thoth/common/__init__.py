@@ -17,30 +17,67 @@
 
 """Shared code across Thoth analyzers."""
 
-from .config import HardwareInformation
-from .config import OperatingSystem
-from .config import RuntimeEnvironment
-from .enums import ThothAdviserIntegrationEnum
-from .helpers import Lazy
-from .helpers import cwd
-from .helpers import datetime2datetime_str
-from .helpers import datetime_str2timestamp
-from .helpers import datetime_str_from_timestamp
-from .helpers import get_justification_link
-from .helpers import get_service_account_token
-from .helpers import parse_datetime
-from .helpers import timestamp2datetime
-from .json import SafeJSONEncoder
-from .logging import init_logging
-from .openshift import OpenShift
-from .workflows import Workflow
-from .workflows import WorkflowManager
+import importlib
+
+from typing import Any
+from typing import List
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_openshift import AsyncOpenShift
+    from .config import HardwareInformation
+    from .config import OperatingSystem
+    from .config import RuntimeEnvironment
+    from .enums import ThothAdviserIntegrationEnum
+    from .helpers import Lazy
+    from .helpers import cwd
+    from .helpers import datetime2datetime_str
+    from .helpers import datetime_str2timestamp
+    from .helpers import datetime_str_from_timestamp
+    from .helpers import get_justification_link
+    from .helpers import get_service_account_token
+    from .helpers import parse_datetime
+    from .helpers import timestamp2datetime
+    from .json import SafeJSONEncoder
+    from .logging import init_logging
+    from .openshift import OpenShift
+    from .quantity import Quantity
+    from .workflows import LazyWorkflow
+    from .workflows import Workflow
+    from .workflows import WorkflowManager
 
 __name__ = "thoth-common"
 __version__ = "0.20.6"
 
+# Modules providing symbols exposed, modules are imported on the first access to a symbol (PEP 562)
+# so that users do not pay for importing heavy dependencies they do not use.
+_LAZY_ATTRIBUTES = {
+    "AsyncOpenShift": "async_openshift",
+    "cwd": "helpers",
+    "datetime2datetime_str": "helpers",
+    "datetime_str2timestamp": "helpers",
+    "datetime_str_from_timestamp": "helpers",
+    "get_justification_link": "helpers",
+    "get_service_account_token": "helpers",
+    "HardwareInformation": "config",
+    "init_logging": "logging",
+    "Lazy": "helpers",
+    "LazyWorkflow": "workflows",
+    "OpenShift": "openshift",
+    "OperatingSystem": "config",
+    "parse_datetime": "helpers",
+    "Quantity": "quantity",
+    "RuntimeEnvironment": "config",
+    "SafeJSONEncoder": "json",
+    "ThothAdviserIntegrationEnum": "enums",
+    "timestamp2datetime": "helpers",
+    "Workflow": "workflows",
+    "WorkflowManager": "workflows",
+}
+
 
 __all__ = [
+    "AsyncOpenShift",
     "cwd",
     "datetime2datetime_str",
     "datetime_str2timestamp",
@@ -50,9 +87,11 @@ __all__ = [
     "HardwareInformation",
     "init_logging",
     "Lazy",
+    "LazyWorkflow",
     "OpenShift",
     "OperatingSystem",
     "parse_datetime",
+    "Quantity",
     "RuntimeEnvironment",
     "SafeJSONEncoder",
     "ThothAdviserIntegrationEnum",
@@ -60,3 +99,19 @@ __all__ = [
     "Workflow",
     "WorkflowManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the given symbol on its first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__package__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List symbols available in this module, including the ones not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Admission control of Workflows submitted, to prevent flooding Argo workflow controller."""
+
+import collections
+import logging
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from .exceptions import ConfigurationError
+from .exceptions import WorkflowLimitExceeded
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Admit Workflows to a namespace only if the number of active (pending or running) Workflows is under a limit.
+
+    Counts of active Workflows are obtained at most once per `refresh_interval` seconds per namespace, Workflows
+    admitted in the meantime are accounted locally. Based on policy, a submission exceeding the limit is:
+
+    * block - waits until the number of active Workflows drops, at most `timeout` seconds
+    * queue - waits as in the case of block, but submissions are admitted in the order they arrived
+    * reject - fails immediately
+    """
+
+    POLICIES = frozenset(("block", "queue", "reject"))
+
+    def __init__(
+        self,
+        count_active: Callable[[str], int],
+        *,
+        policy: str = "block",
+        timeout: float = 300.0,
+        refresh_interval: float = 5.0,
+    ) -> None:
+        """Initialize admission controller, active Workflows in a namespace are counted by the given callable."""
+        if policy not in self.POLICIES:
+            raise ConfigurationError(
+                f"Unknown admission policy {policy!r}, available policies are: {', '.join(sorted(self.POLICIES))}"
+            )
+
+        self.policy = policy
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self.rejected = 0
+        self._count_active = count_active
+        # Namespace -> [time of counting, active Workflows counted + Workflows admitted since then].
+        self._counts: Dict[str, List[float]] = {}
+        # Namespace -> Workflows admitted (or released) while active Workflows are being counted.
+        self._refreshing: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[object]] = {}
+        self._condition = threading.Condition()
+
+    def _active(self, namespace: str) -> int:
+        """Get number of active Workflows in the namespace, called with the lock held.
+
+        The lock is released while active Workflows are counted on master so that other namespaces are not blocked.
+        """
+        while True:
+            counted = self._counts.get(namespace)
+            if counted is not None and (
+                namespace in self._refreshing
+                or time.monotonic() - counted[0] < self.refresh_interval
+            ):
+                return int(counted[1])
+
+            if namespace not in self._refreshing:
+                break
+
+            # Counted for the first time by another thread, wait for the result.
+            self._condition.wait(self.refresh_interval)
+
+        self._refreshing[namespace] = 0
+        active: Optional[int] = None
+        self._condition.release()
+        try:
+            active = self._count_active(namespace)
+        finally:
+            self._condition.acquire()
+            adjusted = self._refreshing.pop(namespace)
+            if active is not None:
+                self._counts[namespace] = [time.monotonic(), active + adjusted]
+            self._condition.notify_all()
+
+        return int(self._counts[namespace][1])
+
+    def _adjust(self, namespace: str, delta: int) -> None:
+        """Account Workflows admitted or released locally, called with the lock held."""
+        counted = self._counts.get(namespace)
+        if counted is not None:
+            counted[1] = max(counted[1] + delta, 0)
+        if namespace in self._refreshing:
+            self._refreshing[namespace] += delta
+
+    def active(self, namespace: str) -> int:
+        """Get number of active Workflows in the namespace, including Workflows admitted since last counted."""
+        with self._condition:
+            return self._active(namespace)
+
+    def admit(
+        self, namespace: str, limit: int, *, timeout: Optional[float] = None
+    ) -> None:
+        """Admit a Workflow to the namespace respecting the limit of active Workflows, based on policy.
+
+        :raises WorkflowLimitExceeded: if the Workflow was rejected or not admitted in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        ticket = object()
+
+        with self._condition:
+            queue = self._queues.setdefault(namespace, collections.deque())
+            queue.append(ticket)
+            try:
+                while True:
+                    turn = self.policy != "queue" or queue[0] is ticket
+                    if turn and self._active(namespace) < limit:
+                        self._adjust(namespace, 1)
+                        return
+
+                    remaining = deadline - time.monotonic()
+                    if self.policy == "reject" or remaining <= 0:
+                        self.rejected += 1
+                        raise WorkflowLimitExceeded(
+                            f"Limit of {limit} active Workflows in namespace {namespace!r} reached, "
+                            f"Workflow not admitted (policy {self.policy!r})"
+                        )
+
+                    _LOGGER.debug(
+                        "Limit of %d active Workflows in namespace %r reached, waiting for admission",
+                        limit,
+                        namespace,
+                    )
+                    self._condition.wait(min(remaining, self.refresh_interval))
+            finally:
+                queue.remove(ticket)
+                self._condition.notify_all()
+
+    def release(self, namespace: str) -> None:
+        """Release a Workflow admitted to the namespace which was not submitted, e.g. as its submission failed."""
+        with self._condition:
+            self._adjust(namespace, -1)
+            self._condition.notify_all()
+
+    @contextmanager
+    def admitted(
+        self, namespace: str, limit: Optional[int], *, timeout: Optional[float] = None
+    ) -> Iterator[None]:
+        """Admit a Workflow to the namespace if limit is set, release it if submission in the block fails.
+
+        :raises WorkflowLimitExceeded: if the Workflow was rejected or not admitted in time
+        """
+        if limit is None:
+            yield
+            return
+
+        self.admit(namespace, limit, timeout=timeout)
+        try:
+            yield
+        except BaseException:
+            self.release(namespace)
+            raise
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Interaction with OpenShift Master from asyncio applications."""
+
+import asyncio
+import json
+import logging
+import os
+import ssl
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from .exceptions import ConfigurationError
+from .exceptions import NotFoundException
+from .exceptions import ThothCommonException
+from .openshift import OpenShift
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncOpenShift:
+    """Interaction with OpenShift Master using coroutines.
+
+    Configuration (in-cluster or kubeconfig based) is loaded the same way as in `OpenShift`, all the requests
+    are done on a single connection pool shared by coroutines with a bounded number of requests in flight.
+    """
+
+    def __init__(
+        self,
+        openshift: Optional[OpenShift] = None,
+        *,
+        max_concurrency: Optional[int] = None,
+        **openshift_kwargs: Any,
+    ) -> None:
+        """Initialize asynchronous client, configuration is taken from the given or a newly created OpenShift."""
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "Unable to import aiohttp package, install thoth-common[async] to use asynchronous OpenShift client"
+            ) from exc
+
+        self.openshift = openshift or OpenShift(**openshift_kwargs)
+        self.max_concurrency = (
+            max_concurrency
+            if max_concurrency is not None
+            else int(os.getenv("THOTH_OPENSHIFT_ASYNC_MAX_CONCURRENCY", 64))
+        )
+        if self.max_concurrency < 1:
+            raise ConfigurationError(
+                f"Maximum number of concurrent requests has to be a positive number, got {self.max_concurrency}"
+            )
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncOpenShift":
+        """Enter the asynchronous context, connections are closed on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close connections kept open to the master."""
+        await self.close()
+
+    def _ssl_context(self) -> Any:
+        """Create SSL context used to communicate with the master, respecting TLS verification configuration."""
+        if not self.openshift.kubernetes_verify_tls:
+            return False
+
+        return ssl.create_default_context(
+            cafile=self.openshift.configuration.ssl_ca_cert or None
+        )
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Access HTTP session with a connection pool shared by all the coroutines, created lazily."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=self._ssl_context(),
+                force_close=not self.openshift.http_keep_alive,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Authorization": "Bearer {}".format(self.openshift.token),
+                    "Content-Type": "application/json",
+                },
+            )
+
+        return self._session
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Access semaphore bounding number of requests in flight, created lazily in the running event loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Close HTTP connections kept open to the master."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _http_request(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> Tuple[int, str]:
+        """Perform an HTTP request to the master, return status code and body of the response.
+
+        Requests failing on connection errors are retried as done by the synchronous client.
+        """
+        import aiohttp
+
+        attempt = 0
+        async with self.semaphore:
+            while True:
+                try:
+                    async with self.session.request(
+                        method, endpoint, **kwargs
+                    ) as response:
+                        return response.status, await response.text()
+                except aiohttp.ClientConnectionError as exc:
+                    if attempt >= self.openshift.http_retries:
+                        raise
+
+                    backoff = 0.2 * (2 ** attempt)
+                    attempt += 1
+                    _LOGGER.warning(
+                        "Request to %r failed, retrying in %g seconds (attempt %d/%d): %s",
+                        endpoint,
+                        backoff,
+                        attempt,
+                        self.openshift.http_retries,
+                        str(exc),
+                    )
+                    await asyncio.sleep(backoff)
+
+    @staticmethod
+    def _raise_for_status(status: int, text: str, what: str) -> None:
+        """Raise an exception if the given response status signalizes an error."""
+        if status >= 400:
+            _LOGGER.error(
+                "Error response from master when obtaining %s: %s", what, text
+            )
+            raise ThothCommonException(
+                f"Failed to obtain {what}, master responded with status code {status}: {text}"
+            )
+
+    async def _get_object(
+        self, path: str, what: str, params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Get an object or a list of objects from master, raise NotFoundException if not found."""
+        status, text = await self._http_request(
+            "GET", f"{self.openshift.openshift_api_url}{path}", params=params
+        )
+        if status == 404:
+            raise NotFoundException(f"The given {what} could not be found")
+
+        self._raise_for_status(status, text, what)
+
+        result: Dict[str, Any] = json.loads(text)
+        return result
+
+    async def get_pod_log(
+        self,
+        pod_id: str,
+        namespace: Optional[str] = None,
+        container: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get log of a pod based on assigned pod ID."""
+        if not namespace:
+            if not self.openshift.middletier_namespace:
+                raise ConfigurationError(
+                    "Middletier namespace is required to check log of pods run in this namespace"
+                )
+            namespace = self.openshift.middletier_namespace
+
+        params = None
+        if container:
+            params = {"container": container}
+
+        endpoint = "{}/api/v1/namespaces/{}/pods/{}/log".format(
+            self.openshift.openshift_api_url, namespace, pod_id,
+        )
+
+        status, text = await self._http_request("GET", endpoint, params=params)
+        if status == 404:
+            raise NotFoundException(
+                f"Pod with id {pod_id} was not found in namespace {namespace}"
+            )
+
+        if status == 400:
+            message = json.loads(text)["message"]
+            if "a container name must be specified for pod" not in message:
+                # If Pod has not been initialized yet, there is returned 400 status code. Return None in this case.
+                return None
+
+            raise ThothCommonException(
+                f"Failed to obtain logs, container name has to be specified: {message}"
+            )
+
+        self._raise_for_status(status, text, "logs for pod")
+        return text
+
+    async def get_build_log(self, build_id: str, namespace: str) -> str:
+        """Get log of a build in the given namespace."""
+        endpoint = "{}/apis/build.openshift.io/v1/namespaces/{}/builds/{}/log".format(
+            self.openshift.openshift_api_url, namespace, build_id
+        )
+
+        status, text = await self._http_request("GET", endpoint)
+        if status == 404:
+            raise NotFoundException(
+                f"Build with id {build_id} was not found in namespace {namespace}"
+            )
+
+        self._raise_for_status(status, text, "build log")
+        return text
+
+    async def get_pod_status(self, pod_id: str, namespace: str) -> Dict[str, Any]:
+        """Get status entry for a pod - low level routine."""
+        try:
+            pod = await self._get_object(
+                f"/api/v1/namespaces/{namespace}/pods/{pod_id}", "pod"
+            )
+        except NotFoundException as exc:
+            raise NotFoundException(
+                f"The given pod with id {pod_id} could not be found"
+            ) from exc
+
+        return OpenShift._pod_state(pod)
+
+    async def get_pod_status_report(
+        self, pod_id: str, namespace: str
+    ) -> Dict[str, Optional[str]]:
+        """Get pod state and convert it to a user-friendly response."""
+        state = await self.get_pod_status(pod_id, namespace)
+        return OpenShift._status_report(state)
+
+    async def get_job_status(self, job_id: str, namespace: str) -> Dict[str, Any]:
+        """Get status of a Job and Pods created by the Job.
+
+        :raises: NotFoundError if no Job of such name is found in the namespace
+        """
+        try:
+            job = await self._get_object(
+                f"/apis/batch/v1/namespaces/{namespace}/jobs/{job_id}", "job"
+            )
+        except NotFoundException as exc:
+            raise NotFoundException(
+                f"Job {job_id!r} not found in namespace {namespace!r}"
+            ) from exc
+
+        return OpenShift._job_status(job)
+
+    async def get_job_status_report(
+        self, job_id: str, namespace: str
+    ) -> Dict[str, Any]:
+        """Get status report of a Job and Pods created by the Job."""
+        report, pods = await asyncio.gather(
+            self.get_job_status(job_id, namespace),
+            self._get_object(
+                f"/api/v1/namespaces/{namespace}/pods",
+                "pods",
+                params={"labelSelector": f"job-name={job_id}"},
+            ),
+        )
+
+        items: List[Dict[str, Any]] = pods.get("items") or []
+        if not items:
+            raise NotFoundException(f"Job with the given id {job_id} was not found")
+
+        # Pods listed carry their status, no need to query them one by one.
+        report["pods"] = [
+            OpenShift._status_report(OpenShift._pod_state(pod)) for pod in items
+        ]
+        return report
+
+    async def get_workflow(
+        self,
+        name: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get Workflow from a namespace, use one of name or label_selector to identify which one to get."""
+        path = "/apis/argoproj.io/v1alpha1/namespaces/{}/workflows".format(
+            namespace or self.openshift.infra_namespace
+        )
+
+        if name:
+            if label_selector is not None:
+                _LOGGER.warning(
+                    "Only one of `name` or `label_selector` can be provided."
+                    f"Ignoring `label_selector={label_selector}`."
+                )
+
+            try:
+                return await self._get_object(f"{path}/{name}", "workflow")
+            except NotFoundException as exc:
+                raise NotFoundException(
+                    f"The given Workflow {name} could not be found"
+                ) from exc
+
+        elif label_selector:
+            try:
+                response = await self._get_object(
+                    path, "workflows", params={"labelSelector": label_selector}
+                )
+            except NotFoundException as exc:
+                raise NotFoundException(
+                    f"The given Workflow containing label {label_selector} could not be found"
+                ) from exc
+
+            items: List[Dict[str, Any]] = response.get("items") or []
+            if len(items) != 1:
+                raise RuntimeError(
+                    f"Application misconfiguration - number of templates available in namespace {namespace!r} "
+                    f"is {len(items)}, should be 1: label selector: {label_selector!r}, name: {name!r}"
+                )
+
+            return items[0]
+
+        raise ValueError("Either `name` or `label_selector` has to be provided.")
+
+    async def get_workflow_status(
+        self,
+        name: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get a Workflow status, use one of name or label_selector to identify which one to get."""
+        wf = await self.get_workflow(
+            name=name, label_selector=label_selector, namespace=namespace
+        )
+        to_ret: Dict[str, Any] = wf["status"]
+        return to_ret
+
+    async def get_workflow_status_report(
+        self,
+        workflow_id: str,
+        label_selector: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> Dict[str, Optional[str]]:
+        """Get workflow status report, derived from workflow status."""
+        try:
+            wf_status = await self.get_workflow_status(
+                name=workflow_id, label_selector=label_selector, namespace=namespace
+            )
+        except NotFoundException as exc:
+            raise NotFoundException(
+                f"Requested status for analysis {workflow_id!r} was not found"
+            ) from exc
+
+        return OpenShift._workflow_status_report(wf_status)
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Caches for objects obtained from OpenShift/Kubernetes master."""
+
+import copy
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# A key of a cached object - kind, namespace and label selector used to look the object up.
+ResourceCacheKey = Tuple[str, str, str]
+# Names of objects and their resource versions as reported by the master.
+ResourceVersions = FrozenSet[Tuple[str, str]]
+# A key of a cached log - kind (pod or build), namespace, name and container.
+LogCacheKey = Tuple[str, str, str, str]
+# A key of a cached Workflow - representation of the Workflow, namespace and name.
+WorkflowCacheKey = Tuple[str, str, str]
+
+
+class ResourceCache:
+    """A thread-safe cache of objects with a time-to-live, revalidated by resourceVersion once expired.
+
+    Objects stored are handed out as deep copies so callers are free to modify them.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize cache, objects are trusted for `ttl` seconds before they are revalidated."""
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: Dict[ResourceCacheKey, Tuple[Dict[str, Any], float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _object_versions(obj: Dict[str, Any]) -> ResourceVersions:
+        """Get resource version of the given object as reported by master."""
+        metadata = obj.get("metadata") or {}
+        return frozenset(
+            ((metadata.get("name") or "", metadata.get("resourceVersion") or ""),)
+        )
+
+    def get(
+        self,
+        key: ResourceCacheKey,
+        fetch: Callable[[], Dict[str, Any]],
+        revalidate: Callable[[], Iterable[Tuple[str, str]]],
+    ) -> Dict[str, Any]:
+        """Get an object from the cache, fetch it if not present or if its resource version changed.
+
+        :param key: key under which the object is cached
+        :param fetch: a callable retrieving the whole object from master
+        :param revalidate: a callable retrieving names and resource versions of objects matching the key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            obj, timestamp = entry
+            if time.monotonic() - timestamp < self.ttl:
+                with self._lock:
+                    self.hits += 1
+                return copy.deepcopy(obj)
+
+            try:
+                versions = frozenset(revalidate())
+            except Exception as exc:
+                _LOGGER.warning(
+                    "Failed to revalidate cached object %r, fetching it again: %s",
+                    key,
+                    str(exc),
+                )
+            else:
+                if versions == self._object_versions(obj):
+                    with self._lock:
+                        self.revalidations += 1
+                        self._entries[key] = (obj, time.monotonic())
+                    return copy.deepcopy(obj)
+
+        obj = fetch()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (obj, time.monotonic())
+
+        return copy.deepcopy(obj)
+
+    def invalidate(
+        self,
+        kind: Optional[str] = None,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+    ) -> int:
+        """Drop cached objects matching the given criteria, drop all objects if no criteria are given.
+
+        :returns: number of objects dropped from the cache
+        """
+        with self._lock:
+            to_remove = [
+                key
+                for key in self._entries
+                if (kind is None or key[0] == kind)
+                and (namespace is None or key[1] == namespace)
+                and (label_selector is None or key[2] == label_selector)
+            ]
+            for key in to_remove:
+                del self._entries[key]
+
+        return len(to_remove)
+
+    def __len__(self) -> int:
+        """Get number of objects cached."""
+        return len(self._entries)
+
+
+class LogCache:
+    """A bounded on-disk cache of logs which do not change anymore, e.g. logs of pods terminated.
+
+    Logs are stored compressed, least recently used logs are evicted once the size of the cache exceeds the limit.
+    Logs stored survive restarts, the same directory can be shared by processes. The directory is scanned each time
+    a log is stored, so the limit applies to logs stored by all the processes and the order of logs is given by the
+    time they were last accessed in any of the processes.
+    """
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        """Initialize cache stored in the given directory, keeping at most `max_size` bytes of compressed logs."""
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        # File name -> size, ordered from the least recently used.
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._scan()
+            self._evict()
+
+    @staticmethod
+    def _file_name(key: LogCacheKey) -> str:
+        """Get name of the file storing log under the given key."""
+        return hashlib.sha256("\0".join(key).encode()).hexdigest() + ".gz"
+
+    def _scan(self) -> None:
+        """Load logs stored in the directory, including logs stored by other processes, called with the lock held."""
+        stored = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".gz"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Evicted by another process.
+                    continue
+                stored.append((stat.st_mtime, entry.name, stat.st_size))
+
+        # Timestamps of files are coarse, logs accessed at the same time keep the order known to this process.
+        order = {name: idx for idx, name in enumerate(self._entries)}
+        stored.sort(key=lambda item: (item[0], order.get(item[1], -1), item[1]))
+        self._entries = OrderedDict((name, size) for _, name, size in stored)
+        self.size = sum(self._entries.values())
+
+    def _drop(self, name: str) -> None:
+        """Drop the given entry, called with the lock held."""
+        self.size -= self._entries.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """Evict least recently used logs until the cache fits its size, called with the lock held."""
+        while self.size > self.max_size and self._entries:
+            name = next(iter(self._entries))
+            self._drop(name)
+            self.evictions += 1
+
+    def get(self, key: LogCacheKey) -> Optional[str]:
+        """Get a log from the cache, None is returned if not cached."""
+        name = self._file_name(key)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as log_file:
+                raw = log_file.read()
+            content = gzip.decompress(raw)
+            # Keep access time for the LRU order restored on restart and shared with other processes.
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                # Not stored or evicted by another process.
+                self._drop(name)
+                self.misses += 1
+            return None
+        except (OSError, EOFError) as exc:
+            _LOGGER.warning("Dropping cached log %r: %s", path, str(exc))
+            with self._lock:
+                self._drop(name)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if name not in self._entries:
+                # Stored by another process.
+                self._entries[name] = len(raw)
+                self.size += len(raw)
+            self._entries.move_to_end(name)
+
+        return content.decode()
+
+    def put(self, key: LogCacheKey, log: str) -> None:
+        """Store a log in the cache, failures to store the log are only reported."""
+        content = gzip.compress(log.encode())
+        if len(content) > self.max_size:
+            return
+
+        name = self._file_name(key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as log_file:
+                    log_file.write(content)
+                os.replace(tmp_path, os.path.join(self.directory, name))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as exc:
+            _LOGGER.warning("Failed to store log %r in cache: %s", key, str(exc))
+            return
+
+        with self._lock:
+            self._scan()
+            # The log stored is the most recently used one, even if mtime resolution does not tell.
+            self._entries.move_to_end(name)
+            self._evict()
+
+    def metrics(self) -> Dict[str, int]:
+        """Get metrics of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size": self.size,
+            }
+
+    def __len__(self) -> int:
+        """Get number of logs cached."""
+        return len(self._entries)
+
+
+class WorkflowCache:
+    """An in-memory cache of Workflows which finished, they do not change anymore.
+
+    Workflows are kept in a representation (e.g. raw as sent by master), under their namespace and name together
+    with their uid, so Workflows re-created under the same name are not mistaken. Least recently used Workflows are
+    evicted once the estimated size of Workflows cached exceeds the memory budget.
+    """
+
+    FINISHED_PHASES = frozenset(("Succeeded", "Failed", "Error"))
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize cache keeping Workflows of estimated size of at most `max_size` bytes."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        # Key -> (uid, Workflow, estimated size), ordered from the least recently used.
+        self._entries: "OrderedDict[WorkflowCacheKey, Tuple[str, Dict[str, Any], int]]" = OrderedDict()
+        self._representations: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self, representation: str, namespace: str, name: str, uid: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a copy of a finished Workflow from the cache, None is returned if not cached.
+
+        If `uid` is given, a Workflow cached with a different uid is dropped and None is returned.
+        """
+        key = (representation, namespace, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and uid is not None and entry[0] != uid:
+                self._drop(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy.deepcopy(entry[1])
+
+    def get_uid(self, representation: str, namespace: str, name: str) -> Optional[str]:
+        """Get uid of a Workflow cached without accessing it, None is returned if not cached."""
+        with self._lock:
+            entry = self._entries.get((representation, namespace, name))
+            return entry[0] if entry is not None else None
+
+    def put(
+        self, representation: str, namespace: str, workflow: Dict[str, Any]
+    ) -> None:
+        """Store a copy of the given Workflow in the cache if it finished."""
+        metadata = workflow.get("metadata") or {}
+        name, uid = metadata.get("name"), metadata.get("uid")
+        if not name or not uid:
+            return
+
+        if (workflow.get("status") or {}).get("phase") not in self.FINISHED_PHASES:
+            self.observe(namespace, workflow)
+            return
+
+        size = len(json.dumps(workflow, default=str))
+        if size > self.max_size:
+            return
+
+        key = (representation, namespace, name)
+        workflow = copy.deepcopy(workflow)
+        with self._lock:
+            self._drop(key)
+            self._representations.add(representation)
+            self._entries[key] = (uid, workflow, size)
+            self.size += size
+            while self.size > self.max_size:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key: WorkflowCacheKey) -> None:
+        """Drop the given entry if present, called with the lock held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def invalidate(self, namespace: str, name: str, uid: Optional[str] = None) -> int:
+        """Drop Workflows of the given name in all representations, only the ones with a different uid if given.
+
+        :returns: number of Workflows dropped from the cache
+        """
+        with self._lock:
+            to_remove = []
+            for representation in self._representations:
+                key = (representation, namespace, name)
+                entry = self._entries.get(key)
+                if entry is not None and (uid is None or entry[0] != uid):
+                    to_remove.append(key)
+
+            for key in to_remove:
+                self._drop(key)
+
+        return len(to_remove)
+
+    def observe(self, namespace: str, workflow: Dict[str, Any]) -> None:
+        """Observe a Workflow as present on master, drop cached Workflows of the same name re-created since."""
+        metadata = workflow.get("metadata") or {}
+        if metadata.get("name") and metadata.get("uid"):
+            self.invalidate(namespace, metadata["name"], metadata["uid"])
+
+    def metrics(self) -> Dict[str, int]:
+        """Get metrics of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size": self.size,
+            }
+
+    def __len__(self) -> int:
+        """Get number of Workflows cached."""
+        return len(self._entries)
+
+
+class WorkflowNodeIndex:
+    """An index of nodes of a Workflow revision, mapping node attributes to node (pod) names."""
+
+    def __init__(self, workflow: Dict[str, Any]) -> None:
+        """Build index out of the given Workflow as obtained from master."""
+        metadata = workflow.get("metadata") or {}
+        self.uid: Optional[str] = metadata.get("uid")
+        self.resource_version: Optional[str] = metadata.get("resourceVersion")
+        self.by_display_name: Dict[str, List[str]] = {}
+        self.by_template_name: Dict[str, List[str]] = {}
+        self.by_boundary_id: Dict[str, List[str]] = {}
+        self.by_phase: Dict[str, List[str]] = {}
+
+        nodes = (workflow.get("status") or {}).get("nodes") or {}
+        for node_name, node in nodes.items():
+            for index, attribute in (
+                (self.by_display_name, "displayName"),
+                (self.by_template_name, "templateName"),
+                (self.by_boundary_id, "boundaryID"),
+                (self.by_phase, "phase"),
+            ):
+                value = node.get(attribute)
+                if value is not None:
+                    index.setdefault(value, []).append(node_name)
+
+    def find(
+        self,
+        *,
+        display_name: Optional[str] = None,
+        template_name: Optional[str] = None,
+        boundary_id: Optional[str] = None,
+        phase: Optional[str] = None,
+    ) -> List[str]:
+        """Find names of nodes matching all the given attributes, in the order as stated in the Workflow."""
+        result: Optional[List[str]] = None
+        for index, value in (
+            (self.by_display_name, display_name),
+            (self.by_template_name, template_name),
+            (self.by_boundary_id, boundary_id),
+            (self.by_phase, phase),
+        ):
+            if value is None:
+                continue
+
+            names = index.get(value, [])
+            if result is None:
+                result = names
+            else:
+                matching = set(names)
+                result = [name for name in result if name in matching]
+
+        if result is None:
+            raise ValueError("At least one node attribute has to be provided")
+
+        return list(result)
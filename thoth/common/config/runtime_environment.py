@@ -25,7 +25,6 @@ from typing import Dict
 from typing import Tuple
 
 import attr
-import yaml
 
 from .hardware_information import HardwareInformation
 from .operating_system import OperatingSystem
@@ -52,6 +51,8 @@ class RuntimeEnvironment:
     @classmethod
     def load(cls, content: Optional[str] = None) -> "RuntimeEnvironment":
         """Load runtime environment information from file or from a JSON representation, transparently."""
+        import yaml
+
         if content is None:
             return cls.from_dict({})
 
@@ -47,3 +47,15 @@ class KebechetInputsMissing(ThothCommonException):
 
 class SolverNameParseError(ThothCommonException):
     """Raised if unable to determine solver information out of solver name run."""
+
+
+class TemplateProcessingError(ThothCommonException):
+    """Raised if an OpenShift template cannot be processed, e.g. a required parameter is not set."""
+
+
+class TemplateNotCompilable(TemplateProcessingError):
+    """Raised if an OpenShift template cannot be processed on client side, it can be still processed by master."""
+
+
+class WorkflowLimitExceeded(WorkflowError):
+    """Raised if a Workflow is not admitted as the limit of active Workflows in a namespace was reached."""
@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Informers keeping objects of a kind in a namespace in memory, kept up to date using list and watch."""
+
+import copy
+import json
+import logging
+import queue
+import threading
+import time
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from .exceptions import ThothCommonException
+
+if TYPE_CHECKING:
+    from .openshift import OpenShift
+
+_LOGGER = logging.getLogger(__name__)
+
+# A function computing keys under which an object is indexed, or categories in which an object is counted.
+KeyFunction = Callable[[Dict[str, Any]], Iterable[str]]
+# A callable notified about changes applied to the local state - type of the change and the object changed.
+Listener = Callable[[str, Dict[str, Any]], None]
+
+# Event types as sent by master in watch responses, SYNC is used internally for (re-)listed objects.
+_SYNC = "SYNC"
+_ADDED = "ADDED"
+_MODIFIED = "MODIFIED"
+_DELETED = "DELETED"
+_BOOKMARK = "BOOKMARK"
+_ERROR = "ERROR"
+
+
+class _ResourceExpired(Exception):
+    """Raised if the resource version watched is too old, objects need to be listed again (410 Gone)."""
+
+
+def _check_label_selector(label_selector: str) -> None:
+    """Check the given label selector is equality-based, raise ValueError otherwise."""
+    for requirement in label_selector.split(","):
+        if " in " in requirement or " notin " in requirement:
+            raise ValueError(
+                f"Set-based label selectors are not supported: {label_selector!r}"
+            )
+
+
+def match_label_selector(labels: Optional[Dict[str, str]], label_selector: str) -> bool:
+    """Check whether the given labels match an equality-based label selector.
+
+    Supported requirements are `key=value`, `key==value`, `key!=value`, `key` and `!key`.
+    """
+    _check_label_selector(label_selector)
+    labels = labels or {}
+    for requirement in label_selector.split(","):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+
+        if "!=" in requirement:
+            key, value = requirement.split("!=", maxsplit=1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.replace("==", "=").split("=", maxsplit=1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:].strip() in labels:
+                return False
+        elif requirement not in labels:
+            return False
+
+    return True
+
+
+class Informer:
+    """An in-memory cache of objects of a kind in a namespace, kept up to date using list and watch.
+
+    Objects are listed first, then changes are watched starting at the resource version of the listing. If the
+    resource version is too old (410 Gone), objects are listed again. Events received are queued by a watcher
+    thread and applied to the local state by a processor thread, the number of events queued is reported as backlog.
+
+    Objects stored are never modified in place, they are replaced on changes. Indexes and counters registered
+    are maintained on each event applied, so lookups and counts do not need to walk all the objects.
+    """
+
+    def __init__(
+        self,
+        openshift: "OpenShift",
+        path: str,
+        *,
+        name: Optional[str] = None,
+        watch_timeout: int = 300,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        """Initialize informer watching objects at the given path of master API, e.g. /api/v1/namespaces/thoth/pods."""
+        self.openshift = openshift
+        self.path = path
+        self.name = name or path
+        self.watch_timeout = watch_timeout
+        self.retry_backoff = retry_backoff
+
+        self.resource_version: Optional[str] = None
+        self.relists = 0
+        self.events_processed = 0
+        self.watch_errors = 0
+
+        self._objects: Dict[str, Dict[str, Any]] = {}
+        self._indexers: Dict[str, KeyFunction] = {}
+        self._indexes: Dict[str, Dict[str, Set[str]]] = {}
+        self._counters: Dict[
+            str, Tuple[Optional[str], KeyFunction, Dict[str, int]]
+        ] = {}
+        self._listeners: List[Listener] = []
+        self._lock = threading.RLock()
+        self._queue: "queue.Queue[Optional[Tuple[str, Any, Optional[str]]]]" = queue.Queue()
+        self._last_seen: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._synced = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._response: Any = None
+
+    @property
+    def url(self) -> str:
+        """Get URL of the objects watched."""
+        return f"{self.openshift.openshift_api_url}{self.path}"
+
+    @property
+    def synced(self) -> bool:
+        """Check whether objects were listed and the local state reflects them."""
+        return self._synced.is_set() and not self._stop_event.is_set()
+
+    @property
+    def backlog(self) -> int:
+        """Get number of events received from master, not yet applied to the local state."""
+        return self._queue.qsize()
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Get number of seconds since the local state was last confirmed by master, None if never synced."""
+        if self._last_seen is None:
+            return None
+
+        return time.monotonic() - self._last_seen
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get metrics describing state of the informer."""
+        return {
+            "synced": self.synced,
+            "objects": len(self),
+            "resource_version": self.resource_version,
+            "staleness": self.staleness,
+            "backlog": self.backlog,
+            "relists": self.relists,
+            "events_processed": self.events_processed,
+            "watch_errors": self.watch_errors,
+        }
+
+    def start(self) -> None:
+        """Start listing and watching objects in background threads, no-op if already started."""
+        with self._lock:
+            if self._threads:
+                return
+
+            self._stop_event.clear()
+            self._queue = queue.Queue()
+            self._threads = [
+                threading.Thread(
+                    target=self._watch_loop,
+                    name=f"informer-watch-{self.name}",
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._process_loop,
+                    name=f"informer-process-{self.name}",
+                    daemon=True,
+                ),
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop watching objects, the local state is not served once stopped."""
+        self._stop_event.set()
+        self._queue.put(None)
+
+        response = self._response
+        if response is not None:
+            # Unblock the watcher waiting for events.
+            response.close()
+
+        with self._lock:
+            threads, self._threads = self._threads, []
+
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+        self._synced.clear()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait until objects are listed and the local state reflects them, return True if synced."""
+        return self._synced.wait(timeout) and self.synced
+
+    def get(self, name: str, *, copy_object: bool = True) -> Optional[Dict[str, Any]]:
+        """Get an object by its name, None if not present in the local state.
+
+        If `copy_object` is set to False, the object stored is returned and it must not be modified.
+        """
+        with self._lock:
+            obj = self._objects.get(name)
+
+        if obj is None or not copy_object:
+            return obj
+
+        return copy.deepcopy(obj)
+
+    def list(
+        self, label_selector: Optional[str] = None, *, copy_objects: bool = True
+    ) -> List[Dict[str, Any]]:
+        """List objects matching the given label selector.
+
+        :raises ValueError: if the label selector is set-based
+        """
+        if label_selector:
+            _check_label_selector(label_selector)
+
+        with self._lock:
+            objects = list(self._objects.values())
+
+        if label_selector:
+            objects = [
+                obj
+                for obj in objects
+                if match_label_selector(
+                    (obj.get("metadata") or {}).get("labels"), label_selector
+                )
+            ]
+
+        if copy_objects:
+            objects = copy.deepcopy(objects)
+
+        return objects
+
+    def add_index(self, index_name: str, key_function: KeyFunction) -> None:
+        """Index objects under keys computed by the given function, no-op if the index is already present."""
+        with self._lock:
+            if index_name in self._indexers:
+                return
+
+            self._indexers[index_name] = key_function
+            self._indexes[index_name] = {}
+            for name, obj in self._objects.items():
+                self._index_object(index_name, name, obj)
+
+    def by_index(
+        self, index_name: str, key: str, *, copy_objects: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get objects indexed under the given key."""
+        with self._lock:
+            objects = [
+                self._objects[name] for name in self._indexes[index_name].get(key, ())
+            ]
+
+        if copy_objects:
+            objects = copy.deepcopy(objects)
+
+        return objects
+
+    def add_counter(
+        self,
+        counter_name: str,
+        categorize: KeyFunction,
+        label_selector: Optional[str] = None,
+    ) -> None:
+        """Count objects matching the given label selector in categories computed by the given function.
+
+        Counts are updated on each event applied. No-op if the counter is already present.
+
+        :raises ValueError: if the label selector is set-based
+        """
+        if label_selector:
+            _check_label_selector(label_selector)
+
+        with self._lock:
+            if counter_name in self._counters:
+                return
+
+            self._counters[counter_name] = (label_selector, categorize, {})
+            for obj in self._objects.values():
+                self._count_object(counter_name, obj, 1)
+
+    def get_counter(self, counter_name: str) -> Dict[str, int]:
+        """Get counts of objects in categories."""
+        with self._lock:
+            return dict(self._counters[counter_name][2])
+
+    def add_listener(self, listener: Listener) -> None:
+        """Notify the given callable about objects added, modified or deleted, objects must not be modified.
+
+        Listeners are called in the processing thread, objects present after listing them again are reported
+        as modified.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _notify(self, event_type: str, obj: Dict[str, Any]) -> None:
+        """Notify listeners about a change of the local state, called with the lock held."""
+        for listener in self._listeners:
+            try:
+                listener(event_type, obj)
+            except Exception:
+                _LOGGER.exception(
+                    "Informer %r listener failed to process %r event",
+                    self.name,
+                    event_type,
+                )
+
+    def __len__(self) -> int:
+        """Get number of objects in the local state."""
+        return len(self._objects)
+
+    def _index_object(self, index_name: str, name: str, obj: Dict[str, Any]) -> None:
+        """Add the given object to an index, called with the lock held."""
+        index = self._indexes[index_name]
+        for key in self._indexers[index_name](obj):
+            index.setdefault(key, set()).add(name)
+
+    def _unindex_object(self, index_name: str, name: str, obj: Dict[str, Any]) -> None:
+        """Remove the given object from an index, called with the lock held."""
+        index = self._indexes[index_name]
+        for key in self._indexers[index_name](obj):
+            names = index.get(key)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del index[key]
+
+    def _count_object(self, counter_name: str, obj: Dict[str, Any], delta: int) -> None:
+        """Add or subtract the given object in counts, called with the lock held."""
+        label_selector, categorize, counts = self._counters[counter_name]
+        if label_selector and not match_label_selector(
+            (obj.get("metadata") or {}).get("labels"), label_selector
+        ):
+            return
+
+        for category in categorize(obj):
+            counts[category] = counts.get(category, 0) + delta
+
+    @staticmethod
+    def _object_name(obj: Dict[str, Any]) -> str:
+        """Get name of the given object, used as a key in the local state."""
+        name: str = obj["metadata"]["name"]
+        return name
+
+    def _on_replace(self, objects: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the local state with objects listed, called with the lock held."""
+        previous, self._objects = self._objects, objects
+
+        for index_name in self._indexes:
+            self._indexes[index_name] = {}
+            for name, obj in objects.items():
+                self._index_object(index_name, name, obj)
+
+        for counter_name in self._counters:
+            self._counters[counter_name][2].clear()
+            for obj in objects.values():
+                self._count_object(counter_name, obj, 1)
+
+        if self._listeners:
+            for name, obj in previous.items():
+                if name not in objects:
+                    self._notify(_DELETED, obj)
+            for obj in objects.values():
+                self._notify(_MODIFIED, obj)
+
+    def _on_event(self, event_type: str, obj: Dict[str, Any]) -> None:
+        """Apply an event received from master to the local state, called with the lock held."""
+        name = self._object_name(obj)
+
+        old = self._objects.pop(name, None)
+        if old is not None:
+            for index_name in self._indexes:
+                self._unindex_object(index_name, name, old)
+            for counter_name in self._counters:
+                self._count_object(counter_name, old, -1)
+
+        if event_type != _DELETED:
+            self._objects[name] = obj
+            for index_name in self._indexes:
+                self._index_object(index_name, name, obj)
+            for counter_name in self._counters:
+                self._count_object(counter_name, obj, 1)
+
+        self._notify(event_type, obj)
+
+    def _list(self) -> Optional[str]:
+        """List objects and queue them for replacing the local state, return resource version of the listing."""
+        response = self.openshift._http_request("GET", self.url)
+        response.raise_for_status()
+        listing = response.json()
+
+        resource_version: Optional[str] = (listing.get("metadata") or {}).get(
+            "resourceVersion"
+        )
+        self._queue.put((_SYNC, listing.get("items") or [], resource_version))
+        _LOGGER.debug(
+            "Informer %r listed %d objects at resource version %r",
+            self.name,
+            len(listing.get("items") or []),
+            resource_version,
+        )
+        return resource_version
+
+    def _watch(self, resource_version: Optional[str]) -> Optional[str]:
+        """Watch changes starting at the given resource version, return resource version of the last change seen."""
+        params = {
+            "watch": "true",
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": str(self.watch_timeout),
+        }
+        if resource_version:
+            params["resourceVersion"] = resource_version
+
+        response = self.openshift._http_request(
+            "GET",
+            self.url,
+            params=params,
+            stream=True,
+            timeout=(30, self.watch_timeout + 30),
+        )
+        self._response = response
+        try:
+            if response.status_code == 410:
+                raise _ResourceExpired
+
+            response.raise_for_status()
+            self._last_seen = time.monotonic()
+
+            for line in response.iter_lines():
+                if self._stop_event.is_set():
+                    break
+
+                if not line:
+                    continue
+
+                event = json.loads(line)
+                event_type = event.get("type")
+                obj = event.get("object") or {}
+                if event_type == _ERROR:
+                    if obj.get("code") == 410:
+                        raise _ResourceExpired
+
+                    raise ThothCommonException(
+                        f"Error watching objects of informer {self.name!r}: {obj.get('message')}"
+                    )
+
+                resource_version = (obj.get("metadata") or {}).get(
+                    "resourceVersion"
+                ) or resource_version
+                self._queue.put((event_type, obj, resource_version))
+        finally:
+            self._response = None
+            response.close()
+
+        return resource_version
+
+    def _watch_loop(self) -> None:
+        """List and watch objects until the informer is stopped."""
+        resource_version: Optional[str] = None
+        listed = False
+        while not self._stop_event.is_set():
+            try:
+                if not listed:
+                    resource_version = self._list()
+                    listed = True
+
+                resource_version = self._watch(resource_version)
+            except _ResourceExpired:
+                _LOGGER.info(
+                    "Resource version %r watched by informer %r is too old, listing objects again",
+                    resource_version,
+                    self.name,
+                )
+                listed = False
+                self.relists += 1
+            except Exception as exc:
+                if self._stop_event.is_set():
+                    break
+
+                self.watch_errors += 1
+                _LOGGER.warning(
+                    "Informer %r failed to list or watch objects, retrying in %g seconds: %s",
+                    self.name,
+                    self.retry_backoff,
+                    str(exc),
+                )
+                self._stop_event.wait(self.retry_backoff)
+
+    def _process_loop(self) -> None:
+        """Apply events queued by the watcher to the local state until the informer is stopped."""
+        while True:
+            item = self._queue.get()
+            if item is None or self._stop_event.is_set():
+                break
+
+            event_type, payload, resource_version = item
+            try:
+                with self._lock:
+                    if event_type == _SYNC:
+                        self._on_replace(
+                            {self._object_name(obj): obj for obj in payload}
+                        )
+                    elif event_type in (_ADDED, _MODIFIED, _DELETED):
+                        self._on_event(event_type, payload)
+                        self.events_processed += 1
+
+                    self.resource_version = resource_version
+            except Exception:
+                _LOGGER.exception(
+                    "Informer %r failed to process event %r", self.name, event_type
+                )
+                continue
+
+            self._last_seen = time.monotonic()
+            if event_type == _SYNC:
+                self._synced.set()
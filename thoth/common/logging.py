@@ -29,12 +29,6 @@ from typing import Dict
 from typing import Tuple
 from typing import Any
 
-from jsonformatter import JsonFormatter
-from sentry_sdk import init as sentry_sdk_init
-from sentry_sdk.integrations.logging import ignore_logger
-import daiquiri
-import daiquiri.formatter
-from rfc5424logging import Rfc5424SysLogHandler
 
 _RSYSLOG_HOST = os.getenv("RSYSLOG_HOST")
 _RSYSLOG_PORT = os.getenv("RSYSLOG_PORT")
@@ -233,6 +227,9 @@ def init_logging(
     """
     if not os.getenv("STI_SCRIPTS_PATH") or int(os.getenv("THOTH_LOGGING_NO_JSON", 0)):
         # Running outside the cluster or forced not to use structured logging.
+        import daiquiri
+        import daiquiri.formatter
+
         formatter = daiquiri.formatter.ColorFormatter(
             fmt="%(asctime)s %(process)3d %(color)s%(levelname)-8.8s %(name)s:"
             "%(lineno)d: %(message)s%(color_stop)s"
@@ -260,6 +257,8 @@ def init_logging(
             logger.propagate = True
         logging._releaseLock()  # type: ignore
 
+        from jsonformatter import JsonFormatter
+
         handler = logging.StreamHandler()
         formatter = JsonFormatter(_JSON_LOGGING_FORMAT)
         handler.setFormatter(formatter)
@@ -285,6 +284,8 @@ def init_logging(
 
     ignored_loggers = os.getenv("THOTH_SENTRY_IGNORE_LOGGER")
     if ignored_loggers:
+        from sentry_sdk.integrations.logging import ignore_logger
+
         for logger in ignored_loggers.split(","):
             ignore_logger(logger)
 
@@ -303,6 +304,8 @@ def init_logging(
                 )
 
     if _SENTRY_DSN:
+        from sentry_sdk import init as sentry_sdk_init
+
         sentry_sdk_init_kwargs = {}
         try:
             import flask  # noqa: F401
@@ -348,6 +351,8 @@ def init_logging(
             f"Setting up logging to rsyslog endpoint {_RSYSLOG_HOST}:{_RSYSLOG_PORT}"
         )
 
+        from rfc5424logging import Rfc5424SysLogHandler
+
         try:
             syslog_handler = Rfc5424SysLogHandler(
                 address=(_RSYSLOG_HOST, int(_RSYSLOG_PORT))
@@ -17,23 +17,39 @@
 
 """Handling OpenShift and Kubernetes objects across project."""
 
+import copy
+import datetime
 import os
+import hashlib
+import heapq
+import itertools
 import logging
-import requests
 import typing
 import json
+import queue
 import random
+import tempfile
+import threading
+import time
+import attr
 import urllib3
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from urllib.parse import urlparse
 
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
+from typing import Union
 
-from openshift.dynamic.exceptions import NotFoundError as OpenShiftNotFoundError
 from .exceptions import ThothCommonException
 from .exceptions import NotKnownThothIntegration
 from .exceptions import QebHwtInputsMissing
@@ -41,26 +57,111 @@ from .exceptions import KebechetInputsMissing
 from .exceptions import NotFoundException
 from .exceptions import ConfigurationError
 from .exceptions import SolverNameParseError
+from .exceptions import TemplateProcessingError
+from .helpers import parse_datetime
 from .helpers import (
     get_service_account_token,
     _get_incluster_token_file,
     _get_incluster_ca_file,
 )
 from .enums import ThothAdviserIntegrationEnum
+from .cache import LogCache
+from .cache import LogCacheKey
+from .cache import ResourceCache
+from .cache import WorkflowCache
+from .cache import WorkflowNodeIndex
+from .informer import Informer
+from .informer import Listener
+from .quantity import Quantity
+from .quantity import ResourceTotals
+from .quantity import add_resources
+from .quantity import empty_resources
+from .quantity import object_resources
+from .quantity import pod_resources
+from .templates import CompiledTemplate
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import requests
     from .workflows import WorkflowManager
 
 urllib3.disable_warnings()
 _LOGGER = logging.getLogger(__name__)
 
 
+@attr.s(slots=True, frozen=True)
+class WorkflowLogLine:
+    """A line of log of a workflow task/node, `error` is set instead if log of the node could not be obtained."""
+
+    node = attr.ib(type=str)
+    line = attr.ib(type=Optional[str], default=None)
+    error = attr.ib(type=Optional[Exception], default=None)
+
+
 class OpenShift:
     """Interaction with OpenShift Master."""
 
     _DEFAULT_WORKLOAD_LABELS = {"app": "thoth", "operator": "workload"}
+    # Label carrying fingerprint of parameters of a Workflow scheduled, used for deduplication.
+    _FINGERPRINT_LABEL = "thoth-station.ninja/fingerprint"
+    # Categories in which Jobs are counted based on their status.
+    _JOB_STATUSES = (
+        "created",
+        "active",
+        "failed",
+        "succeeded",
+        "pending",
+        "retry",
+        "waiting",
+        "started",
+    )
+    # Accept header requesting only metadata of listed objects, master falls back to full objects if not supported.
+    _PARTIAL_OBJECT_METADATA_LIST = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+    # Accept header requesting only metadata of an object, master falls back to the full object if not supported.
+    _PARTIAL_OBJECT_METADATA = (
+        "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json"
+    )
+    # Number of Workflow node indexes kept.
+    _WORKFLOW_NODE_INDEXES_MAX = 256
+    # Accept header requesting listed objects in Table format as shown by kubectl get, falls back to full objects.
+    _TABLE = (
+        "application/json;as=Table;g=meta.k8s.io;v=v1,"
+        "application/json;as=Table;g=meta.k8s.io;v=v1beta1,"
+        "application/json"
+    )
+    # Resources used by this class, they can be resolved once when the class is instantiated.
+    _PRELOADED_RESOURCES = (
+        ("v1", "Pod", None),
+        ("batch/v1", "Job", None),
+        ("v1", "ConfigMap", None),
+        ("template.openshift.io/v1", "Template", "templates"),
+        ("batch/v1beta1", "CronJob", None),
+        ("image.openshift.io/v1", "ImageStream", None),
+        ("argoproj.io/v1alpha1", "Workflow", "workflows"),
+    )
+    # Templates used to submit workflows, they are looked up in infra namespace.
+    _WORKFLOW_TEMPLATE_LABEL_SELECTORS = (
+        "template=adviser",
+        "template=build-analysis",
+        "template=dependency-monkey",
+        "template=graph-sync",
+        "template=kebechet",
+        "template=kebechet-administrator",
+        "template=kebechet-run-url",
+        "template=mi",
+        "template=package-extract",
+        "template=provenance-checker",
+        "template=qeb-hwt",
+        "template=revsolver",
+        "template=security-indicators",
+        "template=solver",
+    )
+    # Templates used to submit inspection workflows, they are looked up in Amun infra namespace.
+    _AMUN_WORKFLOW_TEMPLATE_LABEL_SELECTORS = (
+        "template=amun-inspection-workflow",
+        "template=amun-inspection-workflow-with-cpu",
+    )
 
     def __init__(
         self,
@@ -78,6 +179,23 @@ class OpenShift:
         token_file: Optional[str] = None,
         cert_file: Optional[str] = None,
         environ: Optional[Dict[str, str]] = None,
+        http_pool_maxsize: Optional[int] = None,
+        http_keep_alive: Optional[bool] = None,
+        http_retries: Optional[int] = None,
+        template_cache_ttl: Optional[float] = None,
+        local_template_processing: Optional[bool] = None,
+        discovery_cache_file: Optional[str] = None,
+        discovery_cache_ttl: Optional[float] = None,
+        preload_resources: Optional[bool] = None,
+        list_page_size: Optional[int] = None,
+        workflow_informer: Optional[bool] = None,
+        pod_informer: Optional[bool] = None,
+        job_informer: Optional[bool] = None,
+        informer_sync_timeout: Optional[float] = None,
+        dedup_window: Optional[float] = None,
+        log_cache_dir: Optional[str] = None,
+        log_cache_size: Optional[int] = None,
+        workflow_cache_size: Optional[int] = None,
     ):
         """Initialize OpenShift class responsible for handling objects in deployment."""
         try:
@@ -95,6 +213,15 @@ class OpenShift:
             int(os.getenv("KUBERNETES_VERIFY_TLS", 1)) and kubernetes_verify_tls
         )
 
+        self.discovery_cache_ttl = (
+            discovery_cache_ttl
+            if discovery_cache_ttl is not None
+            else float(os.getenv("THOTH_OPENSHIFT_DISCOVERY_CACHE_TTL", 3600))
+        )
+        discovery_cache_file = discovery_cache_file or os.getenv(
+            "THOTH_OPENSHIFT_DISCOVERY_CACHE_FILE"
+        )
+
         self.in_cluster = True
         # Try to load configuration as used in cluster. If not possible, try to load it from local configuration.
         try:
@@ -108,8 +235,12 @@ class OpenShift:
             # We need to explicitly set whether we want to verify SSL/TLS connection to the master.
             configuration = client.Configuration()
             configuration.verify_ssl = self.kubernetes_verify_tls
+            api_client = client.ApiClient(configuration=configuration)
+            self.discovery_cache_file = self._prepare_discovery_cache(
+                discovery_cache_file, api_client
+            )
             self.ocp_client = DynamicClient(
-                client.ApiClient(configuration=configuration)
+                api_client, cache_file=self.discovery_cache_file
             )
         except Exception as exc:
             _LOGGER.warning(
@@ -120,7 +251,12 @@ class OpenShift:
             k8s_client.configuration.verify_ssl = self.kubernetes_verify_tls
             k8s_client.rest_client = RESTClientObject(k8s_client.configuration)
 
-            self.ocp_client = DynamicClient(k8s_client)
+            self.discovery_cache_file = self._prepare_discovery_cache(
+                discovery_cache_file, k8s_client
+            )
+            self.ocp_client = DynamicClient(
+                k8s_client, cache_file=self.discovery_cache_file
+            )
             self.in_cluster = False
 
         self.configuration = self.ocp_client.configuration
@@ -154,12 +290,270 @@ class OpenShift:
         )
         self._token = token
 
+        # Configuration of the pooled HTTP session used for raw REST calls to the master.
+        self.http_pool_maxsize = (
+            http_pool_maxsize
+            if http_pool_maxsize is not None
+            else int(os.getenv("THOTH_OPENSHIFT_HTTP_POOL_MAXSIZE", 10))
+        )
+        self.http_keep_alive = (
+            http_keep_alive
+            if http_keep_alive is not None
+            else bool(int(os.getenv("THOTH_OPENSHIFT_HTTP_KEEP_ALIVE", 1)))
+        )
+        self.http_retries = (
+            http_retries
+            if http_retries is not None
+            else int(os.getenv("THOTH_OPENSHIFT_HTTP_RETRIES", 3))
+        )
+        self._http_session: Optional["requests.Session"] = None
+        self._http_session_lock = threading.Lock()
+
+        # Templates and CronJobs change rarely, keep them cached and revalidate them once TTL expires.
+        self.template_cache = ResourceCache(
+            ttl=template_cache_ttl
+            if template_cache_ttl is not None
+            else float(os.getenv("THOTH_OPENSHIFT_TEMPLATE_CACHE_TTL", 60))
+        )
+        # Process templates on client side instead of sending them to master, opt-in.
+        self.local_template_processing = (
+            local_template_processing
+            if local_template_processing is not None
+            else bool(int(os.getenv("THOTH_OPENSHIFT_LOCAL_TEMPLATE_PROCESSING", 0)))
+        )
+        self._compiled_templates: Dict[Tuple[str, str], CompiledTemplate] = {}
+        self._compiled_templates_lock = threading.Lock()
+
+        self._resources: Dict[Tuple[str, str, Optional[str]], Any] = {}
+        self._resources_lock = threading.Lock()
+        if (
+            preload_resources
+            if preload_resources is not None
+            else bool(int(os.getenv("THOTH_OPENSHIFT_PRELOAD_RESOURCES", 0)))
+        ):
+            self.preload_resources()
+
+        # Number of objects requested in one page when listing collections.
+        self.list_page_size = (
+            list_page_size
+            if list_page_size is not None
+            else int(os.getenv("THOTH_OPENSHIFT_LIST_PAGE_SIZE", 500))
+        )
+
+        # Serve Workflows from an in-memory state kept up to date by watching them, instead of querying master.
+        self.workflow_informer = (
+            workflow_informer
+            if workflow_informer is not None
+            else bool(int(os.getenv("THOTH_OPENSHIFT_WORKFLOW_INFORMER", 0)))
+        )
+        # Serve Pods and Jobs from in-memory state, shared by all the calls querying them.
+        self.pod_informer = (
+            pod_informer
+            if pod_informer is not None
+            else bool(int(os.getenv("THOTH_OPENSHIFT_POD_INFORMER", 0)))
+        )
+        self.job_informer = (
+            job_informer
+            if job_informer is not None
+            else bool(int(os.getenv("THOTH_OPENSHIFT_JOB_INFORMER", 0)))
+        )
+        self.informer_sync_timeout = (
+            informer_sync_timeout
+            if informer_sync_timeout is not None
+            else float(os.getenv("THOTH_OPENSHIFT_INFORMER_SYNC_TIMEOUT", 30))
+        )
+        self._informers: Dict[str, Informer] = {}
+        self._informers_lock = threading.Lock()
+        self._workflow_node_indexes: "OrderedDict[str, WorkflowNodeIndex]" = (
+            OrderedDict()
+        )
+        self._workflow_node_indexes_lock = threading.Lock()
+
+        # Reuse identical Workflows scheduled within the given number of seconds, 0 disables deduplication.
+        self.dedup_window = (
+            dedup_window
+            if dedup_window is not None
+            else float(os.getenv("THOTH_OPENSHIFT_DEDUP_WINDOW", 0))
+        )
+        self._dedup_submitted: Dict[str, Tuple[float, str]] = {}
+        self._dedup_lock = threading.Lock()
+        # Fingerprints of Workflows being scheduled, identical Workflows are scheduled one after another.
+        self._dedup_pending: Set[str] = set()
+        self._dedup_condition = threading.Condition(self._dedup_lock)
+
+        # Keep Workflows which finished in memory, they do not change anymore; 0 disables caching. Workflows
+        # cached are checked not to be deleted or re-created using the Workflow informer or their metadata.
+        # Without the Workflow informer, each lookup served from the cache still makes a GET request for the
+        # Workflow metadata - the cache saves transferring and deserializing the whole Workflow only.
+        workflow_cache_size = (
+            workflow_cache_size
+            if workflow_cache_size is not None
+            else int(os.getenv("THOTH_OPENSHIFT_WORKFLOW_CACHE_SIZE", 0))
+        )
+        self.workflow_cache: Optional[WorkflowCache] = None
+        if workflow_cache_size > 0:
+            self.workflow_cache = WorkflowCache(workflow_cache_size)
+
+        # Keep logs of pods terminated and builds completed on disk, they do not change anymore.
+        log_cache_dir = log_cache_dir or os.getenv("THOTH_OPENSHIFT_LOG_CACHE_DIR")
+        self.log_cache: Optional[LogCache] = None
+        if log_cache_dir:
+            self.log_cache = LogCache(
+                log_cache_dir,
+                max_size=log_cache_size
+                if log_cache_size is not None
+                else int(
+                    os.getenv("THOTH_OPENSHIFT_LOG_CACHE_SIZE", 256 * 1024 * 1024)
+                ),
+            )
+
         if not self.kubernetes_verify_tls:
             _LOGGER.warning(
                 "TLS verification when communicating with k8s/okd master is disabled"
             )
         self._workflow_manager: Optional["WorkflowManager"] = None
 
+    @staticmethod
+    def _get_discovery_cache_dir() -> Optional[str]:
+        """Get a directory private to the current user to keep API discovery cache in, create it if needed."""
+        cache_dir = os.path.join(
+            os.getenv("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "thoth",
+        )
+
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            if os.stat(cache_dir).st_uid != os.getuid():
+                _LOGGER.warning(
+                    "API discovery cache directory %r is not owned by the current user",
+                    cache_dir,
+                )
+                return None
+            os.chmod(cache_dir, 0o700)
+        except OSError as exc:
+            _LOGGER.warning(
+                "Failed to create API discovery cache directory %r: %s",
+                cache_dir,
+                str(exc),
+            )
+            return None
+
+        return cache_dir
+
+    def _prepare_discovery_cache(
+        self, cache_file: Optional[str], api_client: Any
+    ) -> str:
+        """Get path to the API discovery cache, drop the cache if it expired and master was upgraded.
+
+        The cache is trusted without contacting master until it is older than the configured TTL, afterwards the
+        version of master is checked and the cache is kept for another TTL if master was not upgraded.
+        """
+        from kubernetes import client
+
+        if not cache_file:
+            cache_dir = self._get_discovery_cache_dir()
+            if cache_dir is None:
+                # Do not fallback to a shared directory, API discovery is done on each instantiation.
+                cache_dir = tempfile.mkdtemp(prefix="thoth-discovery-")
+            cache_file = os.path.join(
+                cache_dir,
+                "discovery-{}.json".format(
+                    hashlib.sha256(
+                        api_client.configuration.host.encode("utf-8")
+                    ).hexdigest()[:32]
+                ),
+            )
+
+        try:
+            stat = os.stat(cache_file)
+        except OSError:
+            # No cache created yet.
+            return cache_file
+
+        if stat.st_uid != os.getuid():
+            _LOGGER.warning(
+                "Refusing to use API discovery cache %r not owned by the current user",
+                cache_file,
+            )
+            try:
+                os.remove(cache_file)
+            except OSError:
+                return os.path.join(
+                    tempfile.mkdtemp(prefix="thoth-discovery-"), "discovery.json"
+                )
+            return cache_file
+
+        if time.time() - stat.st_mtime <= self.discovery_cache_ttl:
+            return cache_file
+
+        try:
+            with open(cache_file, "r") as f:
+                cached_version = (
+                    json.load(f)
+                    .get("version", {})
+                    .get("kubernetes", {})
+                    .get("gitVersion")
+                )
+
+            # Checking version is a single small request compared to API discovery done on cache misses.
+            stale = (
+                cached_version is None
+                or cached_version
+                != client.VersionApi(api_client).get_code().git_version
+            )
+        except Exception as exc:
+            _LOGGER.warning(
+                "Failed to check API discovery cache %r: %s", cache_file, str(exc)
+            )
+            stale = True
+
+        if not stale:
+            # Master was not upgraded, keep the cache for another TTL.
+            os.utime(cache_file)
+            return cache_file
+
+        _LOGGER.debug("Dropping stale API discovery cache %r", cache_file)
+        try:
+            os.remove(cache_file)
+        except OSError as exc:
+            _LOGGER.warning(
+                "Failed to remove stale API discovery cache %r: %s",
+                cache_file,
+                str(exc),
+            )
+
+        return cache_file
+
+    def _get_resource(
+        self, api_version: str, kind: str, name: Optional[str] = None
+    ) -> Any:
+        """Get a handle to an API resource, resources are looked up once and kept."""
+        key = (api_version, kind, name)
+        resource = self._resources.get(key)
+        if resource is None:
+            kwargs = {"name": name} if name is not None else {}
+            resource = self.ocp_client.resources.get(
+                api_version=api_version, kind=kind, **kwargs
+            )
+            with self._resources_lock:
+                self._resources[key] = resource
+
+        return resource
+
+    def preload_resources(self) -> None:
+        """Resolve all the API resources used by this class, resources not available on master are skipped."""
+        for api_version, kind, name in self._PRELOADED_RESOURCES:
+            try:
+                self._get_resource(api_version, kind, name)
+            except Exception as exc:
+                _LOGGER.warning(
+                    "Failed to resolve API resource %s %r: %s",
+                    api_version,
+                    kind,
+                    str(exc),
+                )
+
     @property
     def token(self) -> str:
         """Access service account token mounted to the pod."""
@@ -174,6 +568,75 @@ class OpenShift:
 
         return self._token
 
+    @property
+    def http_session(self) -> "requests.Session":
+        """Access HTTP session with a connection pool used for raw REST calls to the master.
+
+        The session is created lazily and shared across threads, TCP and TLS connections
+        to the master are kept alive and reused across calls.
+        """
+        if self._http_session is None:
+            with self._http_session_lock:
+                if self._http_session is None:
+                    self._http_session = self._create_http_session()
+
+        return self._http_session
+
+    def _create_http_session(self) -> "requests.Session":
+        """Create a new HTTP session with a connection pool configured."""
+        import requests
+
+        # Connection errors are retried for all HTTP methods as the request did not reach master. Read errors, such
+        # as a connection reset on a connection kept alive, are retried only for idempotent methods (urllib3 default)
+        # so that POST requests creating objects are not sent twice.
+        retry = urllib3.util.retry.Retry(
+            total=self.http_retries,
+            connect=self.http_retries,
+            read=self.http_retries,
+            status=0,
+            backoff_factor=0.2,
+        )
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.http_pool_maxsize,
+            pool_maxsize=self.http_pool_maxsize,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.kubernetes_verify_tls
+        session.headers.update(
+            {
+                "Authorization": "Bearer {}".format(self.token),
+                "Content-Type": "application/json",
+            }
+        )
+        if not self.http_keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def _http_request(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> "requests.Response":
+        """Perform an HTTP request to the master using the pooled HTTP session."""
+        return self.http_session.request(method, endpoint, **kwargs)
+
+    def close(self) -> None:
+        """Stop informers and close HTTP connections kept open to the master."""
+        with self._informers_lock:
+            informers, self._informers = self._informers, {}
+
+        for informer in informers.values():
+            informer.stop()
+
+        with self._http_session_lock:
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+
     @property
     def workflow_manager(
         self,
@@ -313,13 +776,37 @@ class OpenShift:
                     }
                 )
 
-    def get_pod_log(
-        self,
-        pod_id: str,
-        namespace: Optional[str] = None,
+    @staticmethod
+    def _log_params(
+        *,
         container: Optional[str] = None,
-    ) -> Optional[str]:
-        """Get log of a pod based on assigned pod ID."""
+        follow: bool = False,
+        tail_lines: Optional[int] = None,
+        since_seconds: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+        timestamps: bool = False,
+    ) -> Optional[Dict[str, str]]:
+        """Construct query parameters for log retrieval from master."""
+        params = {}
+        if container:
+            params["container"] = container
+        if follow:
+            params["follow"] = "true"
+        if tail_lines is not None:
+            params["tailLines"] = str(tail_lines)
+        if since_seconds is not None:
+            params["sinceSeconds"] = str(since_seconds)
+        if limit_bytes is not None:
+            params["limitBytes"] = str(limit_bytes)
+        if timestamps:
+            params["timestamps"] = "true"
+
+        return params or None
+
+    def _pod_log_response(
+        self, pod_id: str, namespace: Optional[str], stream: bool, **log_options: Any
+    ) -> Optional["requests.Response"]:
+        """Request log of a pod from master, return None if the pod has not been initialized yet."""
         if not namespace:
             if not self.middletier_namespace:
                 raise ConfigurationError(
@@ -327,31 +814,20 @@ class OpenShift:
                 )
             namespace = self.middletier_namespace
 
-        params = None
-        if container:
-            params = {"container": container}
-
         # TODO: rewrite to OpenShift rest client once it will support it.
         endpoint = "{}/api/v1/namespaces/{}/pods/{}/log".format(
             self.openshift_api_url, namespace, pod_id,
         )
 
-        response = requests.get(
-            endpoint,
-            headers={
-                "Authorization": "Bearer {}".format(self.token),
-                "Content-Type": "application/json",
-            },
-            verify=self.kubernetes_verify_tls,
-            params=params,
+        response = self._http_request(
+            "GET", endpoint, params=self._log_params(**log_options), stream=stream
         )
         _LOGGER.debug(
-            "Kubernetes master response for pod log (%d): %r",
-            response.status_code,
-            response.text,
+            "Kubernetes master response for pod log (%d)", response.status_code,
         )
 
         if response.status_code == 404:
+            response.close()
             raise NotFoundException(
                 f"Pod with id {pod_id} was not found in namespace {namespace}"
             )
@@ -362,37 +838,209 @@ class OpenShift:
             not in response.json()["message"]
         ):
             # If Pod has not been initialized yet, there is returned 400 status code. Return None in this case.
+            response.close()
             return None
         elif response.status_code == 400:
+            message = response.json()["message"]
+            response.close()
             raise ThothCommonException(
-                f"Failed to obtain logs, container name has to be specified: {response.json()['message']}"
+                f"Failed to obtain logs, container name has to be specified: {message}"
             )
 
         try:
             response.raise_for_status()
         except Exception as exc:
-            _LOGGER.error("Error response when obtaining pod logs: %r", response.json())
+            try:
+                _LOGGER.error(
+                    "Error response when obtaining pod logs: %r", response.json()
+                )
+            finally:
+                response.close()
             raise ThothCommonException(
                 f"Failed to obtain logs for pod: {str(exc)}"
             ) from exc
 
-        return response.text
+        return response
+
+    def get_pod_log(
+        self,
+        pod_id: str,
+        namespace: Optional[str] = None,
+        container: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get log of a pod based on assigned pod ID, logs of pods terminated are cached if enabled."""
+        namespace = namespace or self.middletier_namespace
+        cache_key: Optional[LogCacheKey] = None
+        if self.log_cache is not None and namespace:
+            cache_key = ("pod", namespace, pod_id, container or "")
+            cached = self.log_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # The log obtained is complete only if the pod terminated before asking for it.
+            if not self._is_pod_terminated(pod_id, namespace):
+                cache_key = None
+
+        response = self._pod_log_response(
+            pod_id, namespace, stream=False, container=container
+        )
+        if response is None:
+            return None
+
+        _LOGGER.debug("Obtained pod log of size %d bytes", len(response.content))
+        log = response.text
+        if self.log_cache is not None and cache_key is not None:
+            self.log_cache.put(cache_key, log)
+
+        return log
+
+    def _is_pod_terminated(self, pod_id: str, namespace: str) -> bool:
+        """Check if the given pod terminated, so its logs do not change anymore."""
+        informer = self._get_pod_informer(namespace)
+        pod = informer.get(pod_id, copy_object=False) if informer is not None else None
+        if pod is None:
+            try:
+                pod = (
+                    self._get_resource("v1", "Pod")
+                    .get(namespace=namespace, name=pod_id)
+                    .to_dict()
+                )
+            except Exception as exc:
+                _LOGGER.debug("Failed to obtain pod %r: %s", pod_id, str(exc))
+                return False
+
+        return (pod.get("status") or {}).get("phase") in ("Succeeded", "Failed")
+
+    def iter_pod_log(
+        self,
+        pod_id: str,
+        namespace: Optional[str] = None,
+        container: Optional[str] = None,
+        *,
+        follow: bool = False,
+        tail_lines: Optional[int] = None,
+        since_seconds: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+        timestamps: bool = False,
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """Stream log of a pod based on assigned pod ID, yield raw chunks as sent by master.
+
+        Nothing is yielded if the pod has not been initialized yet. With `follow` set, chunks are yielded
+        as the pod produces logs until the container terminates.
+        """
+        response = self._pod_log_response(
+            pod_id,
+            namespace,
+            stream=True,
+            container=container,
+            follow=follow,
+            tail_lines=tail_lines,
+            since_seconds=since_seconds,
+            limit_bytes=limit_bytes,
+            timestamps=timestamps,
+        )
+        if response is None:
+            return
+
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def download_pod_log(
+        self,
+        pod_id: str,
+        path: str,
+        namespace: Optional[str] = None,
+        container: Optional[str] = None,
+        **log_options: Any,
+    ) -> int:
+        """Download log of a pod to the given file without decoding it, return number of bytes written.
+
+        Options for log retrieval are the same as for `iter_pod_log`.
+        """
+        size = 0
+        with open(path, "wb") as output_file:
+            for chunk in self.iter_pod_log(
+                pod_id, namespace=namespace, container=container, **log_options
+            ):
+                output_file.write(chunk)
+                size += len(chunk)
+
+        _LOGGER.debug("Downloaded log of pod %r to %r (%d bytes)", pod_id, path, size)
+        return size
 
     def get_workflow_pod_name(
         self, node_name: str, workflow_id: str, namespace: str
     ) -> str:
         """Get pod name where task is being executed."""
-        workflow = self.get_workflow(workflow_id, namespace=namespace)
-        nodes = workflow.get("status", {}).get("nodes", {})
-
-        for pod_name, node_info in nodes.items():
-            if node_info["displayName"] == node_name:
-                return pod_name  # type: ignore
+        pod_names = self.get_workflow_node_index(
+            workflow_id, namespace
+        ).by_display_name.get(node_name)
+        if pod_names:
+            return pod_names[0]
 
         raise NotFoundException(
             f"No node named {node_name!r} found in workflow {workflow_id!r} in namespace {namespace!r}"
         )
 
+    def get_workflow_node_index(
+        self, workflow_id: str, namespace: str
+    ) -> WorkflowNodeIndex:
+        """Get index of nodes of a workflow, mapping node attributes to pod names.
+
+        Indexes are kept per workflow uid and built again only if the resource version of the workflow changed,
+        only metadata of the workflow are obtained from master to check it.
+        """
+        informed = self._get_informed_workflow(workflow_id, None, namespace)
+        if informed is not None:
+            metadata = informed.get("metadata") or {}
+        else:
+            metadata = self._get_workflow_metadata(workflow_id, namespace)
+
+        uid = metadata.get("uid")
+        with self._workflow_node_indexes_lock:
+            index = self._workflow_node_indexes.get(uid) if uid else None
+            if index is not None and index.resource_version == metadata.get(
+                "resourceVersion"
+            ):
+                self._workflow_node_indexes.move_to_end(index.uid)  # type: ignore
+                return index
+
+        index = WorkflowNodeIndex(
+            informed
+            if informed is not None
+            else self.get_workflow(workflow_id, namespace=namespace)
+        )
+        if index.uid:
+            with self._workflow_node_indexes_lock:
+                self._workflow_node_indexes[index.uid] = index
+                self._workflow_node_indexes.move_to_end(index.uid)
+                while (
+                    len(self._workflow_node_indexes) > self._WORKFLOW_NODE_INDEXES_MAX
+                ):
+                    self._workflow_node_indexes.popitem(last=False)
+
+        return index
+
+    def _get_workflow_metadata(
+        self, workflow_id: str, namespace: str
+    ) -> Dict[str, Any]:
+        """Get metadata of a workflow, without obtaining the whole workflow if supported by master."""
+        endpoint = "{}/apis/argoproj.io/v1alpha1/namespaces/{}/workflows/{}".format(
+            self.openshift_api_url, namespace, workflow_id
+        )
+        response = self._http_request(
+            "GET", endpoint, headers={"Accept": self._PARTIAL_OBJECT_METADATA}
+        )
+        if response.status_code == 404:
+            raise NotFoundException(
+                f"The given Workflow {workflow_id} could not be found"
+            )
+
+        response.raise_for_status()
+        metadata: Dict[str, Any] = response.json().get("metadata") or {}
+        return metadata
+
     def get_workflow_node_log(
         self, node_name: str, workflow_id: str, namespace: str
     ) -> Optional[str]:
@@ -407,6 +1055,260 @@ class OpenShift:
         pod_id = self.get_workflow_pod_name(node_name, workflow_id, namespace)
         return self.get_pod_status(pod_id, namespace)
 
+    def get_workflow_nodes_status(
+        self, workflow_id: str, namespace: str
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """Get status reports of all the tasks/nodes run in pods in a workflow, keyed by node name.
+
+        Pods of the workflow are listed at once instead of obtaining them one by one for each node.
+        """
+        node_pods = self._get_workflow_node_pods(workflow_id, namespace)
+
+        label_selector = f"workflows.argoproj.io/workflow={workflow_id}"
+        informer = self._get_pod_informer(namespace)
+        pods: Optional[List[Dict[str, Any]]] = None
+        if informer is not None:
+            try:
+                pods = informer.list(label_selector)
+            except ValueError:
+                _LOGGER.debug(
+                    "Label selector %r cannot be matched by the pod informer, listing pods",
+                    label_selector,
+                )
+
+        if pods is None:
+            pods = list(self.iter_pods(namespace, label_selector=label_selector))
+
+        pod_states = {pod["metadata"]["name"]: self._pod_state(pod) for pod in pods}
+
+        # Pods not created yet are reported as being scheduled.
+        return {
+            node_name: self._status_report(pod_states.get(pod_name, {}))
+            for node_name, pod_name in node_pods.items()
+        }
+
+    def _get_workflow_node_pods(
+        self, workflow_id: str, namespace: str, phase: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Get names of pods running tasks/nodes in a workflow keyed by node name, the first node of a name wins."""
+        workflow = self.get_workflow(workflow_id, namespace=namespace)
+        nodes = (workflow.get("status") or {}).get("nodes") or {}
+
+        result: Dict[str, str] = {}
+        for pod_name, node_info in nodes.items():
+            if node_info.get("type") != "Pod":
+                continue
+
+            if phase is not None and node_info.get("phase") != phase:
+                continue
+
+            result.setdefault(node_info["displayName"], pod_name)
+
+        return result
+
+    def get_workflow_logs(
+        self, workflow_id: str, namespace: str, max_workers: Optional[int] = None
+    ) -> Dict[str, Optional[str]]:
+        """Get logs of all the tasks/nodes in a workflow, logs are obtained concurrently and keyed by node name.
+
+        Pods of nodes are resolved from a single workflow fetch, nodes which have no pod created report no log.
+        The number of concurrent requests is bounded by `max_workers`, defaults to the HTTP connection pool size.
+        """
+        node_pods = self._get_workflow_node_pods(workflow_id, namespace)
+        if not node_pods:
+            return {}
+
+        def get_log(pod_name: str) -> Optional[str]:
+            try:
+                return self.get_pod_log(pod_name, namespace=namespace, container="main")
+            except NotFoundException:
+                return None
+
+        max_workers = min(max_workers or self.http_pool_maxsize, len(node_pods))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            logs = executor.map(get_log, node_pods.values())
+            return dict(zip(node_pods, logs))
+
+    @staticmethod
+    def _log_line_timestamp(line: str) -> str:
+        """Get a sortable key out of the RFC 3339 timestamp prefixing a log line, fractions are not zero-padded."""
+        timestamp = line.split(" ", 1)[0].rstrip("Z")
+        seconds, _, fraction = timestamp.partition(".")
+        return f"{seconds}.{fraction:0<9}"
+
+    def iter_workflow_logs(
+        self,
+        workflow_id: str,
+        namespace: str,
+        *,
+        follow: bool = False,
+        reorder_window: float = 1.0,
+        chunk_size: int = 65536,
+        max_workers: Optional[int] = None,
+        buffer_size: int = 1024,
+        **log_options: Any,
+    ) -> Iterator[WorkflowLogLine]:
+        """Iterate over log lines of tasks/nodes in a workflow, merged into one stream ordered by timestamps.
+
+        Each line is prefixed with the timestamp assigned by master. A failure to obtain log of a node is reported as
+        a record with `error` set, logs of other nodes are streamed further. With `follow` set, logs of nodes running
+        are streamed until they finish, otherwise logs of all the nodes are merged. As logs are streamed
+        concurrently, each line is held back for `reorder_window` seconds to be ordered. At most `buffer_size` lines
+        read are buffered, reading is paused until they are consumed. Other options for log retrieval are the same as
+        for `iter_pod_log`.
+
+        Without `follow`, the number of logs streamed concurrently is bounded by `max_workers`, defaults to the HTTP
+        connection pool size; logs of nodes waiting for a worker are ordered only within the reorder window.
+        """
+        node_pods = self._get_workflow_node_pods(
+            workflow_id, namespace, phase="Running" if follow else None
+        )
+        lines: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+        finished = object()
+        # Responses streamed are closed once the merged stream is closed, to unblock readers waiting for a chunk.
+        responses: List["requests.Response"] = []
+        responses_lock = threading.Lock()
+
+        def put(item: Any) -> bool:
+            """Put an item into the bounded buffer, give up once the merged stream is closed."""
+            while not stop.is_set():
+                try:
+                    lines.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+
+            return False
+
+        def read(node_name: str, pod_name: str) -> None:
+            try:
+                response = self._pod_log_response(
+                    pod_name,
+                    namespace,
+                    stream=True,
+                    container="main",
+                    follow=follow,
+                    timestamps=True,
+                    **log_options,
+                )
+                if response is None:
+                    return
+
+                with response:
+                    with responses_lock:
+                        responses.append(response)
+                    if stop.is_set():
+                        return
+
+                    buffer = b""
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if stop.is_set():
+                            return
+
+                        *complete, buffer = (buffer + chunk).split(b"\n")
+                        for line in complete:
+                            entry = WorkflowLogLine(
+                                node_name, line.decode(errors="replace")
+                            )
+                            if not put(entry):
+                                return
+
+                    if buffer:
+                        put(WorkflowLogLine(node_name, buffer.decode(errors="replace")))
+            except NotFoundException:
+                _LOGGER.debug(
+                    "No log available for node %r (pod %r)", node_name, pod_name
+                )
+            except Exception as exc:
+                if stop.is_set():
+                    # The response was closed as the merged stream was closed.
+                    return
+
+                _LOGGER.warning(
+                    "Failed to obtain log of node %r in workflow %r: %s",
+                    node_name,
+                    workflow_id,
+                    str(exc),
+                )
+                put(WorkflowLogLine(node_name, error=exc))
+            finally:
+                put(finished)
+
+        # Logs followed are streamed until nodes finish, each of them needs its own worker.
+        workers = len(node_pods)
+        if not follow:
+            workers = min(max_workers or self.http_pool_maxsize, workers)
+
+        nodes = iter(list(node_pods.items()))
+        nodes_lock = threading.Lock()
+
+        def work() -> None:
+            while not stop.is_set():
+                with nodes_lock:
+                    node = next(nodes, None)
+                if node is None:
+                    return
+                read(*node)
+
+        for idx in range(workers):
+            threading.Thread(
+                target=work, name=f"workflow-log-{workflow_id}-{idx}", daemon=True,
+            ).start()
+
+        pending: List[Tuple[str, int, float, WorkflowLogLine]] = []
+        counter = itertools.count()
+        running = len(node_pods)
+        try:
+            while running or pending:
+                timeout = None
+                if pending:
+                    timeout = max(
+                        pending[0][2] + reorder_window - time.monotonic(), 0.0
+                    )
+
+                if running:
+                    try:
+                        item = lines.get(timeout=timeout)
+                    except queue.Empty:
+                        pass
+                    else:
+                        if item is finished:
+                            running -= 1
+                        else:
+                            if item.error is not None:
+                                # Ordered as if master logged the failure when it was observed.
+                                timestamp = self._log_line_timestamp(
+                                    datetime.datetime.now(
+                                        datetime.timezone.utc
+                                    ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+                                )
+                            else:
+                                timestamp = self._log_line_timestamp(item.line)
+
+                            heapq.heappush(
+                                pending,
+                                (timestamp, next(counter), time.monotonic(), item),
+                            )
+
+                # Lines are released once held back for the reorder window or if there is nothing more to wait for.
+                while pending and (
+                    not running or pending[0][2] + reorder_window <= time.monotonic()
+                ):
+                    yield heapq.heappop(pending)[3]
+        finally:
+            stop.set()
+            with responses_lock:
+                for response in responses:
+                    try:
+                        response.close()
+                    except Exception:
+                        _LOGGER.debug(
+                            "Failed to close log stream of workflow %r",
+                            workflow_id,
+                            exc_info=True,
+                        )
+
     def get_build(self, build_id: str, namespace: str) -> Dict[str, Any]:
         """Get a build in the given namespace."""
         # TODO: rewrite to OpenShift rest client once it will support it.
@@ -414,14 +1316,7 @@ class OpenShift:
             self.openshift_api_url, namespace, build_id
         )
 
-        response = requests.get(
-            endpoint,
-            headers={
-                "Authorization": "Bearer {}".format(self.token),
-                "Content-Type": "application/json",
-            },
-            verify=self.kubernetes_verify_tls,
-        )
+        response = self._http_request("GET", endpoint)
 
         if response.status_code == 404:
             raise NotFoundException(
@@ -445,14 +1340,7 @@ class OpenShift:
             self.openshift_api_url, namespace, buildconfig_id
         )
 
-        response = requests.get(
-            endpoint,
-            headers={
-                "Authorization": "Bearer {}".format(self.token),
-                "Content-Type": "application/json",
-            },
-            verify=self.kubernetes_verify_tls,
-        )
+        response = self._http_request("GET", endpoint)
 
         if response.status_code == 404:
             raise NotFoundException(
@@ -469,42 +1357,110 @@ class OpenShift:
         result: Dict[str, Any] = response.json()
         return result
 
-    def get_build_log(self, build_id: str, namespace: str) -> str:
-        """Get log of a build in the given namespace."""
+    def _build_log_response(
+        self, build_id: str, namespace: str, stream: bool, **log_options: Any
+    ) -> "requests.Response":
+        """Request log of a build from master."""
         # TODO: rewrite to OpenShift rest client once it will support it.
         endpoint = "{}/apis/build.openshift.io/v1/namespaces/{}/builds/{}/log".format(
             self.openshift_api_url, namespace, build_id
         )
 
-        response = requests.get(
-            endpoint,
-            headers={
-                "Authorization": "Bearer {}".format(self.token),
-                "Content-Type": "application/json",
-            },
-            verify=self.kubernetes_verify_tls,
+        response = self._http_request(
+            "GET", endpoint, params=self._log_params(**log_options), stream=stream
         )
 
         if response.status_code == 404:
+            response.close()
             raise NotFoundException(
                 f"Build with id {build_id} was not found in namespace {namespace}"
             )
 
         _LOGGER.debug(
-            "OpenShift master response for build log (%d): %r",
-            response.status_code,
-            response.text,
+            "OpenShift master response for build log (%d)", response.status_code,
         )
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+
+        return response
+
+    def get_build_log(self, build_id: str, namespace: str) -> str:
+        """Get log of a build in the given namespace, logs of builds completed are cached if enabled."""
+        cache_key: Optional[LogCacheKey] = None
+        if self.log_cache is not None:
+            cache_key = ("build", namespace, build_id, "")
+            cached = self.log_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # The log obtained is complete only if the build completed before asking for it.
+            if not self._is_build_completed(build_id, namespace):
+                cache_key = None
+
+        response = self._build_log_response(build_id, namespace, stream=False)
+        _LOGGER.debug("Obtained build log of size %d bytes", len(response.content))
+        log = response.text
+        if self.log_cache is not None and cache_key is not None:
+            self.log_cache.put(cache_key, log)
+
+        return log
+
+    def _is_build_completed(self, build_id: str, namespace: str) -> bool:
+        """Check if the given build completed, so its logs do not change anymore."""
+        try:
+            build = self.get_build(build_id, namespace)
+        except Exception as exc:
+            _LOGGER.debug("Failed to obtain build %r: %s", build_id, str(exc))
+            return False
 
-        return response.text
+        return (build.get("status") or {}).get("phase") in (
+            "Complete",
+            "Failed",
+            "Error",
+            "Cancelled",
+        )
+
+    def iter_build_log(
+        self,
+        build_id: str,
+        namespace: str,
+        *,
+        follow: bool = False,
+        tail_lines: Optional[int] = None,
+        since_seconds: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+        timestamps: bool = False,
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """Stream log of a build in the given namespace, yield raw chunks as sent by master."""
+        response = self._build_log_response(
+            build_id,
+            namespace,
+            stream=True,
+            follow=follow,
+            tail_lines=tail_lines,
+            since_seconds=since_seconds,
+            limit_bytes=limit_bytes,
+            timestamps=timestamps,
+        )
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
 
     def get_pod_status(self, pod_id: str, namespace: str) -> Dict[str, Any]:
         """Get status entry for a pod - low level routine."""
         import openshift
 
+        informer = self._get_pod_informer(namespace)
+        if informer is not None:
+            pod = informer.get(pod_id, copy_object=False)
+            if pod is not None:
+                return self._pod_state({"status": copy.deepcopy(pod["status"])})
+
         try:
-            response = self.ocp_client.resources.get(api_version="v1", kind="Pod").get(
+            response = self._get_resource("v1", "Pod").get(
                 namespace=namespace, name=pod_id
             )
         except openshift.dynamic.exceptions.NotFoundError as exc:
@@ -514,12 +1470,16 @@ class OpenShift:
 
         response = response.to_dict()
         _LOGGER.debug("OpenShift master response for pod status: %r", response)
+        return self._pod_state(response)
 
-        if "containerStatuses" not in response["status"]:
+    @staticmethod
+    def _pod_state(pod: Dict[str, Any]) -> Dict[str, Any]:
+        """Get state of the first container of the given pod object as obtained from master."""
+        if "containerStatuses" not in pod["status"]:
             # No status - pod is being scheduled.
             return {}
 
-        state: Dict[str, Any] = response["status"]["containerStatuses"][0]["state"]
+        state: Dict[str, Any] = pod["status"]["containerStatuses"][0]["state"]
         # Translate kills of liveness probes to our messages reported to user.
         if (
             state.get("terminated", {}).get("exitCode") == 137
@@ -576,7 +1536,7 @@ class OpenShift:
     def _get_pod_id_from_job(self, job_id: str, namespace: str) -> str:
         """Get a single pod name from a job."""
         # Kubernetes automatically adds 'job-name' label -> reuse it.
-        response = self.ocp_client.resources.get(api_version="v1", kind="Pod").get(
+        response = self._get_resource("v1", "Pod").get(
             namespace=namespace or self.infra_namespace,
             label_selector=f"job-name={job_id}",
         )
@@ -596,91 +1556,159 @@ class OpenShift:
 
         return result
 
-    def _get_pod_ids_from_job(self, job_id: str, namespace: str) -> List[str]:
-        """Get multiple pod names from a job.
+    def _get_pods_from_job(self, job_id: str, namespace: str) -> List[Dict[str, Any]]:
+        """Get all pods created by a job, in a single request to master."""
+        informer = self._get_pod_informer(namespace or self.infra_namespace)
+        if informer is not None:
+            pods = informer.by_index("job-name", job_id)
+            if pods:
+                return pods
 
-        This function is useful for a Job which schedules multiple pods, i.e.
-        when run to completion.
-        """
         # Kubernetes automatically adds 'job-name' label -> reuse it.
-        response = self.ocp_client.resources.get(api_version="v1", kind="Pod").get(
-            namespace=namespace or self.infra_namespace,
-            label_selector=f"job-name={job_id}",
+        result = list(
+            self.iter_pods(
+                namespace=namespace or self.infra_namespace,
+                label_selector=f"job-name={job_id}",
+            )
         )
-        response = response.to_dict()
-        _LOGGER.debug("OpenShift response for pod ids from job: %r", response)
+        _LOGGER.debug("OpenShift response for pods from job: %r", result)
 
-        if not len(response.get("items", [])):
+        if not result:
             raise NotFoundException(f"Job with the given id {job_id} was not found")
 
-        result: List[str] = [pod["metadata"]["name"] for pod in response["items"]]
-
         return result
 
+    def _get_pod_ids_from_job(self, job_id: str, namespace: str) -> List[str]:
+        """Get multiple pod names from a job.
+
+        This function is useful for a Job which schedules multiple pods, i.e.
+        when run to completion.
+        """
+        return [
+            pod["metadata"]["name"]
+            for pod in self._get_pods_from_job(job_id, namespace)
+        ]
+
     def get_configmap(self, configmap_id: str, namespace: str) -> Dict[str, Any]:
         """Get the given configmap in a namespace, return object representing config map."""
-        v1_configmap = self.ocp_client.resources.get(api_version="v1", kind="ConfigMap")
+        import openshift
+
+        v1_configmap = self._get_resource("v1", "ConfigMap")
         try:
             result: Dict[str, Any] = v1_configmap.get(
                 name=configmap_id, namespace=namespace
             )
             return result
-        except OpenShiftNotFoundError as exc:
+        except openshift.dynamic.exceptions.NotFoundError as exc:
             raise NotFoundException(
                 f"Configmap {configmap_id!r} not found in namespace {namespace!r}"
             ) from exc
 
     def get_configmaps(self, namespace: str, label_selector: str) -> Dict[str, Any]:
-        """Get all configmaps in a namespace and select them by label."""
-        v1_configmap = self.ocp_client.resources.get(api_version="v1", kind="ConfigMap")
+        """Get all configmaps in a namespace and select them by label.
+
+        Configmaps are obtained in a single request, use iter_configmaps to list them in pages.
+        """
+        v1_configmap = self._get_resource("v1", "ConfigMap")
         result: Dict[str, Any] = v1_configmap.get(
             label_selector=label_selector, namespace=namespace
         )
         return result
 
-    def get_image_streams(self, namespace: str, label_selector: str) -> Dict[str, Any]:
-        """Get all image streams in a namespace and select them by label."""
-        v1_image_streams = self.ocp_client.resources.get(
-            api_version="image.openshift.io/v1", kind="ImageStream"
+    def iter_configmaps(
+        self,
+        namespace: Optional[str],
+        label_selector: Optional[str] = None,
+        **list_options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over configmaps in a namespace, listed in pages."""
+        return self._iter_list(
+            self._namespaced_path("/api/v1", "configmaps", namespace),
+            label_selector=label_selector,
+            **list_options,
         )
+
+    def get_image_streams(self, namespace: str, label_selector: str) -> Dict[str, Any]:
+        """Get all image streams in a namespace and select them by label.
+
+        Image streams are obtained in a single request, use iter_image_streams to list them in pages.
+        """
+        v1_image_streams = self._get_resource("image.openshift.io/v1", "ImageStream")
         result: Dict[str, Any] = v1_image_streams.get(
             label_selector=label_selector, namespace=namespace
         )
         return result
 
+    def iter_image_streams(
+        self,
+        namespace: Optional[str],
+        label_selector: Optional[str] = None,
+        **list_options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over image streams in a namespace, listed in pages."""
+        return self._iter_list(
+            self._namespaced_path(
+                "/apis/image.openshift.io/v1", "imagestreams", namespace
+            ),
+            label_selector=label_selector,
+            **list_options,
+        )
+
+    def iter_pods(
+        self,
+        namespace: Optional[str],
+        label_selector: Optional[str] = None,
+        **list_options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over pods in a namespace, listed in pages."""
+        return self._iter_list(
+            self._namespaced_path("/api/v1", "pods", namespace),
+            label_selector=label_selector,
+            **list_options,
+        )
+
     def get_job_status(self, job_id: str, namespace: str) -> Dict[str, Any]:
         """Get status of a Job and Pods created by the Job.
 
         :raises: NotFoundError if no Job of such name is found in the namespace
         """
-        _TRANSLATION_TABLE = {  # noqa
-            "startTime": "started_at",
-            "completionTime": "finished_at",
-        }
+        import openshift
 
-        job_status: Dict[str, Any] = {}
-        try:
-            resources = self.ocp_client.resources.get(
-                api_version="batch/v1", kind="Job"
-            )
+        informer = self._get_job_informer(namespace)
+        if informer is not None:
+            informed = informer.get(job_id, copy_object=False)
+            if informed is not None:
+                return self._job_status(informed)
 
+        try:
+            resources = self._get_resource("batch/v1", "Job")
             job: Dict[str, Any] = resources.get(name=job_id, namespace=namespace)
-            for k, v in job["status"].items():
-                if k == "conditions":
-                    # conditions are discarded
-                    continue
-                job_status[_TRANSLATION_TABLE.get(k, k)] = v
-
-            # add completions information so that we can determine whether
-            # the Job is already finished according to the number of `succeeded`
-            # pods
-            job_status["completions"] = job["spec"]["completions"]
-
-        except OpenShiftNotFoundError as exc:
+        except openshift.dynamic.exceptions.NotFoundError as exc:
             raise NotFoundException(
                 f"Job {job_id!r} not found in namespace {namespace!r}"
             ) from exc
 
+        return self._job_status(job)
+
+    @staticmethod
+    def _job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Construct status of a Job from the Job object as obtained from master."""
+        _TRANSLATION_TABLE = {  # noqa
+            "startTime": "started_at",
+            "completionTime": "finished_at",
+        }
+
+        job_status: Dict[str, Any] = {}
+        for k, v in job["status"].items():
+            if k == "conditions":
+                # conditions are discarded
+                continue
+            job_status[_TRANSLATION_TABLE.get(k, k)] = v
+
+        # add completions information so that we can determine whether
+        # the Job is already finished according to the number of `succeeded`
+        # pods
+        job_status["completions"] = job["spec"]["completions"]
         return job_status
 
     def get_job_status_report(
@@ -689,12 +1717,11 @@ class OpenShift:
         """Get status report of a Job and Pods created by the Job."""
         report: Dict[str, Any] = self.get_job_status(job_id, namespace)
 
-        pod_ids: List[str] = self._get_pod_ids_from_job(job_id, namespace)
-        pods: List[Dict[str, Any]] = [
-            self.get_pod_status_report(p, namespace) for p in pod_ids
+        # Pods listed carry their status, no need to query them one by one.
+        report["pods"] = [
+            self._status_report(self._pod_state(pod))
+            for pod in self._get_pods_from_job(job_id, namespace)
         ]
-
-        report["pods"] = pods
         return report
 
     def get_job_log(self, job_id: str, namespace: str) -> Optional[str]:
@@ -707,16 +1734,42 @@ class OpenShift:
         pod_id = self._get_pod_id_from_job(job_id, namespace)
         return self.get_pod_log(pod_id, namespace)
 
+    def get_job_logs_all(
+        self,
+        job_id: str,
+        namespace: str,
+        container: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[str]]:
+        """Get logs of all pods created by a job, logs are obtained concurrently and keyed by pod name.
+
+        The number of concurrent requests is bounded by `max_workers`, defaults to the HTTP connection pool size.
+        """
+        pod_ids = self._get_pod_ids_from_job(job_id, namespace)
+        max_workers = min(max_workers or self.http_pool_maxsize, len(pod_ids))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            logs = executor.map(
+                lambda pod_id: self.get_pod_log(
+                    pod_id, namespace=namespace, container=container
+                ),
+                pod_ids,
+            )
+            return dict(zip(pod_ids, logs))
+
     def get_jobs(
         self, label_selector: str, namespace: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get all Jobs, select them by the provided label."""
+        """Get all Jobs, select them by the provided label.
+
+        Jobs are obtained in a single request, use iter_jobs to list them in pages.
+        """
         import openshift
 
         try:
-            response: Dict[str, Any] = self.ocp_client.resources.get(
-                api_version="batch/v1", kind="Job"
-            ).get(namespace=namespace, label_selector=label_selector)
+            response: Dict[str, Any] = self._get_resource("batch/v1", "Job").get(
+                namespace=namespace, label_selector=label_selector
+            )
         except openshift.dynamic.exceptions.NotFoundError as exc:
             raise NotFoundException(
                 f"No Jobs with label {label_selector} could be found"
@@ -725,12 +1778,173 @@ class OpenShift:
         _LOGGER.debug("OpenShift response: %r", response)
         return response
 
+    def iter_jobs(
+        self,
+        label_selector: Optional[str] = None,
+        namespace: Optional[str] = None,
+        **list_options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over Jobs selected by the provided label, listed in pages."""
+        try:
+            yield from self._iter_list(
+                self._namespaced_path("/apis/batch/v1", "jobs", namespace),
+                label_selector=label_selector,
+                **list_options,
+            )
+        except NotFoundException as exc:
+            raise NotFoundException(
+                f"No Jobs with label {label_selector} could be found"
+            ) from exc
+
+    @staticmethod
+    def _namespaced_path(prefix: str, plural: str, namespace: Optional[str]) -> str:
+        """Construct path to a collection of objects, objects in all namespaces are listed if no namespace given."""
+        if namespace:
+            return f"{prefix}/namespaces/{namespace}/{plural}"
+
+        return f"{prefix}/{plural}"
+
+    def _iter_pages(
+        self,
+        path: str,
+        *,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        accept: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over pages of a collection listing, each page carries at most `limit` objects."""
+        params: Dict[str, str] = {
+            "limit": str(limit if limit is not None else self.list_page_size)
+        }
+        if label_selector:
+            params["labelSelector"] = label_selector
+        if field_selector:
+            params["fieldSelector"] = field_selector
+        if resource_version is not None:
+            params["resourceVersion"] = resource_version
+        if resource_version_match is not None:
+            params["resourceVersionMatch"] = resource_version_match
+
+        kwargs: Dict[str, Any] = {}
+        if accept:
+            kwargs["headers"] = {"Accept": accept}
+
+        endpoint = f"{self.openshift_api_url}{path}"
+        while True:
+            response = self._http_request("GET", endpoint, params=params, **kwargs)
+            if response.status_code == 404:
+                raise NotFoundException(f"Collection {path!r} was not found")
+            if response.status_code == 410:
+                raise ThothCommonException(
+                    f"Listing of {path!r} expired before all the pages were obtained, list objects again"
+                )
+            response.raise_for_status()
+
+            page: Dict[str, Any] = response.json()
+            yield page
+
+            continue_token = (page.get("metadata") or {}).get("continue")
+            if not continue_token:
+                break
+
+            # Resource version cannot be stated when continuing listing, the continue token carries it.
+            params.pop("resourceVersion", None)
+            params.pop("resourceVersionMatch", None)
+            params["continue"] = continue_token
+
+    def _iter_list(self, path: str, **list_options: Any) -> Iterator[Dict[str, Any]]:
+        """Iterate over objects of a collection, objects are listed in pages of `limit` objects.
+
+        Pass resource_version="0" (optionally with resource_version_match="NotOlderThan") to let master serve
+        the listing from its watch cache instead of etcd. Master might ignore the limit in such case.
+        """
+        for page in self._iter_pages(path, **list_options):
+            yield from page.get("items") or []
+
+    def iter_table(
+        self,
+        path: str,
+        columns: Tuple[str, ...],
+        *,
+        column_descriptions: Optional[Dict[str, str]] = None,
+        **list_options: Any,
+    ) -> Optional[Iterator[Dict[str, Any]]]:
+        """Iterate over a collection in Table format, rows carry only cells of columns shown by kubectl get.
+
+        Each row is a dictionary mapping column names to cells, metadata of the object are available under
+        "metadata" key. None is returned if master cannot serve the collection in Table format with all the
+        columns requested, callers should fall back to a full listing in such case. Columns are checked to
+        have the given descriptions, if any, as column definitions do not state fields shown in columns.
+        """
+        pages = self._iter_pages(path, accept=self._TABLE, **list_options)
+        first_page = next(pages)
+        if first_page.get("kind") != "Table":
+            return None
+
+        column_definitions = first_page.get("columnDefinitions") or []
+        names = [column["name"] for column in column_definitions]
+        if not all(column in names for column in columns):
+            return None
+
+        descriptions = {
+            column["name"]: column.get("description") for column in column_definitions
+        }
+        if any(
+            descriptions[name] != description
+            for name, description in (column_descriptions or {}).items()
+        ):
+            return None
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            for page in itertools.chain((first_page,), pages):
+                for row in page.get("rows") or []:
+                    result = dict(zip(names, row.get("cells") or []))
+                    result["metadata"] = (row.get("object") or {}).get("metadata") or {}
+                    yield result
+
+        return rows()
+
+    def _list_resource_versions(
+        self, endpoint: str, label_selector: str
+    ) -> List[Tuple[str, str]]:
+        """List names and resource versions of objects, only metadata are requested from master."""
+        response = self._http_request(
+            "GET",
+            endpoint,
+            params={"labelSelector": label_selector},
+            headers={"Accept": self._PARTIAL_OBJECT_METADATA_LIST},
+        )
+        response.raise_for_status()
+        return [
+            (item["metadata"]["name"], item["metadata"]["resourceVersion"])
+            for item in response.json().get("items") or []
+        ]
+
     def _get_template(
         self, _label_selector: str, namespace: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get template from infra namespace, use label_selector to identify which template to get."""
-        response = self.ocp_client.resources.get(
-            api_version="template.openshift.io/v1", kind="Template", name="templates"
+        namespace = namespace or self.infra_namespace
+        return self.template_cache.get(
+            ("Template", namespace or "", _label_selector),
+            fetch=lambda: self._fetch_template(_label_selector, namespace=namespace),
+            revalidate=lambda: self._list_resource_versions(
+                "{}/apis/template.openshift.io/v1/namespaces/{}/templates".format(
+                    self.openshift_api_url, namespace
+                ),
+                _label_selector,
+            ),
+        )
+
+    def _fetch_template(
+        self, _label_selector: str, namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Retrieve template from master, bypassing the template cache."""
+        response = self._get_resource(
+            "template.openshift.io/v1", "Template", "templates"
         ).get(
             namespace=namespace or self.infra_namespace, label_selector=_label_selector
         )
@@ -747,9 +1961,22 @@ class OpenShift:
 
     def _get_cronjob(self, _label_selector: str, namespace: str) -> Dict[str, Any]:
         """Get template from infra namespace, use label_selector to identify which template to get."""
-        response = self.ocp_client.resources.get(
-            api_version="batch/v1beta1", kind="CronJob"
-        ).get(namespace=namespace, label_selector=_label_selector)
+        return self.template_cache.get(
+            ("CronJob", namespace, _label_selector),
+            fetch=lambda: self._fetch_cronjob(_label_selector, namespace=namespace),
+            revalidate=lambda: self._list_resource_versions(
+                "{}/apis/batch/v1beta1/namespaces/{}/cronjobs".format(
+                    self.openshift_api_url, namespace
+                ),
+                _label_selector,
+            ),
+        )
+
+    def _fetch_cronjob(self, _label_selector: str, namespace: str) -> Dict[str, Any]:
+        """Retrieve CronJob from master, bypassing the template cache."""
+        response = self._get_resource("batch/v1beta1", "CronJob").get(
+            namespace=namespace, label_selector=_label_selector
+        )
         _LOGGER.debug(
             "OpenShift response for getting CronJob by label_selector %r: %r",
             _label_selector,
@@ -758,8 +1985,63 @@ class OpenShift:
         self._raise_on_invalid_response_size(
             response, label_selector=_label_selector, namespace=namespace
         )
-        template: Dict[str, Any] = response.to_dict()["items"][0]
-        return template
+        template: Dict[str, Any] = response.to_dict()["items"][0]
+        return template
+
+    def invalidate_template_cache(
+        self,
+        *,
+        kind: Optional[str] = None,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+    ) -> int:
+        """Drop cached Templates and CronJobs, optionally filtered by kind, namespace and label selector.
+
+        :returns: number of objects dropped from the cache
+        """
+        return self.template_cache.invalidate(
+            kind=kind, namespace=namespace, label_selector=label_selector
+        )
+
+    def warm_up_template_cache(self) -> int:
+        """Prefetch all workflow templates known to Thoth into the template cache.
+
+        Templates which cannot be retrieved are skipped.
+
+        :returns: number of templates prefetched
+        """
+        to_prefetch: List[Tuple[str, Optional[str]]] = [
+            (label_selector, self.infra_namespace)
+            for label_selector in self._WORKFLOW_TEMPLATE_LABEL_SELECTORS
+        ]
+        to_prefetch.extend(
+            (label_selector, self.amun_infra_namespace)
+            for label_selector in self._AMUN_WORKFLOW_TEMPLATE_LABEL_SELECTORS
+        )
+
+        prefetched = 0
+        for label_selector, namespace in to_prefetch:
+            if not namespace:
+                _LOGGER.debug(
+                    "Skipping prefetching of template %r, no namespace configured",
+                    label_selector,
+                )
+                continue
+
+            try:
+                self._get_template(label_selector, namespace=namespace)
+            except Exception as exc:
+                _LOGGER.warning(
+                    "Failed to prefetch template %r from namespace %r: %s",
+                    label_selector,
+                    namespace,
+                    str(exc),
+                )
+                continue
+
+            prefetched += 1
+
+        return prefetched
 
     @staticmethod
     def _transform_cronjob_to_job(item: Dict[str, Any]) -> Dict[str, Any]:
@@ -784,9 +2066,9 @@ class OpenShift:
         template = self._transform_cronjob_to_job(template)
 
         # There are no template parameters as we are directly using a cronjob as a template, directly run the job.
-        response = self.ocp_client.resources.get(
-            api_version=template["apiVersion"], kind=template["kind"]
-        ).create(body=template, namespace=namespace)
+        response = self._get_resource(template["apiVersion"], template["kind"]).create(
+            body=template, namespace=namespace
+        )
 
         response = response.to_dict()
         _LOGGER.debug("OpenShift response for creating job: %r", response)
@@ -827,6 +2109,19 @@ class OpenShift:
         template_parameters["AMUN_RUN_MEMORY"] = specification["run"]["requests"][
             "memory"
         ]
+        for parameter in (
+            "AMUN_BUILD_CPU",
+            "AMUN_BUILD_MEMORY",
+            "AMUN_RUN_CPU",
+            "AMUN_RUN_MEMORY",
+        ):
+            # Fail early on resources which would be rejected by master once the inspection is run.
+            try:
+                Quantity(template_parameters[parameter])
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"Invalid resource requested for {parameter}: {template_parameters[parameter]!r}"
+                ) from exc
 
         workflow_parameters = self._assign_workflow_parameters_for_ceph()
         workflow_parameters["dockerfile"] = dockerfile
@@ -870,21 +2165,137 @@ class OpenShift:
         indexes: Optional[List[str]] = None,
         debug: bool = False,
         transitive: bool = False,
+        workflow_limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> typing.List[str]:
-        """Schedule all solvers for the given packages."""
-        solver_ids = []
-        for solver_name in self.get_solver_names():
-            solver_id = self.schedule_solver(
-                packages=packages,
-                solver=solver_name,
+        """Schedule all solvers for the given packages.
+
+        Solvers are scheduled concurrently, see schedule_solvers. If any of the solvers failed to be scheduled,
+        the first failure (in the order of solvers) is raised once all the solvers were attempted. Use
+        schedule_solvers to obtain Workflows scheduled along with failures.
+        """
+        scheduled, failed = self.schedule_solvers(
+            packages,
+            indexes=indexes,
+            debug=debug,
+            transitive=transitive,
+            workflow_limit=workflow_limit,
+            max_workers=max_workers,
+        )
+
+        if failed:
+            raise next(iter(failed.values()))
+
+        return list(scheduled.values())
+
+    def schedule_solvers(
+        self,
+        packages: str,
+        solvers: Optional[List[str]] = None,
+        *,
+        indexes: Optional[List[str]] = None,
+        debug: bool = False,
+        transitive: bool = False,
+        workflow_limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Schedule the given solvers (all solvers if not given) for the given packages in one batch.
+
+        The solver template is retrieved once, rendered for each solver locally and Workflows are submitted
+        concurrently through a bounded pool of workers. If `workflow_limit` is set, Workflows are admitted
+        respecting the number of active Workflows in the middletier namespace. If deduplication is enabled,
+        each solver is deduplicated as done in schedule_solver.
+
+        :returns: IDs of Workflows scheduled and exceptions raised keyed by solver name, in the order of solvers
+        """
+        if not self.middletier_namespace:
+            raise ConfigurationError(
+                "Unable to schedule solver job without middletier namespace being set"
+            )
+
+        if solvers is None:
+            solvers = self.get_solver_names()
+
+        if not solvers:
+            return {}, {}
+
+        template_parameters = [
+            self._solver_template_parameters(
+                packages,
+                solver,
                 indexes=indexes,
                 debug=debug,
                 transitive=transitive,
+                workflow_id=self.generate_id(solver),
+            )
+            for solver in solvers
+        ]
+        workflow_parameters = self._assign_workflow_parameters_for_ceph()
+
+        results: List[Union[str, None, Exception]]
+        if not self.dedup_window:
+            results = self.workflow_manager.submit_solvers(
+                template_parameters,
+                workflow_parameters=workflow_parameters,
+                workflow_limit=workflow_limit,
+                max_workers=max_workers,
             )
-            if solver_id is not None:
-                solver_ids.append(solver_id)
+        else:
+            # Each solver is looked up by its fingerprint, the template is served from the template cache.
+            def schedule(parameters: Dict[str, Any]) -> Union[str, None, Exception]:
+                try:
+                    return self._schedule_workflow(
+                        workflow=self.workflow_manager.submit_solver,
+                        parameters={
+                            "template_parameters": parameters,
+                            "workflow_parameters": workflow_parameters,
+                            "workflow_limit": workflow_limit,
+                        },
+                        dedup_id=parameters["THOTH_SOLVER_WORKFLOW_ID"],
+                        dedup_template="template=solver",
+                    )
+                except Exception as exc:
+                    _LOGGER.exception(
+                        "Failed to schedule solver %r", parameters["THOTH_SOLVER_NAME"]
+                    )
+                    return exc
+
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    max_workers or self.http_pool_maxsize, len(template_parameters)
+                )
+            ) as executor:
+                results = list(executor.map(schedule, template_parameters))
+
+        scheduled: Dict[str, str] = {}
+        failed: Dict[str, Exception] = {}
+        for solver, result in zip(solvers, results):
+            if isinstance(result, Exception):
+                failed[solver] = result
+            elif result is not None:
+                scheduled[solver] = result
 
-        return solver_ids
+        return scheduled, failed
+
+    @staticmethod
+    def _solver_template_parameters(
+        packages: str,
+        solver: str,
+        *,
+        indexes: Optional[List[str]],
+        debug: bool,
+        transitive: bool,
+        workflow_id: str,
+    ) -> Dict[str, Any]:
+        """Construct parameters of solver template."""
+        return {
+            "THOTH_SOLVER_WORKFLOW_ID": workflow_id,
+            "THOTH_SOLVER_NAME": solver,
+            "THOTH_SOLVER_PACKAGES": packages.replace("\n", "\\n"),
+            "THOTH_SOLVER_NO_TRANSITIVE": int(not transitive),
+            "THOTH_SOLVER_INDEXES": ",".join(indexes) if indexes else "",
+            "THOTH_LOG_SOLVER": "DEBUG" if debug else "INFO",
+        }
 
     def schedule_solver(
         self,
@@ -903,14 +2314,14 @@ class OpenShift:
             )
 
         workflow_id = job_id or self.generate_id(solver)
-        template_parameters = {
-            "THOTH_SOLVER_WORKFLOW_ID": workflow_id,
-            "THOTH_SOLVER_NAME": solver,
-            "THOTH_SOLVER_PACKAGES": packages.replace("\n", "\\n"),
-            "THOTH_SOLVER_NO_TRANSITIVE": int(not transitive),
-            "THOTH_SOLVER_INDEXES": ",".join(indexes) if indexes else "",
-            "THOTH_LOG_SOLVER": "DEBUG" if debug else "INFO",
-        }
+        template_parameters = self._solver_template_parameters(
+            packages,
+            solver,
+            indexes=indexes,
+            debug=debug,
+            transitive=transitive,
+            workflow_id=workflow_id,
+        )
 
         workflow_parameters = self._assign_workflow_parameters_for_ceph()
 
@@ -920,6 +2331,8 @@ class OpenShift:
                 "template_parameters": template_parameters,
                 "workflow_parameters": workflow_parameters,
             },
+            dedup_id=None if job_id else workflow_id,
+            dedup_template="template=solver",
         )
 
     def schedule_revsolver(
@@ -1016,9 +2429,7 @@ class OpenShift:
         data: Dict[str, str],
     ) -> str:
         """Create a ConfigMap in the given namespace."""
-        v1_configmaps = self.ocp_client.resources.get(
-            api_version="v1", kind="ConfigMap"
-        )
+        v1_configmaps = self._get_resource("v1", "ConfigMap")
         v1_configmaps.create(
             body={
                 "apiVersion": "v1",
@@ -1033,12 +2444,148 @@ class OpenShift:
         )
         return configmap_name
 
-    @staticmethod
     def _schedule_workflow(
-        workflow: typing.Callable[..., Optional[str]], parameters: Dict[str, Any]
+        self,
+        workflow: typing.Callable[..., Optional[str]],
+        parameters: Dict[str, Any],
+        *,
+        dedup_id: Optional[str] = None,
+        dedup_template: Optional[str] = None,
     ) -> Optional[str]:
-        """Schedule an Argo Workflow."""
-        return workflow(**parameters)
+        """Schedule an Argo Workflow.
+
+        If `dedup_id` (the identifier generated for the Workflow) is given and deduplication is enabled, an identical
+        Workflow scheduled within the dedup window is reused instead of submitting a new one. Workflows are identical
+        only if they were created out of the same revision of the template selected by `dedup_template`.
+
+        Identical Workflows scheduled concurrently in this process wait for each other, so only one of them is
+        submitted. Other processes (replicas) find the Workflow by its fingerprint label once it is created, identical
+        Workflows scheduled by replicas within the time needed to submit the Workflow and list it can be still
+        submitted more than once.
+        """
+        if not dedup_id or not self.dedup_window:
+            return workflow(**parameters)
+
+        template = None
+        if dedup_template is not None:
+            template = self._get_template(dedup_template)
+
+        fingerprint = self._workflow_fingerprint(
+            workflow, parameters, dedup_id, template=template
+        )
+
+        # Reserve the fingerprint from the lookup until the Workflow is submitted.
+        with self._dedup_condition:
+            while fingerprint in self._dedup_pending:
+                self._dedup_condition.wait()
+            self._dedup_pending.add(fingerprint)
+
+        try:
+            workflow_id = self._get_deduplicated_workflow(fingerprint)
+            if workflow_id is not None:
+                _LOGGER.info(
+                    "Identical workflow %r scheduled recently, not scheduling %r",
+                    workflow_id,
+                    dedup_id,
+                )
+                return workflow_id
+
+            workflow_id = workflow(
+                **parameters, workflow_labels={self._FINGERPRINT_LABEL: fingerprint}
+            )
+            if workflow_id is not None:
+                now = time.monotonic()
+                with self._dedup_lock:
+                    for key, (submitted, _) in list(self._dedup_submitted.items()):
+                        if now - submitted >= self.dedup_window:
+                            del self._dedup_submitted[key]
+                    self._dedup_submitted[fingerprint] = (now, workflow_id)
+
+            return workflow_id
+        finally:
+            with self._dedup_condition:
+                self._dedup_pending.discard(fingerprint)
+                self._dedup_condition.notify_all()
+
+    @staticmethod
+    def _workflow_fingerprint(
+        workflow: typing.Callable[..., Optional[str]],
+        parameters: Dict[str, Any],
+        workflow_id: str,
+        *,
+        template: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Compute a fingerprint of a Workflow based on its parameters, the generated identifier is not considered.
+
+        If the template the Workflow is created from is given, its uid and resource version are considered.
+        """
+        template_parameters = {
+            key: value
+            for key, value in (parameters.get("template_parameters") or {}).items()
+            if value != workflow_id
+        }
+        template_metadata = (template or {}).get("metadata") or {}
+        canonical = json.dumps(
+            {
+                "workflow": getattr(workflow, "__name__", str(workflow)),
+                "template": [
+                    template_metadata.get("uid"),
+                    template_metadata.get("resourceVersion"),
+                ],
+                "template_parameters": template_parameters,
+                "workflow_parameters": parameters.get("workflow_parameters") or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        # Label values are limited to 63 characters.
+        return hashlib.sha256(canonical.encode()).hexdigest()[:40]
+
+    def _get_deduplicated_workflow(self, fingerprint: str) -> Optional[str]:
+        """Get the most recent Workflow with the given fingerprint scheduled within the dedup window, if any."""
+        with self._dedup_lock:
+            submitted = self._dedup_submitted.get(fingerprint)
+
+        if (
+            submitted is not None
+            and time.monotonic() - submitted[0] < self.dedup_window
+        ):
+            return submitted[1]
+
+        threshold = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            seconds=self.dedup_window
+        )
+        label_selector = f"{self._FINGERPRINT_LABEL}={fingerprint}"
+        # Argo defines "Status" column for the Workflow phase, metadata of Workflows are sent along with rows.
+        rows = self.iter_table(
+            self._namespaced_path(
+                "/apis/argoproj.io/v1alpha1", "workflows", self.middletier_namespace
+            ),
+            columns=("Status",),
+            label_selector=label_selector,
+        )
+        if rows is None:
+            rows = (
+                {
+                    "Status": (workflow.get("status") or {}).get("phase"),
+                    "metadata": workflow["metadata"],
+                }
+                for workflow in self.iter_workflows(
+                    namespace=self.middletier_namespace, label_selector=label_selector,
+                )
+            )
+
+        newest: Optional[Tuple[datetime.datetime, str]] = None
+        for row in rows:
+            if row["Status"] in ("Failed", "Error"):
+                continue
+
+            metadata = row["metadata"]
+            created = parse_datetime(metadata["creationTimestamp"].rstrip("Z"))
+            if created >= threshold and (newest is None or created > newest[0]):
+                newest = (created, metadata["name"])
+
+        return newest[1] if newest is not None else None
 
     @staticmethod
     def generate_id(
@@ -1527,6 +3074,8 @@ class OpenShift:
                 "template_parameters": template_parameters,
                 "workflow_parameters": workflow_parameters,
             },
+            dedup_id=None if job_id else security_indicator_id,
+            dedup_template="template=security-indicators",
         )
 
     def schedule_graph_sync(
@@ -1556,6 +3105,8 @@ class OpenShift:
                 "template_parameters": template_parameters,
                 "workflow_parameters": workflow_parameters,
             },
+            dedup_id=None if job_id else graph_sync_id,
+            dedup_template="template=graph-sync",
         )
 
     def _raise_on_invalid_response_size(
@@ -1584,15 +3135,7 @@ class OpenShift:
         endpoint = "{}/apis/template.openshift.io/v1/namespaces/{}/processedtemplates".format(
             self.openshift_api_url, namespace
         )
-        response = requests.post(
-            endpoint,
-            json=template,
-            headers={
-                "Authorization": "Bearer {}".format(self.token),
-                "Content-Type": "application/json",
-            },
-            verify=self.kubernetes_verify_tls,
-        )
+        response = self._http_request("POST", endpoint, json=template)
         _LOGGER.debug(
             "OpenShift master response template (%d): %r",
             response.status_code,
@@ -1608,6 +3151,49 @@ class OpenShift:
         result: Dict[str, Any] = response.json()
         return result
 
+    def _get_compiled_template(self, template: Dict[str, Any]) -> CompiledTemplate:
+        """Get compiled template, templates are compiled once per their resource version."""
+        metadata = template.get("metadata") or {}
+        uid, resource_version = metadata.get("uid"), metadata.get("resourceVersion")
+        if not uid or not resource_version:
+            return CompiledTemplate(template)
+
+        with self._compiled_templates_lock:
+            compiled = self._compiled_templates.get((uid, resource_version))
+
+        if compiled is None:
+            compiled = CompiledTemplate(template)
+            with self._compiled_templates_lock:
+                if len(self._compiled_templates) >= 64:
+                    # Templates are rarely changed, drop all entries once full.
+                    self._compiled_templates.clear()
+                self._compiled_templates[(uid, resource_version)] = compiled
+
+        return compiled
+
+    def process_template(
+        self, namespace: str, template: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Process the given template, templates are processed in OpenShift unless configured otherwise.
+
+        If processing on client side is enabled, processing in OpenShift is used as a fallback if the template
+        cannot be processed on client side - errors, such as a required parameter missing, are reported by master
+        as requests.HTTPError the same way as if the template was processed in OpenShift.
+        """
+        if self.local_template_processing:
+            try:
+                return self._get_compiled_template(template).render(
+                    template.get("parameters")
+                )
+            except TemplateProcessingError as exc:
+                _LOGGER.warning(
+                    "Failed to process template %r on client side, processing it in OpenShift: %s",
+                    (template.get("metadata") or {}).get("name"),
+                    str(exc),
+                )
+
+        return self.oc_process(namespace, template)
+
     def get_mi_repositories_and_organizations(self,) -> Tuple[List[str], List[str]]:
         """Get all of the repositories and organizations for mi-analysis.
 
@@ -1646,113 +3232,272 @@ class OpenShift:
     @staticmethod
     def parse_cpu_spec(cpu_spec: typing.Optional[str]) -> typing.Optional[float]:
         """Parse the given CPU requirement as used by OpenShift/Kubernetes."""
-        if isinstance(cpu_spec, str) and cpu_spec.endswith("m"):
-            cpu_spec = cpu_spec[:-1]
-            return int(cpu_spec) / 1000
-
         if cpu_spec is None:
             return None
 
-        return float(cpu_spec)
+        return float(Quantity(cpu_spec))
 
     @staticmethod
     def parse_memory_spec(memory_spec: typing.Optional[str]) -> typing.Optional[float]:
-        """Parse the given CPU requirement as used by OpenShift/Kubernetes."""
-        if isinstance(memory_spec, (float, int)):
-            return float(memory_spec)
-
+        """Parse the given memory requirement as used by OpenShift/Kubernetes."""
         if memory_spec is None:
             return None
 
-        if memory_spec.endswith("E"):
-            parsed = float(memory_spec[:-1])
-            return parsed * 1000 ** 6
-        elif memory_spec.endswith("P"):
-            parsed = float(memory_spec[:-1])
-            return parsed * 1000 ** 5
-        elif memory_spec.endswith("T"):
-            parsed = float(memory_spec[:-1])
-            return parsed * 1000 ** 4
-        elif memory_spec.endswith("G"):
-            parsed = float(memory_spec[:-1])
-            return parsed * 1000 ** 3
-        elif memory_spec.endswith("M"):
-            parsed = float(memory_spec[:-1])
-            return parsed * 1000 ** 2
-        elif memory_spec.endswith("K"):
-            parsed = float(memory_spec[:-1])
-            return parsed * 1000
-        elif memory_spec.endswith("Ei"):
-            parsed = float(memory_spec[:-2])
-            return parsed * 1024 ** 6
-        elif memory_spec.endswith("Pi"):
-            parsed = float(memory_spec[:-2])
-            return parsed * 1024 ** 5
-        elif memory_spec.endswith("Ti"):
-            parsed = float(memory_spec[:-2])
-            return parsed * 1024 ** 4
-        elif memory_spec.endswith("Gi"):
-            parsed = float(memory_spec[:-2])
-            return parsed * 1024 ** 3
-        elif memory_spec.endswith("Mi"):
-            parsed = float(memory_spec[:-2])
-            return parsed * 1024 ** 2
-        elif memory_spec.endswith("Ki"):
-            parsed = float(memory_spec[:-2])
-            return parsed * 1024
-
-        raise ValueError(f"Cannot parse memory specification from {memory_spec!r}")
+        try:
+            return float(Quantity(memory_spec))
+        except ValueError as exc:
+            raise ValueError(
+                f"Cannot parse memory specification from {memory_spec!r}"
+            ) from exc
+
+    def get_requested_resources(
+        self,
+        namespace: str,
+        *,
+        label_selector: Optional[str] = None,
+        group_by_label: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Dict[str, ResourceTotals]:
+        """Get totals of CPU and memory requested and limited by pods in a namespace, keyed by namespace.
+
+        Pass group_by_label to account resources per value of the given label instead, e.g. "component" to
+        account per component or "workflows.argoproj.io/workflow" to account per workflow; pods not labeled are
+        not accounted in such case. Pods which finished are not accounted if `active_only` is set.
+        """
+        informer = self._get_pod_informer(namespace)
+        pods: Optional[Iterable[Dict[str, Any]]] = None
+        if informer is not None:
+            try:
+                pods = informer.list(label_selector, copy_objects=False)
+            except ValueError:
+                _LOGGER.debug(
+                    "Label selector %r cannot be matched by the pod informer, listing pods",
+                    label_selector,
+                )
+
+        if pods is None:
+            pods = self.iter_pods(
+                namespace,
+                label_selector=label_selector,
+                field_selector="status.phase!=Succeeded,status.phase!=Failed"
+                if active_only
+                else None,
+            )
+
+        totals: Dict[str, ResourceTotals] = {}
+        for pod in pods:
+            if active_only and (pod.get("status") or {}).get("phase") in (
+                "Succeeded",
+                "Failed",
+            ):
+                continue
+
+            labels = (pod.get("metadata") or {}).get("labels") or {}
+            key = labels.get(group_by_label) if group_by_label else namespace
+            if key is None:
+                continue
+
+            add_resources(
+                totals.setdefault(key, empty_resources()),
+                pod_resources(pod.get("spec") or {}),
+            )
+
+        return totals
+
+    def get_template_requested_resources(
+        self,
+        namespace: str,
+        label_selector: str,
+        *,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> ResourceTotals:
+        """Get totals of CPU and memory requested and limited by all containers stated in a template.
+
+        Parameters are needed if resources are parametrized, the template is processed to obtain values.
+        """
+        template = self._get_template(label_selector, namespace=namespace)
+        if parameters:
+            self.set_template_parameters(template, **parameters)
+
+        processed = self.process_template(namespace, template)
+        return object_resources(processed.get("objects") or [])
 
     def get_job_status_count(
         self, label_selector: str, namespace: str
     ) -> Dict[str, int]:
         """Count the number of Jobs per status in a specific namespace."""
-        response = self.get_jobs(label_selector=label_selector, namespace=namespace)
-        status = [
-            "created",
-            "active",
-            "failed",
-            "succeeded",
-            "pending",
-            "retry",
-            "waiting",
-            "started",
-        ]
-
         # Initialize
-        jobs_status_count = dict.fromkeys(status, 0)
-
-        # Count jobs per status
-        for item in response["items"]:
-            jobs_status_count["created"] += 1
-
-            if "succeeded" in item["status"].keys():
-                jobs_status_count["succeeded"] += 1
-            elif "failed" in item["status"].keys():
-                jobs_status_count["failed"] += 1
-            elif "active" in item["status"].keys():
-                jobs_status_count["active"] += 1
-            elif "pending" in item["status"].keys():
-                jobs_status_count["pending"] += 1
-            elif not item["status"].keys():
-                jobs_status_count["waiting"] += 1
-            elif (
-                "startTime" in item["status"].keys() and len(item["status"].keys()) == 1
-            ):
-                jobs_status_count["started"] += 1
+        jobs_status_count = dict.fromkeys(self._JOB_STATUSES, 0)
+
+        informer = self._get_job_informer(namespace)
+        if informer is not None:
+            try:
+                # Counts are kept up to date by the informer on each change.
+                informer.add_counter(
+                    label_selector, self._job_status_categories, label_selector
+                )
+            except ValueError:
+                _LOGGER.debug(
+                    "Label selector %r cannot be matched by the Job informer, listing Jobs",
+                    label_selector,
+                )
             else:
-                try:
-                    if (
-                        "BackoffLimitExceeded"
-                        in item["status"]["conditions"][0]["reason"]
-                    ):
-                        jobs_status_count["retry"] += 1
-                except Exception as excptn:
-                    _LOGGER.error("Unknown job status %r", item)
-                    _LOGGER.exception(excptn)
+                jobs_status_count.update(informer.get_counter(label_selector))
+                return jobs_status_count
+
+        # Neither metadata nor Table projections carry Job status, list Jobs in pages so that at most one page
+        # of objects is held in memory.
+        for item in self.iter_jobs(label_selector=label_selector, namespace=namespace):
+            for category in self._job_status_categories(item):
+                jobs_status_count[category] += 1
 
         return jobs_status_count
 
+    @staticmethod
+    def _job_status_categories(item: Dict[str, Any]) -> List[str]:
+        """Get categories in which the given Job is counted based on its status."""
+        categories = ["created"]
+
+        if "succeeded" in item["status"].keys():
+            categories.append("succeeded")
+        elif "failed" in item["status"].keys():
+            categories.append("failed")
+        elif "active" in item["status"].keys():
+            categories.append("active")
+        elif "pending" in item["status"].keys():
+            categories.append("pending")
+        elif not item["status"].keys():
+            categories.append("waiting")
+        elif "startTime" in item["status"].keys() and len(item["status"].keys()) == 1:
+            categories.append("started")
+        else:
+            try:
+                if "BackoffLimitExceeded" in item["status"]["conditions"][0]["reason"]:
+                    categories.append("retry")
+            except Exception as excptn:
+                _LOGGER.error("Unknown job status %r", item)
+                _LOGGER.exception(excptn)
+
+        return categories
+
+    def _get_informer(
+        self,
+        name: str,
+        path: str,
+        indexes: Optional[Dict[str, Callable[[Dict[str, Any]], Iterable[str]]]] = None,
+        listeners: Optional[List[Listener]] = None,
+    ) -> Optional[Informer]:
+        """Get an informer watching objects at the given path, start it if not running yet.
+
+        None is returned if the informer is not synced, callers should query master directly in such case. Only
+        the caller starting the informer waits for it to sync.
+        """
+        created = False
+        with self._informers_lock:
+            informer = self._informers.get(name)
+            if informer is None:
+                informer = Informer(self, path, name=name)
+                for index_name, key_function in (indexes or {}).items():
+                    informer.add_index(index_name, key_function)
+                for listener in listeners or []:
+                    informer.add_listener(listener)
+                self._informers[name] = informer
+                informer.start()
+                created = True
+
+        if created:
+            informer.wait_for_sync(self.informer_sync_timeout)
+
+        if not informer.synced:
+            _LOGGER.warning("Informer %r is not synced, querying master directly", name)
+            return None
+
+        return informer
+
+    def _get_pod_informer(self, namespace: Optional[str]) -> Optional[Informer]:
+        """Get an informer of Pods in the given namespace if enabled, Pods are indexed by job-name label."""
+        if not self.pod_informer or not namespace:
+            return None
+
+        return self._get_informer(
+            f"Pod/{namespace}",
+            f"/api/v1/namespaces/{namespace}/pods",
+            indexes={"job-name": self._job_name_index},
+        )
+
+    @staticmethod
+    def _job_name_index(pod: Dict[str, Any]) -> List[str]:
+        """Get name of the Job which created the given Pod, based on job-name label."""
+        job_name = ((pod.get("metadata") or {}).get("labels") or {}).get("job-name")
+        return [job_name] if job_name else []
+
+    def _get_job_informer(self, namespace: Optional[str]) -> Optional[Informer]:
+        """Get an informer of Jobs in the given namespace if enabled."""
+        if not self.job_informer or not namespace:
+            return None
+
+        return self._get_informer(
+            f"Job/{namespace}", f"/apis/batch/v1/namespaces/{namespace}/jobs"
+        )
+
+    def get_workflow_informer(self, namespace: Optional[str]) -> Optional[Informer]:
+        """Get an informer of Workflows in the given namespace if enabled."""
+        if not self.workflow_informer or not namespace:
+            return None
+
+        listeners: List[Listener] = []
+        workflow_cache = self.workflow_cache
+        if workflow_cache is not None:
+
+            def invalidate(event_type: str, workflow: Dict[str, Any]) -> None:
+                if event_type == "DELETED":
+                    workflow_cache.invalidate(namespace, workflow["metadata"]["name"])
+                else:
+                    workflow_cache.observe(namespace, workflow)
+
+            listeners.append(invalidate)
+
+        return self._get_informer(
+            f"Workflow/{namespace}",
+            f"/apis/argoproj.io/v1alpha1/namespaces/{namespace}/workflows",
+            listeners=listeners,
+        )
+
+    def informer_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics of informers running, keyed by informer name."""
+        with self._informers_lock:
+            informers = list(self._informers.values())
+
+        return {informer.name: informer.metrics() for informer in informers}
+
+    def _get_informed_workflow(
+        self,
+        name: Optional[str],
+        label_selector: Optional[str],
+        namespace: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Get a Workflow from an informer if enabled, the object returned must not be modified.
+
+        None is returned if the Workflow cannot be served from the informer, master should be queried then.
+        """
+        informer = self.get_workflow_informer(namespace or self.infra_namespace)
+        if informer is None:
+            return None
+
+        if name:
+            return informer.get(name, copy_object=False)
+
+        if label_selector:
+            try:
+                workflows = informer.list(label_selector, copy_objects=False)
+            except ValueError:
+                return None
+
+            if len(workflows) == 1:
+                return workflows[0]
+
+        return None
+
     def get_workflow(
         self,
         name: Optional[str] = None,
@@ -1760,7 +3505,14 @@ class OpenShift:
         namespace: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get Workflow from a namespace, use one of name or label_selector to identify which one to get."""
+        import openshift
+
+        informed = self._get_informed_workflow(name, label_selector, namespace)
+        if informed is not None:
+            return copy.deepcopy(informed)
+
         wf: Dict[str, Any]
+        namespace = namespace or self.infra_namespace
         if name:
             if label_selector is not None:
                 _LOGGER.warning(
@@ -1768,18 +3520,20 @@ class OpenShift:
                     f"Ignoring `label_selector={label_selector}`."
                 )
 
+            cached = self.get_cached_workflow("raw", namespace, name)
+            if cached is not None:
+                return cached
+
             try:
-                response = self.ocp_client.resources.get(
-                    api_version="argoproj.io/v1alpha1",
-                    kind="Workflow",
-                    name="workflows",
-                ).get(namespace=namespace or self.infra_namespace, name=name)
+                response = self._get_resource(
+                    "argoproj.io/v1alpha1", "Workflow", "workflows"
+                ).get(namespace=namespace, name=name)
                 _LOGGER.debug(
                     "OpenShift response for getting template by name %r: %r",
                     name,
                     response.to_dict(),
                 )
-            except OpenShiftNotFoundError as exc:
+            except openshift.dynamic.exceptions.NotFoundError as exc:
                 raise NotFoundException(
                     f"The given Workflow {name} could not be found"
                 ) from exc
@@ -1788,35 +3542,94 @@ class OpenShift:
 
         elif label_selector:
             try:
-                response = self.ocp_client.resources.get(
-                    api_version="argoproj.io/v1alpha1",
-                    kind="Workflow",
-                    name="workflows",
-                ).get(
-                    namespace=namespace or self.infra_namespace,
-                    label_selector=label_selector,
+                # Two objects are enough to check there is exactly one Workflow matching.
+                items = list(
+                    itertools.islice(
+                        self.iter_workflows(
+                            namespace=namespace, label_selector=label_selector, limit=2,
+                        ),
+                        2,
+                    )
                 )
                 _LOGGER.debug(
                     "OpenShift response for getting template by label_selector %r: %r",
                     label_selector,
-                    response.to_dict(),
+                    items,
                 )
-            except OpenShiftNotFoundError as exc:
+            except NotFoundException as exc:
                 raise NotFoundException(
                     f"The given Workflow containing label {label_selector} could not be found"
                 ) from exc
 
             self._raise_on_invalid_response_size(
-                response, label_selector=label_selector, namespace=namespace
+                SimpleNamespace(items=items),
+                label_selector=label_selector,
+                namespace=namespace,
             )
 
-            wf = response.to_dict()["items"][0]
+            wf = items[0]
 
         else:
             raise ValueError("Either `name` or `label_selector` has to be provided.")
 
+        if self.workflow_cache is not None and namespace:
+            self.workflow_cache.put("raw", namespace, wf)
+
         return wf
 
+    def iter_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        **list_options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over Workflows in a namespace, listed in pages."""
+        namespace = namespace or self.infra_namespace
+        workflows = self._iter_list(
+            self._namespaced_path("/apis/argoproj.io/v1alpha1", "workflows", namespace),
+            label_selector=label_selector,
+            **list_options,
+        )
+        if self.workflow_cache is None or not namespace:
+            return workflows
+
+        return self._observe_workflows(self.workflow_cache, namespace, workflows)
+
+    def get_cached_workflow(
+        self, representation: str, namespace: Optional[str], name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a Workflow which finished from the cache if enabled, None is returned if not cached.
+
+        Unless the Workflow informer (which drops Workflows deleted or re-created) is running, the Workflow
+        cached is served only if metadata obtained from master state the same uid.
+
+        :raises NotFoundException: if the Workflow cached was deleted
+        """
+        workflow_cache = self.workflow_cache
+        if workflow_cache is None or not namespace:
+            return None
+
+        uid = workflow_cache.get_uid(representation, namespace, name)
+        if uid is not None and self.get_workflow_informer(namespace) is None:
+            try:
+                uid = self._get_workflow_metadata(name, namespace).get("uid")
+            except NotFoundException:
+                workflow_cache.invalidate(namespace, name)
+                raise
+
+        return workflow_cache.get(representation, namespace, name, uid=uid)
+
+    @staticmethod
+    def _observe_workflows(
+        workflow_cache: WorkflowCache,
+        namespace: str,
+        workflows: Iterable[Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Pass Workflows listed, drop Workflows cached which were re-created since they were cached."""
+        for workflow in workflows:
+            workflow_cache.observe(namespace, workflow)
+            yield workflow
+
     def get_workflow_status_report(
         self,
         workflow_id: str,
@@ -1824,21 +3637,29 @@ class OpenShift:
         namespace: Optional[str] = None,
     ) -> Dict[str, Optional[str]]:
         """Get workflow status report, derived from workflow status."""
+        informed = self._get_informed_workflow(workflow_id, label_selector, namespace)
+        if informed is not None:
+            return self._workflow_status_report(informed.get("status") or {})
+
         try:
             wf_status = self.get_workflow_status(
                 name=workflow_id, label_selector=label_selector, namespace=namespace
             )
-            status = {
-                "finished_at": wf_status.get("finishedAt"),
-                "reason": None,
-                "started_at": wf_status.get("startedAt"),
-                "state": wf_status.get("phase", "pending").lower(),
-            }
         except NotFoundException as exc:
             raise NotFoundException(
                 f"Requested status for analysis {workflow_id!r} was not found"
             ) from exc
-        return status
+        return self._workflow_status_report(wf_status)
+
+    @staticmethod
+    def _workflow_status_report(wf_status: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """Construct status report of a Workflow from its status as obtained from master."""
+        return {
+            "finished_at": wf_status.get("finishedAt"),
+            "reason": None,
+            "started_at": wf_status.get("startedAt"),
+            "state": wf_status.get("phase", "pending").lower(),
+        }
 
     def get_workflow_status(
         self,
@@ -1847,6 +3668,11 @@ class OpenShift:
         namespace: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a Workflow status, use one of name or label_selector to identify which one to get."""
+        informed = self._get_informed_workflow(name, label_selector, namespace)
+        if informed is not None:
+            status: Dict[str, Any] = copy.deepcopy(informed.get("status") or {})
+            return status
+
         wf: Dict[str, Any] = self.get_workflow(
             name=name, label_selector=label_selector, namespace=namespace
         )
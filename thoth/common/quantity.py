@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Kubernetes quantities (CPU and memory requirements) and accounting of resources requested."""
+
+import functools
+import re
+
+from fractions import Fraction
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Union
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy
+
+# Resource totals, e.g. {"requests": {"cpu": Quantity("1500m"), "memory": Quantity("2Gi")}, "limits": {...}}.
+ResourceTotals = Dict[str, Dict[str, "Quantity"]]
+
+_RESOURCE_KINDS = ("requests", "limits")
+_RESOURCES = ("cpu", "memory")
+
+_SUFFIXES: Dict[str, Fraction] = {
+    "n": Fraction(1, 1000 ** 3),
+    "u": Fraction(1, 1000 ** 2),
+    "m": Fraction(1, 1000),
+    "": Fraction(1),
+    "k": Fraction(1000),
+    # Not a valid suffix for Kubernetes, but accepted by OpenShift.parse_memory_spec historically.
+    "K": Fraction(1000),
+    "M": Fraction(1000 ** 2),
+    "G": Fraction(1000 ** 3),
+    "T": Fraction(1000 ** 4),
+    "P": Fraction(1000 ** 5),
+    "E": Fraction(1000 ** 6),
+    "Ki": Fraction(1024),
+    "Mi": Fraction(1024 ** 2),
+    "Gi": Fraction(1024 ** 3),
+    "Ti": Fraction(1024 ** 4),
+    "Pi": Fraction(1024 ** 5),
+    "Ei": Fraction(1024 ** 6),
+}
+
+# A number followed by a decimal exponent or by a suffix, "1E" is one exa while "1E3" is a thousand.
+_QUANTITY_RE = re.compile(
+    r"^(?P<number>[+-]?(?:\d+\.?\d*|\.\d+))"
+    r"(?:(?P<exponent>[eE][+-]?\d+)|(?P<suffix>[KMGTPE]i|[numkKMGTPE])?)$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_quantity(quantity: str) -> Fraction:
+    """Parse the given quantity string into its exact value."""
+    match = _QUANTITY_RE.match(quantity.strip())
+    if match is None:
+        raise ValueError(f"Cannot parse quantity from {quantity!r}")
+
+    value = Fraction(match.group("number"))
+    if match.group("exponent"):
+        return value * Fraction(10) ** int(match.group("exponent")[1:])
+
+    return value * _SUFFIXES[match.group("suffix") or ""]
+
+
+@functools.total_ordering
+class Quantity:
+    """A quantity as used by Kubernetes to state CPU and memory requirements, with exact arithmetic."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, quantity: Union[str, int, float, Fraction, "Quantity"]) -> None:
+        """Create a quantity out of its string representation (e.g. "500m" or "2Gi") or a number."""
+        if isinstance(quantity, Quantity):
+            self.value: Fraction = quantity.value
+        elif isinstance(quantity, str):
+            self.value = _parse_quantity(quantity)
+        else:
+            self.value = Fraction(quantity)
+
+    def __add__(self, other: Any) -> "Quantity":
+        """Add two quantities."""
+        return Quantity(self.value + Quantity(other).value)
+
+    # Allow sum() of quantities.
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> "Quantity":
+        """Subtract two quantities."""
+        return Quantity(self.value - Quantity(other).value)
+
+    def __mul__(self, other: Union[int, Fraction]) -> "Quantity":
+        """Multiply quantity, e.g. by number of replicas."""
+        return Quantity(self.value * other)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: Any) -> bool:
+        """Check two quantities are equal."""
+        try:
+            return self.value == Quantity(other).value
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __lt__(self, other: Any) -> bool:
+        """Compare two quantities."""
+        return bool(self.value < Quantity(other).value)
+
+    def __hash__(self) -> int:
+        """Compute hash of the quantity, equal quantities have equal hashes."""
+        return hash(self.value)
+
+    def __float__(self) -> float:
+        """Convert to a float, e.g. cores or bytes."""
+        return float(self.value)
+
+    def __str__(self) -> str:
+        """Represent quantity as Kubernetes does, using milli units if the quantity is not whole."""
+        if self.value.denominator == 1:
+            return str(self.value.numerator)
+
+        milli = self.value * 1000
+        if milli.denominator == 1:
+            return f"{milli.numerator}m"
+
+        return str(float(self.value))
+
+    def __repr__(self) -> str:
+        """Represent quantity in a Python-parseable form."""
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+
+def parse_quantities(
+    quantities: Iterable[Optional[Union[str, int, float]]]
+) -> "numpy.ndarray[Any, Any]":
+    """Parse quantities into a NumPy array of floats, missing quantities are represented as NaN.
+
+    Each distinct quantity is parsed once, workloads usually state only a few distinct values.
+    """
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Unable to import NumPy package, install thoth-common[numpy] to parse quantities in batches"
+        ) from exc
+
+    values = numpy.asarray(
+        ["" if quantity is None else str(quantity) for quantity in quantities],
+        dtype=str,
+    )
+    unique, inverse = numpy.unique(values, return_inverse=True)
+    parsed = numpy.array(
+        [float(_parse_quantity(value)) if value else numpy.nan for value in unique],
+        dtype=numpy.float64,
+    )
+    result: "numpy.ndarray[Any, Any]" = parsed[inverse]
+    return result
+
+
+def empty_resources() -> ResourceTotals:
+    """Create resource totals with nothing requested."""
+    return {
+        kind: {resource: Quantity(0) for resource in _RESOURCES}
+        for kind in _RESOURCE_KINDS
+    }
+
+
+def add_resources(totals: ResourceTotals, other: ResourceTotals) -> None:
+    """Add resources to the given totals, in place."""
+    for kind in _RESOURCE_KINDS:
+        for resource in _RESOURCES:
+            totals[kind][resource] += other[kind][resource]
+
+
+def container_resources(container: Dict[str, Any]) -> ResourceTotals:
+    """Get resources requested by a container, resources not stated are accounted as zero."""
+    resources = container.get("resources") or {}
+    return {
+        kind: {
+            resource: Quantity((resources.get(kind) or {}).get(resource) or 0)
+            for resource in _RESOURCES
+        }
+        for kind in _RESOURCE_KINDS
+    }
+
+
+def pod_resources(pod_spec: Dict[str, Any]) -> ResourceTotals:
+    """Get effective resources of a pod - init containers run one by one before containers run in parallel."""
+    totals = empty_resources()
+    for container in pod_spec.get("containers") or []:
+        add_resources(totals, container_resources(container))
+
+    for init_container in pod_spec.get("initContainers") or []:
+        resources = container_resources(init_container)
+        for kind in _RESOURCE_KINDS:
+            for resource in _RESOURCES:
+                totals[kind][resource] = max(
+                    totals[kind][resource], resources[kind][resource]
+                )
+
+    return totals
+
+
+def object_resources(obj: Any) -> ResourceTotals:
+    """Sum resources of all containers stated in an object, e.g. a Workflow or a processed template."""
+    totals = empty_resources()
+    if isinstance(obj, dict):
+        if "image" in obj and "resources" in obj:
+            return container_resources(obj)
+
+        for value in obj.values():
+            add_resources(totals, object_resources(value))
+    elif isinstance(obj, list):
+        for item in obj:
+            add_resources(totals, object_resources(item))
+
+    return totals
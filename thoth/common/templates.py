@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# thoth-common
+# Copyright(C) 2020 Fridolin Pokorny
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Client-side processing of OpenShift templates, an equivalent of `oc process`.
+
+Semantics follow template processing as done by OpenShift master:
+
+* ``${PARAM}`` references in strings (map keys included) are replaced with parameter values,
+  references to unknown parameters are kept untouched
+* a string consisting solely of ``${{PARAM}}`` is replaced with a JSON value of the parameter
+* parameter ``value`` acts as a default, parameters with ``generate: expression`` get a value
+  generated from the ``from`` expression if no value is set
+* required parameters without a value are reported as an error
+* hardcoded namespaces are stripped from objects and template labels are added to all objects
+
+A template is compiled once into a JSON document with slots in place of strings referencing
+parameters, rendering then just fills in the slots and parses the resulting document.
+"""
+
+import copy
+import json
+import random
+import re
+import string
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .exceptions import TemplateNotCompilable
+from .exceptions import TemplateProcessingError
+
+_PARAMETER_EXP = re.compile(r"\$\{([a-zA-Z0-9_]+)\}")
+_STRING_PARAMETER_EXP = re.compile(r"\$\{([a-zA-Z0-9_]+?)\}")
+_NON_STRING_PARAMETER_EXP = re.compile(r"^\$\{\{([a-zA-Z0-9_]+)\}\}$")
+_GENERATORS_EXP = re.compile(r"\[([a-zA-Z0-9\-\\]+)\](\{(\w+)\})")
+_EXPRESSION_EXP = re.compile(r"\[(\\w|\\d|\\a|\\A)|([a-zA-Z0-9]\-[a-zA-Z0-9])+\]")
+_RANGE_EXP = re.compile(r"([\\]?[a-zA-Z0-9]\-?[a-zA-Z0-9]?)")
+_SYMBOLS = "~!@#$%^&*()-_+={}[]\\|<,>.?/\"';:`"
+_GENERATOR_MAX_LENGTH = 255
+
+# A character that is not expected to be present in any template, used to mark slots in compiled templates.
+_SLOT_MARK = "\uffff"
+_SLOT_EXP = re.compile('"{0}([0-9]+){0}"'.format(_SLOT_MARK))
+
+_RANDOM = random.SystemRandom()
+
+
+def _generate_expression_value(expression: str) -> str:
+    """Generate a value out of an expression such as ``[a-zA-Z0-9]{16}``."""
+    while True:
+        match = _GENERATORS_EXP.search(expression)
+        if match is None:
+            return expression
+
+        ranges = match.group(0)[: match.group(0).rindex("{")]
+        if not _EXPRESSION_EXP.search(ranges):
+            raise TemplateProcessingError(f"Malformed expression syntax: {ranges}")
+
+        length = int(match.group(3)) if match.group(3).isdigit() else 0
+        if not 0 < length <= _GENERATOR_MAX_LENGTH:
+            raise TemplateProcessingError(
+                f"Range must be within [1-{_GENERATOR_MAX_LENGTH}] characters ({length})"
+            )
+
+        alphabet = ""
+        for range_match in _RANGE_EXP.finditer(ranges):
+            start, end = range_match.group(0)[0], range_match.group(0)[-1]
+            if start + end == "\\w":
+                alphabet += string.ascii_letters + string.digits + "_"
+            elif start + end == "\\d":
+                alphabet += string.digits
+            elif start + end == "\\a":
+                alphabet += string.ascii_letters
+            elif start + end == "\\A":
+                alphabet += _SYMBOLS
+            elif ord(start) > ord(end):
+                raise TemplateProcessingError(f"Invalid range specified: {start}-{end}")
+            else:
+                alphabet += "".join(chr(c) for c in range(ord(start), ord(end) + 1))
+
+        # Remove duplicates, preserve order.
+        alphabet = "".join(dict.fromkeys(alphabet))
+        generated = "".join(_RANDOM.choice(alphabet) for _ in range(length))
+        expression = expression.replace(match.group(0), generated, 1)
+
+
+def _parameter_values(parameters: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Compute values of template parameters, generate values and check required parameters are set.
+
+    Values of parameters are filled in place.
+    """
+    for idx, parameter in enumerate(parameters):
+        if parameter.get("value"):
+            continue
+
+        generate = parameter.get("generate")
+        if generate:
+            if generate != "expression":
+                raise TemplateProcessingError(
+                    f"template.parameters[{idx}]: Unknown generator name {generate!r} "
+                    f"for parameter {parameter.get('name')}"
+                )
+            parameter["value"] = _generate_expression_value(parameter.get("from", ""))
+
+        if not parameter.get("value") and parameter.get("required"):
+            raise TemplateProcessingError(
+                f"template.parameters[{idx}]: Required value: parameter "
+                f"{parameter.get('name')} is required and must be specified"
+            )
+
+    return {p["name"]: p.get("value") or "" for p in parameters if "name" in p}
+
+
+def _evaluate(value: str, parameters: Dict[str, str]) -> Tuple[str, bool]:
+    """Substitute parameters in the given string, return also whether the result should be kept as a string."""
+    match = _NON_STRING_PARAMETER_EXP.match(value)
+    if match and match.group(1) in parameters:
+        return parameters[match.group(1)], False
+
+    result = value
+    for match in _STRING_PARAMETER_EXP.finditer(value):
+        if match.group(1) in parameters:
+            result = result.replace(match.group(0), parameters[match.group(1)], 1)
+
+    return result, True
+
+
+class _Slot:
+    """A string in a compiled template which references parameters."""
+
+    __slots__ = ("value", "is_key", "non_string", "references")
+
+    def __init__(self, value: str, is_key: bool) -> None:
+        """Precompute parameter references in the given string."""
+        self.value = value
+        self.is_key = is_key
+        match = _NON_STRING_PARAMETER_EXP.match(value)
+        self.non_string = match.group(1) if match else None
+        self.references = [
+            (m.group(0), m.group(1)) for m in _STRING_PARAMETER_EXP.finditer(value)
+        ]
+
+    def render(self, parameters: Dict[str, str]) -> str:
+        """Render the slot into a JSON text."""
+        if self.non_string is not None and self.non_string in parameters:
+            value = parameters[self.non_string]
+            if self.is_key:
+                return json.dumps(value, ensure_ascii=False)
+
+            try:
+                json.loads(value)
+            except ValueError as exc:
+                raise TemplateProcessingError(
+                    f"Value of parameter {self.non_string} used in non-string substitution "
+                    f"is not a valid JSON: {value!r}"
+                ) from exc
+            return value
+
+        result = self.value
+        for reference, name in self.references:
+            if name in parameters:
+                result = result.replace(reference, parameters[name], 1)
+
+        return json.dumps(result, ensure_ascii=False)
+
+
+class CompiledTemplate:
+    """An OpenShift template compiled for repeated processing with different parameters."""
+
+    def __init__(self, template: Dict[str, Any]) -> None:
+        """Compile the given template."""
+        self._template = {
+            key: value
+            for key, value in template.items()
+            if key not in ("objects", "parameters")
+        }
+        self._parameters = template.get("parameters") or []
+        self._slots: List[_Slot] = []
+
+        objects = copy.deepcopy(template.get("objects") or [])
+        for obj in objects:
+            self._strip_namespace(obj)
+
+        document = json.dumps(self._mark(objects, is_key=False), ensure_ascii=False)
+        matches = list(_SLOT_EXP.finditer(document))
+        if [int(match.group(1)) for match in matches] != list(range(len(self._slots))):
+            raise TemplateNotCompilable(
+                "Unable to compile template, template uses reserved characters"
+            )
+
+        self._parts: List[Union[str, _Slot]] = []
+        position = 0
+        for match in matches:
+            self._parts.append(document[position : match.start()])
+            self._parts.append(self._slots[int(match.group(1))])
+            position = match.end()
+        self._parts.append(document[position:])
+
+    @staticmethod
+    def _strip_namespace(obj: Any) -> None:
+        """Remove hardcoded namespace from the given object, namespaces referencing parameters are kept."""
+        if not isinstance(obj, dict) or not isinstance(obj.get("metadata"), dict):
+            return
+
+        namespace = obj["metadata"].get("namespace")
+        if namespace and not (
+            isinstance(namespace, str) and _PARAMETER_EXP.search(namespace)
+        ):
+            # Master drops the field, see stripNamespace in OpenShift template processing.
+            del obj["metadata"]["namespace"]
+
+    def _mark(self, obj: Any, is_key: bool) -> Any:
+        """Replace strings referencing parameters with slot marks."""
+        if isinstance(obj, str):
+            if "${" not in obj:
+                return obj
+
+            self._slots.append(_Slot(obj, is_key=is_key))
+            return "{0}{1}{0}".format(_SLOT_MARK, len(self._slots) - 1)
+        elif isinstance(obj, dict):
+            return {
+                self._mark(key, is_key=True): self._mark(value, is_key=False)
+                for key, value in obj.items()
+            }
+        elif isinstance(obj, list):
+            return [self._mark(item, is_key=False) for item in obj]
+
+        return obj
+
+    def render(
+        self, parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Process the template with the given parameters, parameters stated in the template are used if not given.
+
+        :returns: processed template in the same format as returned by OpenShift master
+        """
+        parameters = copy.deepcopy(
+            parameters if parameters is not None else self._parameters
+        )
+        values = _parameter_values(parameters)
+
+        objects: List[Any] = json.loads(
+            "".join(
+                part if isinstance(part, str) else part.render(values)
+                for part in self._parts
+            )
+        )
+
+        result = copy.deepcopy(self._template)
+        # Empty fields of parameters are omitted in master's output.
+        result["parameters"] = [
+            {
+                key: value
+                for key, value in parameter.items()
+                if key == "name" or value
+            }
+            for parameter in parameters
+        ]
+        result["objects"] = objects
+
+        labels = self._template.get("labels")
+        if labels:
+            result["labels"] = {
+                key: _evaluate(value, values)[0] for key, value in labels.items()
+            }
+            for obj in objects:
+                if not isinstance(obj, dict):
+                    continue
+
+                metadata = obj.setdefault("metadata", {})
+                metadata["labels"] = {
+                    **(metadata.get("labels") or {}),
+                    **result["labels"],
+                }
+
+        return result
+
+
+def process_template(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Process the given template with parameters stated in the template."""
+    return CompiledTemplate(template).render()
@@ -16,26 +16,32 @@
 
 """Workflow management for Thoth."""
 
+import copy
+import datetime
 import logging
 import json
-import requests
-import yaml
+import os
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Union
 
-from attrdict import AttrDict
-
 from argo.workflows import client
 from argo.workflows import models
 
+from .admission import AdmissionController
 from .exceptions import ConfigurationError
+from .exceptions import NotFoundException
 from .exceptions import WorkflowError
 
 from .helpers import to_camel_case
@@ -45,6 +51,279 @@ from .openshift import OpenShift
 
 _LOGGER = logging.getLogger(__name__)
 
+# Configuration shared by models deserialized, models create a configuration for each instance otherwise.
+_MODEL_CONFIGURATION = client.Configuration()
+# Deserializers of types stated in models, compiled on first use.
+_DESERIALIZERS: Dict[str, Callable[[Any], Any]] = {}
+# Attributes of models mapped to keys used by master and to types of attributes, compiled on first use.
+_MODEL_ATTRIBUTES: Dict[str, Optional[Dict[str, Tuple[str, str]]]] = {}
+# Values which cannot be changed in place, such values of lazy models are serialized again only if assigned.
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, datetime.date)
+_PRIMITIVE_TYPES: Dict[str, Callable[[Any], Any]] = {
+    "int": int,
+    "long": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+}
+
+
+def _model_attributes(type_name: str) -> Optional[Dict[str, Tuple[str, str]]]:
+    """Get attributes of the given model, None if the type is not a model with attributes."""
+    try:
+        return _MODEL_ATTRIBUTES[type_name]
+    except KeyError:
+        pass
+
+    attributes = None
+    if (
+        not type_name.startswith(("list[", "dict("))
+        and type_name not in ("object", "date", "datetime")
+        and type_name not in _PRIMITIVE_TYPES
+    ):
+        klass = getattr(models, type_name)
+        attributes = {
+            attr: (klass.attribute_map[attr], attr_type)
+            for attr, attr_type in klass.openapi_types.items()
+        } or None
+
+    _MODEL_ATTRIBUTES[type_name] = attributes
+    return attributes
+
+
+def _deserialize(data: Any, type_name: str) -> Any:
+    """Deserialize data as sent by master into the given type, the same way as ApiClient.deserialize does.
+
+    Data are deserialized directly, without serializing them to JSON first and without creating an ApiClient.
+    """
+    if data is None:
+        return None
+
+    deserializer = _DESERIALIZERS.get(type_name)
+    if deserializer is None:
+        deserializer = _DESERIALIZERS[type_name] = _compile_deserializer(type_name)
+
+    return deserializer(data)
+
+
+def _compile_deserializer(type_name: str) -> Callable[[Any], Any]:
+    """Compile deserializer of the given type, attribute maps of models are inverted once."""
+    if type_name.startswith("list["):
+        item_type = type_name[5:-1]
+        return lambda data: [_deserialize(item, item_type) for item in data]
+
+    if type_name.startswith("dict("):
+        value_type = type_name[5:-1].split(", ", 1)[1]
+        return lambda data: {
+            key: _deserialize(value, value_type) for key, value in data.items()
+        }
+
+    if type_name == "object":
+        return lambda data: data
+
+    if type_name in ("date", "datetime"):
+        from dateutil.parser import parse
+
+        if type_name == "date":
+            return lambda data: parse(data).date()
+
+        return lambda data: parse(data)
+
+    primitive = _PRIMITIVE_TYPES.get(type_name)
+    if primitive is not None:
+
+        def deserialize_primitive(data: Any) -> Any:
+            try:
+                return primitive(data)
+            except TypeError:
+                return data
+
+        return deserialize_primitive
+
+    attributes = _model_attributes(type_name)
+    if attributes is None:
+        return lambda data: data
+
+    klass = getattr(models, type_name)
+
+    def deserialize_model(data: Any) -> Any:
+        kwargs = {}
+        if isinstance(data, dict):
+            kwargs = {
+                attr: _deserialize(data[key], attr_type)
+                for attr, (key, attr_type) in attributes.items()
+                if key in data
+            }
+
+        # Values are validated by models when set.
+        return klass(local_vars_configuration=_MODEL_CONFIGURATION, **kwargs)
+
+    return deserialize_model
+
+
+def _lazy(data: Any, type_name: str) -> Any:
+    """Wrap data as sent by master into lazy models, values which are not models are deserialized."""
+    if data is None:
+        return None
+
+    if type_name.startswith("list["):
+        item_type = type_name[5:-1]
+        if _model_attributes(item_type) is not None:
+            return [_lazy(item, item_type) for item in data]
+    elif type_name.startswith("dict("):
+        value_type = type_name[5:-1].split(", ", 1)[1]
+        if _model_attributes(value_type) is not None:
+            return {key: _lazy(value, value_type) for key, value in data.items()}
+    elif _model_attributes(type_name) is not None and isinstance(data, dict):
+        return LazyModel(data, type_name)
+
+    return _deserialize(data, type_name)
+
+
+def _serialize(obj: Any) -> Any:
+    """Serialize the given object to be sent to master, the same way as ApiClient.sanitize_for_serialization does.
+
+    Lazy models are serialized without creating models which were not accessed.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool, bytes)):
+        return obj
+
+    if isinstance(obj, LazyModel):
+        return obj.to_body()
+
+    if isinstance(obj, list):
+        return [_serialize(item) for item in obj]
+
+    if isinstance(obj, tuple):
+        return tuple(_serialize(item) for item in obj)
+
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+
+    if not isinstance(obj, dict):
+        obj = {
+            obj.attribute_map[attr]: getattr(obj, attr)
+            for attr in obj.openapi_types
+            if getattr(obj, attr) is not None
+        }
+
+    return {key: _serialize(value) for key, value in obj.items()}
+
+
+class LazyModel:
+    """An Argo model backed by a dict as sent to master, nested models are created only when accessed.
+
+    Parts of the dict which were not accessed or only read are sent to master unchanged.
+    """
+
+    _obj: Dict[str, Any]
+    _type_name: str
+    _model_attributes: Dict[str, Tuple[str, str]]
+    _values: Dict[str, Any]
+    _assigned: Set[str]
+
+    def __init__(self, obj: Dict[str, Any], type_name: str) -> None:
+        """Wrap the given dict, type name states the model (as in models.openapi_types), e.g. V1alpha1Workflow."""
+        attributes = _model_attributes(type_name)
+        if attributes is None:
+            raise ValueError(f"Type {type_name!r} is not a model with attributes")
+
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_type_name", type_name)
+        object.__setattr__(self, "_model_attributes", attributes)
+        object.__setattr__(self, "_values", {})
+        object.__setattr__(self, "_assigned", set())
+
+    def __getattr__(self, attr: str) -> Any:
+        """Get value of a model attribute, nested models are wrapped on first access."""
+        values = self.__dict__["_values"]
+        if attr in values:
+            return values[attr]
+
+        try:
+            key, attr_type = self.__dict__["_model_attributes"][attr]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__dict__['_type_name']} has no attribute {attr!r}"
+            ) from None
+
+        value = values[attr] = _lazy(self.__dict__["_obj"].get(key), attr_type)
+        return value
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        """Set value of a model attribute."""
+        if attr not in self._model_attributes:
+            raise AttributeError(f"{self._type_name} has no attribute {attr!r}")
+
+        self._values[attr] = value
+        self._assigned.add(attr)
+
+    def to_body(self) -> Dict[str, Any]:
+        """Serialize the model to be sent to master, values not accessed are shared with the wrapped dict."""
+        body = dict(self._obj)
+        for attr, value in self._values.items():
+            if attr not in self._assigned and isinstance(value, _IMMUTABLE_TYPES):
+                # Serializing values read again could change their format, e.g. of datetimes.
+                continue
+
+            key = self._model_attributes[attr][0]
+            value = _serialize(value)
+            if value is None:
+                body.pop(key, None)
+            else:
+                body[key] = value
+
+        return body
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict as done by models, nested models are created."""
+        result: Dict[str, Any] = _deserialize(self.to_body(), self._type_name).to_dict()
+        return result
+
+
+def _compile_fields(fields: str) -> Dict[str, Any]:
+    """Compile comma separated paths to fields into a tree, None marks fields which are kept as a whole.
+
+    Paths use names as sent by master, lists are traversed item by item and `*` matches any key of a mapping.
+    """
+    tree: Dict[str, Any] = {}
+    for field in fields.split(","):
+        parts = field.strip().split(".")
+        if not parts[0]:
+            continue
+
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+
+    return tree
+
+
+def _project_fields(obj: Any, tree: Dict[str, Any]) -> Any:
+    """Keep only fields of the given object which are stated in the compiled tree of fields."""
+    if isinstance(obj, list):
+        return [_project_fields(item, tree) for item in obj]
+
+    if not isinstance(obj, dict):
+        return obj
+
+    if "*" in tree:
+        subtree = tree["*"]
+        return {
+            key: value if subtree is None else _project_fields(value, subtree)
+            for key, value in obj.items()
+        }
+
+    return {
+        key: obj[key] if subtree is None else _project_fields(obj[key], subtree)
+        for key, subtree in tree.items()
+        if key in obj
+    }
+
 
 class Workflow(models.V1alpha1Workflow):  # type: ignore
     """Argo Workflow instance.
@@ -102,6 +381,8 @@ class Workflow(models.V1alpha1Workflow):  # type: ignore
     @classmethod
     def from_file(cls, fp: Union[str, Path], validate: bool = True) -> "Workflow":
         """Create a Workflow from a file."""
+        import yaml
+
         wf_path = Path(fp)
 
         wf: Dict[str, Any] = yaml.safe_load(wf_path.read_text())
@@ -110,6 +391,9 @@ class Workflow(models.V1alpha1Workflow):  # type: ignore
     @classmethod
     def from_url(cls, url: str, validate: bool = True) -> "Workflow":
         """Create a Workflow from a remote file."""
+        import requests
+        import yaml
+
         resp = requests.get(
             "https://raw.githubusercontent.com/argoproj/argo/master/examples/hello-world.yaml"
         )
@@ -124,28 +408,25 @@ class Workflow(models.V1alpha1Workflow):  # type: ignore
         # work around validation issues and allow empty status
         wf["status"] = wf.get("status", {}) or {}
 
-        return cls.from_string(json.dumps(wf), validate=validate)
+        return cls.__deserialize(wf, validate=validate)
 
     @classmethod
     def from_string(cls, wf: str, validate: bool = True) -> "Workflow":
-        """Create a Workflow from a YAML string."""
-        body = {"data": wf}
-
-        return cls.__deserialize(body, validate=validate)
+        """Create a Workflow from a JSON string."""
+        return cls.from_dict(json.loads(wf), validate=validate)
 
     @classmethod
-    def __deserialize(cls, body: Dict[str, str], *, validate: bool) -> "Workflow":
+    def __deserialize(cls, obj: Dict[str, Any], *, validate: bool) -> "Workflow":
         """Deserialize given object into a Workflow instance."""
         wf: models.V1alpha1Workflow
         if validate:
-            attr = type("AttributeDict", (), body)
-
-            wf = client.ApiClient().deserialize(attr, models.V1alpha1Workflow)
+            wf = _deserialize(obj, "V1alpha1Workflow")
         else:
+            from attrdict import AttrDict
+
             _LOGGER.warning(
                 "Validation is turned off. This may result in missing or invalid attributes."
             )
-            obj = json.loads(body["data"])
             aux = to_snake_case(obj)
 
             wf = AttrDict(**aux)
@@ -163,19 +444,97 @@ class Workflow(models.V1alpha1Workflow):  # type: ignore
         return instance
 
 
+class LazyWorkflow(LazyModel):
+    """Argo Workflow backed by a dict as obtained from a template, see LazyModel.
+
+    Parts of the Workflow are not validated unless accessed, submitting a Workflow which was not modified
+    is close to the cost of sending the dict.
+    """
+
+    def __init__(self, obj: Dict[str, Any]) -> None:
+        """Wrap the given Workflow dict using names of fields as sent to master."""
+        super().__init__(obj, "V1alpha1Workflow")
+
+    @property
+    def name(self) -> Union[str, None]:
+        """Get Workflow name."""
+        name: Union[str, None] = getattr(self.metadata, "name", None)
+        return name
+
+    @property
+    def id(self) -> str:
+        """Get Workflow ID."""
+        prefix: str = self.name or getattr(self.metadata, "generate_name")
+        digest: str = OpenShift.generate_id(prefix)
+        return digest
+
+    @property
+    def validated(self) -> bool:
+        """Return whether this workflow has been validated, only parts accessed are validated."""
+        return False
+
+
 class WorkflowManager:
     """Argo Workflow manager."""
 
+    # Fields of Workflows needed to report information about them, including fields required by models.
+    WORKFLOW_INFO_FIELDS = ",".join(
+        (
+            "apiVersion",
+            "kind",
+            "metadata.name",
+            "metadata.namespace",
+            "metadata.uid",
+            "metadata.resourceVersion",
+            "metadata.creationTimestamp",
+            "metadata.labels",
+            "spec.templates.name",
+            "spec.templates.dag.tasks.name",
+            "status.phase",
+            "status.startedAt",
+            "status.finishedAt",
+            "status.nodes.*.id",
+            "status.nodes.*.name",
+            "status.nodes.*.displayName",
+            "status.nodes.*.type",
+            "status.nodes.*.phase",
+            "status.nodes.*.message",
+            "status.nodes.*.startedAt",
+            "status.nodes.*.finishedAt",
+        )
+    )
+    # Description of the "Age" printer column defined by Argo for .status.startedAt of Workflows.
+    _STARTED_AT_COLUMN_DESCRIPTION = "When the workflow was started"
+
     def __init__(
         self,
         openshift: Optional[OpenShift] = None,
         openshift_config: Optional[Mapping[str, str]] = None,
+        *,
+        admission_policy: Optional[str] = None,
+        admission_timeout: Optional[float] = None,
     ):
-        """Initialize WorkflowManager instance."""
+        """Initialize WorkflowManager instance.
+
+        Admission policy (block, queue or reject) and timeout apply to Workflows submitted with `workflow_limit`.
+        """
         ocp_config = openshift_config or {}
 
         self.openshift = openshift or OpenShift(**ocp_config)
         self.api = client.V1alpha1Api(client.ApiClient(self.openshift.configuration))
+        if admission_policy is None:
+            admission_policy = os.getenv("THOTH_WORKFLOW_ADMISSION_POLICY") or "block"
+
+        self.admission = AdmissionController(
+            self.get_active_workflows,
+            policy=admission_policy,
+            timeout=admission_timeout
+            if admission_timeout is not None
+            else float(os.getenv("THOTH_WORKFLOW_ADMISSION_TIMEOUT", 300)),
+            refresh_interval=float(
+                os.getenv("THOTH_WORKFLOW_ADMISSION_REFRESH_INTERVAL", 5)
+            ),
+        )
 
     def get_workflow_template(
         self,
@@ -190,29 +549,152 @@ class WorkflowManager:
         if parameters:
             self.openshift.set_template_parameters(template, **parameters)
 
-        template = self.openshift.oc_process(namespace, template)
+        template = self.openshift.process_template(namespace, template)
         return template
 
     def get_workflow(self, namespace: str, name: str) -> Dict[str, Any]:
-        """Get Workflow in namespace by name."""
+        """Get Workflow in namespace by name, Workflows which finished are served from cache if enabled."""
+        try:
+            cached = self.openshift.get_cached_workflow("model", namespace, name)
+        except NotFoundException:
+            # Let the client report the Workflow deleted.
+            cached = None
+
+        if cached is not None:
+            return cached
+
         response: Dict[str, Any] = self.api.get_namespaced_workflow(
             namespace=namespace, name=name
         ).to_dict()
+        if self.openshift.workflow_cache is not None:
+            self.openshift.workflow_cache.put("model", namespace, response)
+
         return response
 
     def get_workflows(
-        self, namespace: str, *, label_selector: Optional[str] = None
+        self,
+        namespace: str,
+        *,
+        label_selector: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get Workflows in namespace."""
-        parameters = locals()
-        parameters.pop("self")
-        if not label_selector:
-            parameters.pop("label_selector")
-        response: Dict[str, Any] = self.api.list_namespaced_workflows(
-            **parameters
-        ).to_dict()
+        """Get Workflows in namespace.
+
+        If `fields` are provided (comma separated paths, such as `metadata.name,status.nodes.*.phase`), only the
+        given fields of Workflows are deserialized, other fields are reported as None. Master cannot project fields
+        of custom resources, whole Workflows are still transferred - fields save only time spent on deserialization.
+        """
+        pages = self._iter_workflow_pages(
+            namespace, label_selector=label_selector, fields=fields
+        )
+        # The first page is always listed, items of other pages are merged into it.
+        response: Dict[str, Any] = next(pages).to_dict()
+        response["metadata"]["_continue"] = None
+        response["items"] = response.get("items") or []
+        for page in pages:
+            response["items"].extend(item.to_dict() for item in page.items or [])
+
         return response
 
+    def iter_workflows(
+        self,
+        namespace: str,
+        *,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over Workflows in namespace, Workflows are listed in pages of `limit` objects.
+
+        See OpenShift._iter_list for semantics of resource_version and resource_version_match, see `get_workflows`
+        for semantics of fields.
+        """
+        for page in self._iter_workflow_pages(
+            namespace,
+            label_selector=label_selector,
+            limit=limit,
+            resource_version=resource_version,
+            resource_version_match=resource_version_match,
+            fields=fields,
+        ):
+            for item in page.items or []:
+                workflow: Dict[str, Any] = item.to_dict()
+                if self.openshift.workflow_cache is not None:
+                    self.openshift.workflow_cache.observe(namespace, workflow)
+                yield workflow
+
+    def _iter_workflow_pages(
+        self,
+        namespace: str,
+        *,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        resource_version: Optional[str] = None,
+        resource_version_match: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Iterator[models.V1alpha1WorkflowList]:
+        """List Workflows in namespace page by page using limit and continue.
+
+        Master does not project fields of custom resources, if `fields` are given, Workflows are projected before
+        they are deserialized into models as deserialization of whole Workflows dominates the time spent.
+        """
+        fields_tree = _compile_fields(fields) if fields else None
+        # The generated client does not expose limit and continue parameters, call the endpoint directly.
+        query_params: List[Tuple[str, Any]] = [
+            ("limit", limit if limit is not None else self.openshift.list_page_size)
+        ]
+        if label_selector:
+            query_params.append(("labelSelector", label_selector))
+        if resource_version is not None:
+            query_params.append(("resourceVersion", resource_version))
+        if resource_version_match is not None:
+            query_params.append(("resourceVersionMatch", resource_version_match))
+
+        continue_token: Optional[str] = None
+        while True:
+            params = list(query_params)
+            if continue_token:
+                # Resource version cannot be stated when continuing listing, the continue token carries it.
+                params = [
+                    param
+                    for param in params
+                    if param[0] not in ("resourceVersion", "resourceVersionMatch")
+                ]
+                params.append(("continue", continue_token))
+
+            response = self.api.api_client.call_api(
+                "/apis/argoproj.io/v1alpha1/namespaces/{namespace}/workflows",
+                "GET",
+                path_params={"namespace": namespace},
+                query_params=params,
+                header_params={"Accept": "application/json"},
+                response_type="V1alpha1WorkflowList",
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=fields_tree is None,
+            )
+            if fields_tree is None:
+                page: models.V1alpha1WorkflowList = response
+            else:
+                try:
+                    data = json.loads(response.data)
+                finally:
+                    # Responses not preloaded are not returned to the connection pool on their own.
+                    response.release_conn()
+                data["items"] = [
+                    _project_fields(item, fields_tree)
+                    for item in data.get("items") or []
+                ]
+                page = _deserialize(data, "V1alpha1WorkflowList")
+
+            yield page
+
+            continue_token = page.metadata._continue if page.metadata else None
+            if not continue_token:
+                break
+
     def get_workflow_info(self, namespace: str, name: str) -> Dict[str, Any]:
         """Get Workflow in namespace by name."""
         workflow = self.get_workflow(namespace=namespace, name=name)
@@ -220,14 +702,17 @@ class WorkflowManager:
         return {workflow_main["name"]: workflow_main}
 
     def get_workflows_info(
-        self, namespace: str, *, label_selector: Optional[str] = None
+        self,
+        namespace: str,
+        *,
+        label_selector: Optional[str] = None,
+        fields: Optional[str] = WORKFLOW_INFO_FIELDS,
     ) -> Dict[str, Any]:
-        """Get workflows info from a specific namespace."""
-        workflows = self.get_workflows(
-            namespace=namespace, label_selector=label_selector
-        )
+        """Get workflows info from a specific namespace, only fields needed are deserialized by default."""
         workflow_data = {}
-        for workflow in workflows["items"]:
+        for workflow in self.iter_workflows(
+            namespace=namespace, label_selector=label_selector, fields=fields
+        ):
 
             workflow_main = self._collect_workflow_info(workflow=workflow)
 
@@ -312,11 +797,15 @@ class WorkflowManager:
         return self._analyze_workflows_info(workflow_info)
 
     def get_workflows_and_tasks_status(
-        self, namespace: str, label_selector: Optional[str] = None
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        *,
+        fields: Optional[str] = WORKFLOW_INFO_FIELDS,
     ) -> Dict[str, Any]:
         """Get workflows and tasks status from a specific namespace."""
         workflows_info = self.get_workflows_info(
-            namespace=namespace, label_selector=label_selector
+            namespace=namespace, label_selector=label_selector, fields=fields
         )
         return self._analyze_workflows_info(workflows_info)
 
@@ -408,28 +897,38 @@ class WorkflowManager:
     def submit_workflow(
         self,
         namespace: str,
-        wf: Union[models.V1alpha1Workflow, Dict[str, Any]],
+        wf: Union[models.V1alpha1Workflow, LazyWorkflow, Dict[str, Any]],
         *,
         parameters: Optional[Dict[str, str]] = None,
         validate: bool = True,
+        labels: Optional[Dict[str, str]] = None,
+        raw: bool = False,
     ) -> Union[str, None]:
         """Submit an Argo Workflow to a given namespace.
 
+        If `raw` is set, a dict given is expected to use names of fields as sent to master (e.g. a Workflow
+        obtained from a processed template). Parameters and labels are merged into the dict and it is sent
+        without creating models or converting names of fields, see LazyWorkflow.
+
         :returns: Workflow ID
         """
         parameters = parameters or {}
 
-        if not isinstance(wf, Workflow) and isinstance(wf, dict):
+        if isinstance(wf, dict) and raw:
+            wf = LazyWorkflow(wf)
+        elif not isinstance(wf, Workflow) and isinstance(wf, dict):
             wf = Workflow.from_dict(wf, validate=validate)
-        elif not isinstance(wf, models.V1alpha1Workflow):
+        elif not isinstance(wf, (models.V1alpha1Workflow, LazyWorkflow)):
             raise TypeError(
-                f"Expected {Union[models.V1alpha1Workflow, dict]}, got {type(wf)}"
+                f"Expected {Union[models.V1alpha1Workflow, LazyWorkflow, dict]}, got {type(wf)}"
             )
 
-        new_parameters: List[models.V1alpha1Parameter] = []
+        new_parameters: List[Any] = []
         for name, value in parameters.items():
-            param = models.V1alpha1Parameter(name=name, value=value)
-            new_parameters.append(param)
+            if isinstance(wf, LazyWorkflow):
+                new_parameters.append({"name": name, "value": value})
+            else:
+                new_parameters.append(models.V1alpha1Parameter(name=name, value=value))
 
         if hasattr(wf.spec, "arguments"):
             for p in getattr(wf.spec.arguments, "parameters", []):
@@ -442,7 +941,12 @@ class WorkflowManager:
 
             wf.spec.arguments.parameters = new_parameters
 
-        if not getattr(wf, "validated", True):
+        if labels:
+            wf.metadata.labels = {**(wf.metadata.labels or {}), **labels}
+
+        if isinstance(wf, LazyWorkflow):
+            body = wf.to_body()
+        elif not getattr(wf, "validated", True):
             _LOGGER.debug(
                 "The Workflow has not been previously validated."
                 "Sanitizing for serialization."
@@ -453,21 +957,64 @@ class WorkflowManager:
 
         _LOGGER.debug(f"Submitting workflow: {body}")
 
-        # submit the workflow
-        created: models.V1alpha1Workflow = self.api.create_namespaced_workflow(  # noqa
-            namespace, body
+        # submit the workflow, the Workflow created is not deserialized as it is not used
+        response = self.api.create_namespaced_workflow(
+            namespace, body, _preload_content=False
         )
+        try:
+            # Read the rest of the response for the connection to be reused.
+            response.drain_conn()
+        finally:
+            response.release_conn()
 
         return wf.name
 
     def get_pending_workflows(self, workflow_namespace: str) -> int:
         """Get the total number of pending workflows in a given namespace."""
+        # Argo defines "Age" column for the time a Workflow was started, the column is empty if not started yet.
+        # CRDs without printer columns provide "Age" column for creation time instead, Workflows are listed then.
+        rows = self.openshift.iter_table(
+            f"/apis/argoproj.io/v1alpha1/namespaces/{workflow_namespace}/workflows",
+            columns=("Status", "Age"),
+            column_descriptions={"Age": self._STARTED_AT_COLUMN_DESCRIPTION},
+        )
+        if rows is not None:
+            return sum(row["Age"] is None for row in rows)
+
         count = 0
-        for i in self.api.list_namespaced_workflows(workflow_namespace).items:
-            count += i.status.started_at is None
+        for workflow in self.openshift.iter_workflows(namespace=workflow_namespace):
+            count += not (workflow.get("status") or {}).get("startedAt")
 
         return count
 
+    @staticmethod
+    def _workflow_phase(workflow: Dict[str, Any]) -> List[str]:
+        """Get phase of the given Workflow, Workflows not picked by workflow controller yet are pending."""
+        return [(workflow.get("status") or {}).get("phase") or "Pending"]
+
+    def get_active_workflows(self, workflow_namespace: str) -> int:
+        """Get the total number of pending and running workflows in a given namespace."""
+        informer = self.openshift.get_workflow_informer(workflow_namespace)
+        if informer is not None:
+            informer.add_counter("phase", self._workflow_phase)
+            counts = informer.get_counter("phase")
+            return counts.get("Pending", 0) + counts.get("Running", 0)
+
+        # Argo defines "Status" column for the Workflow phase, the column is empty if not picked by the controller.
+        rows = self.openshift.iter_table(
+            f"/apis/argoproj.io/v1alpha1/namespaces/{workflow_namespace}/workflows",
+            columns=("Status",),
+        )
+        if rows is None:
+            rows = (
+                {"Status": self._workflow_phase(workflow)[0]}
+                for workflow in self.openshift.iter_workflows(
+                    namespace=workflow_namespace
+                )
+            )
+
+        return sum(row["Status"] in (None, "Pending", "Running") for row in rows)
+
     def submit_workflow_from_template(
         self,
         namespace: str,
@@ -477,6 +1024,7 @@ class WorkflowManager:
         workflow_parameters: Optional[Dict[str, Any]] = None,
         workflow_namespace: Optional[str] = None,
         workflow_limit: Optional[int] = None,
+        workflow_labels: Optional[Dict[str, str]] = None,
     ) -> Union[str, None]:
         """Retrieve and Submit Workflow from an OpenShift template.
 
@@ -490,20 +1038,84 @@ class WorkflowManager:
         :param workflow_parameters: parameters for the workflow
         :param workflow_namespace: namespace to submit the workflow to
         :param workflow_limit: limit number of workflows currently in memory for workflowController
+        :param workflow_labels: additional labels set on the workflow
+        :raises WorkflowLimitExceeded: if the workflow was not admitted based on `workflow_limit`
         """
         template = self.get_workflow_template(
             namespace, label_selector, parameters=template_parameters
         )
 
         workflow_object: Dict[str, Any] = template["objects"][0]
-        workflow: Workflow = Workflow.from_dict(workflow_object, validate=True)
 
-        workflow_id = self.submit_workflow(
-            workflow_namespace or namespace, workflow, parameters=workflow_parameters
-        )
+        with self.admission.admitted(workflow_namespace or namespace, workflow_limit):
+            workflow_id = self.submit_workflow(
+                workflow_namespace or namespace,
+                workflow_object,
+                parameters=workflow_parameters,
+                labels=workflow_labels,
+                raw=True,
+            )
 
         return workflow_id
 
+    def submit_workflows_from_template(
+        self,
+        namespace: str,
+        label_selector: str,
+        *,
+        template_parameters: List[Dict[str, Any]],
+        workflow_parameters: Optional[Dict[str, Any]] = None,
+        workflow_namespace: Optional[str] = None,
+        workflow_limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Union[str, None, Exception]]:
+        """Retrieve an OpenShift template once and submit a Workflow for each set of template parameters.
+
+        Workflows are submitted concurrently, at most `max_workers` at a time (defaults to the HTTP
+        connection pool size). A failure to submit one Workflow does not affect the others.
+
+        :param namespace: namespace to lookup the template in
+        :param label_selector: selector for the template, i.e. 'template=workflow-template'
+        :param template_parameters: parameters for the template, one set for each Workflow submitted
+        :param workflow_parameters: parameters for the workflows
+        :param workflow_namespace: namespace to submit the workflows to
+        :param workflow_limit: limit number of workflows currently in memory for workflowController
+        :param max_workers: maximum number of Workflows submitted concurrently
+        :returns: Workflow IDs or exceptions raised, in the order of template parameters given
+        """
+        if not template_parameters:
+            return []
+
+        template = self.openshift._get_template(label_selector, namespace=namespace)
+
+        def submit(parameters: Dict[str, Any]) -> Union[str, None, Exception]:
+            try:
+                item = copy.deepcopy(template)
+                self.openshift.set_template_parameters(item, **parameters)
+                processed = self.openshift.process_template(namespace, item)
+                with self.admission.admitted(
+                    workflow_namespace or namespace, workflow_limit
+                ):
+                    return self.submit_workflow(
+                        workflow_namespace or namespace,
+                        processed["objects"][0],
+                        parameters=workflow_parameters,
+                        raw=True,
+                    )
+            except Exception as exc:
+                _LOGGER.exception(
+                    "Failed to submit Workflow from template %r with parameters %r",
+                    label_selector,
+                    parameters,
+                )
+                return exc
+
+        max_workers = min(
+            max_workers or self.openshift.http_pool_maxsize, len(template_parameters)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(submit, template_parameters))
+
     def submit_inspection(
         self,
         template_parameters: Optional[Dict[str, str]] = None,
@@ -715,6 +1327,8 @@ class WorkflowManager:
         self,
         template_parameters: Optional[Dict[str, str]] = None,
         workflow_parameters: Optional[Dict[str, Any]] = None,
+        workflow_labels: Optional[Dict[str, str]] = None,
+        workflow_limit: Optional[int] = None,
     ) -> Optional[str]:
         """Submit Solver Workflow."""
         if not self.openshift.infra_namespace:
@@ -732,10 +1346,36 @@ class WorkflowManager:
             template_parameters=template_parameters,
             workflow_parameters=workflow_parameters,
             workflow_namespace=self.openshift.middletier_namespace,
+            workflow_limit=workflow_limit,
+            workflow_labels=workflow_labels,
         )
 
         return workflow_id
 
+    def submit_solvers(
+        self,
+        template_parameters: List[Dict[str, Any]],
+        workflow_parameters: Optional[Dict[str, Any]] = None,
+        workflow_limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Union[str, None, Exception]]:
+        """Submit Solver Workflows concurrently, one for each set of template parameters."""
+        if not self.openshift.infra_namespace:
+            raise ConfigurationError("Infra namespace was not provided.")
+
+        if not self.openshift.middletier_namespace:
+            raise ConfigurationError("Middletier namespace was not provided.")
+
+        return self.submit_workflows_from_template(
+            self.openshift.infra_namespace,
+            label_selector="template=solver",
+            template_parameters=template_parameters,
+            workflow_parameters=workflow_parameters or {},
+            workflow_namespace=self.openshift.middletier_namespace,
+            workflow_limit=workflow_limit,
+            max_workers=max_workers,
+        )
+
     def submit_revsolver(
         self,
         template_parameters: Optional[Dict[str, str]] = None,
@@ -787,6 +1427,7 @@ class WorkflowManager:
         self,
         template_parameters: Optional[Dict[str, str]] = None,
         workflow_parameters: Optional[Dict[str, Any]] = None,
+        workflow_labels: Optional[Dict[str, str]] = None,
     ) -> Optional[str]:
         """Submit Security Indicator Workflow."""
         if not self.openshift.infra_namespace:
@@ -804,6 +1445,7 @@ class WorkflowManager:
             template_parameters=template_parameters,
             workflow_parameters=workflow_parameters,
             workflow_namespace=self.openshift.middletier_namespace,
+            workflow_labels=workflow_labels,
         )
 
         return workflow_id
@@ -862,6 +1504,7 @@ class WorkflowManager:
         self,
         template_parameters: Optional[Dict[str, str]] = None,
         workflow_parameters: Optional[Dict[str, Any]] = None,
+        workflow_labels: Optional[Dict[str, str]] = None,
     ) -> Optional[str]:
         """Submit graph-sync workflow."""
         if not self.openshift.infra_namespace:
@@ -879,6 +1522,7 @@ class WorkflowManager:
             template_parameters=template_parameters,
             workflow_parameters=workflow_parameters,
             workflow_namespace=self.openshift.middletier_namespace,
+            workflow_labels=workflow_labels,
         )
 
         return workflow_id